@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ArticlesConfig(AppConfig):
     name = 'authors.apps.articles'
+
+    def ready(self):
+        import authors.apps.articles.signals
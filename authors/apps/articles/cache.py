@@ -0,0 +1,89 @@
+"""
+Versioned cache of the article detail payload.
+
+Only the part of the payload that is the same for every reader is cached,
+under the article id and a content version. A write to the article, its
+votes, ratings or favorites gives the article a new version, so payloads
+of older versions are never read again and simply expire.
+"""
+import hashlib
+import json
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import quote_etag
+
+# Bounds how long a payload can outlive a write that skipped the signals
+# e.g a bulk `update()`
+ARTICLE_CACHE_TIMEOUT = 60 * 60
+
+
+def version_key(article_id):
+    return 'articles:{}:version'.format(article_id)
+
+
+def payload_key(article_id, version):
+    return 'articles:{}:payload:{}'.format(article_id, version)
+
+
+def article_version(article_id):
+    """Return the content version of an article, starting one if it has none"""
+    version = cache.get(version_key(article_id))
+    if version is None:
+        # `add` keeps the version of a concurrent request that got there first
+        cache.add(version_key(article_id), uuid.uuid4().hex, None)
+        version = cache.get(version_key(article_id))
+    return version
+
+
+def article_versions(article_ids):
+    """Return {article id: content version} of several articles in one round trip"""
+    keys = {version_key(article_id): article_id for article_id in article_ids}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+    for article_id in article_ids:
+        if article_id not in versions:
+            versions[article_id] = article_version(article_id)
+    return versions
+
+
+def new_versions(article_ids):
+    cache.set_many({version_key(article_id): uuid.uuid4().hex for article_id in article_ids}, None)
+
+
+def invalidate_article(*article_ids):
+    """Give the articles new content versions"""
+    new_versions(article_ids)
+    # and again on commit, a reader may have cached the rows being replaced
+    transaction.on_commit(lambda: new_versions(article_ids))
+
+
+def get_payload(article_id, version):
+    return cache.get(payload_key(article_id, version))
+
+
+def set_payload(article_id, version, payload):
+    cache.set(payload_key(article_id, version), payload, ARTICLE_CACHE_TIMEOUT)
+
+
+def get_payloads(versions):
+    """Return {article id: payload} of the cached articles of {article id: version}"""
+    keys = {payload_key(article_id, version): article_id for article_id, version in versions.items()}
+    return {keys[key]: payload for key, payload in cache.get_many(keys).items()}
+
+
+def set_payloads(versions, payloads):
+    cache.set_many({
+        payload_key(article_id, versions[article_id]): payload
+        for article_id, payload in payloads.items()
+    }, ARTICLE_CACHE_TIMEOUT)
+
+
+def article_etag(version, viewer_payload):
+    """
+    Strong ETag of an article response, the content version identifies
+    the shared part and the reader's own fields are hashed in
+    """
+    viewer = json.dumps(viewer_payload, sort_keys=True, default=str)
+    digest = hashlib.md5('{}:{}'.format(version, viewer).encode('utf-8')).hexdigest()
+    return quote_etag(digest)
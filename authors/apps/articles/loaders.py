@@ -0,0 +1,123 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from rest_framework import serializers
+
+from authors.apps.articles.models import (Articles,
+                                          Favorite,
+                                          LikeDislike,
+                                          Ratings, )
+
+
+def object_id(instance):
+    """
+    Primary key of a model instance, None for unsaved data
+    e.g the validated data of a serializer that has not been saved
+    """
+    return getattr(instance, 'pk', None)
+
+
+class ViewerState:
+    """
+    Holds what the current reader has done to a page of objects
+    i.e their votes, ratings, favorites and bookmarks, keyed by object id.
+
+    Each relation is loaded with a single query for the whole page,
+    so serializing N objects costs the same number of queries for any N.
+    """
+
+    def __init__(self, object_ids, votes=None, ratings=None,
+                 favorites=None, bookmarks=None):
+        self.object_ids = set(object_ids)
+        self.votes = votes or {}
+        self.ratings = ratings or {}
+        self.favorites = favorites or set()
+        self.bookmarks = bookmarks or set()
+
+    def covers(self, instance):
+        return object_id(instance) in self.object_ids
+
+    def vote(self, instance):
+        return self.votes.get(object_id(instance))
+
+    def rating(self, instance):
+        return self.ratings.get(object_id(instance))
+
+    def has_favorited(self, instance):
+        return object_id(instance) in self.favorites
+
+    def has_bookmarked(self, instance):
+        return object_id(instance) in self.bookmarks
+
+    @staticmethod
+    def load_votes(user, model, object_ids):
+        """Return {object_id: vote} for the user's votes on the given objects"""
+        content_type = ContentType.objects.get_for_model(model)
+        return dict(LikeDislike.objects.filter(
+            content_type=content_type,
+            user=user,
+            object_id__in=object_ids
+        ).values_list('object_id', 'vote'))
+
+    @classmethod
+    def load(cls, user, objects):
+        """Build the viewer state of `user` for a list of objects"""
+        raise NotImplementedError
+
+
+class ArticleViewerState(ViewerState):
+    """Viewer state for a page of articles"""
+
+    @classmethod
+    def load(cls, user, objects):
+        from authors.apps.bookmarks.models import Bookmark
+
+        article_ids = [object_id(article) for article in objects if object_id(article)]
+        if not article_ids or user is None or not user.is_authenticated:
+            return cls(article_ids)
+
+        ratings = Ratings.objects.filter(author=user, article_id__in=article_ids)
+        favorites = Favorite.objects.filter(
+            user_id=user, article_id__in=article_ids).values_list('article_id', flat=True)
+        bookmarks = Bookmark.objects.filter(
+            profile__user=user, article_id__in=article_ids).values_list('article_id', flat=True)
+
+        return cls(
+            article_ids,
+            votes=cls.load_votes(user, Articles, article_ids),
+            ratings={rating.article_id: rating for rating in ratings},
+            favorites=set(favorites),
+            bookmarks=set(bookmarks),
+        )
+
+
+class ViewerStateListSerializer(serializers.ListSerializer):
+    """
+    List serializer that loads the viewer state for the whole page up front
+    and hands it to the child serializer through the `viewer_state` context key.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        items = list(iterable)
+        self.context['viewer_state'] = self.child.load_viewer_state(items)
+        return super().to_representation(items)
+
+
+class ViewerStateMixin:
+    """
+    Serializer mixin that exposes `self.viewer_state` to the `get_has_*`
+    methods. A lone object gets its own state loaded on the fly.
+    """
+    viewer_state_class = ViewerState
+
+    def load_viewer_state(self, objects):
+        request = self.context.get('request')
+        user = request.user if request else None
+        return self.viewer_state_class.load(user, objects)
+
+    def to_representation(self, instance):
+        viewer_state = self.context.get('viewer_state')
+        if viewer_state is None or not viewer_state.covers(instance):
+            viewer_state = self.load_viewer_state([instance])
+        self.viewer_state = viewer_state
+        return super().to_representation(instance)
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class ReconcileCommand(BaseCommand):
+    """
+    Base of the commands that recount denormalized counters from the
+    table they summarize, report the rows that drifted and fix them
+    unless `--check` is given.
+
+    Subclasses set `model`, or override `get_models`, and implement
+    `find_mismatches(model)` returning {pk: {field: recounted value}}
+    for the rows whose stored counters disagree.
+    """
+    model = None
+    # how the report calls the rows and their counters
+    rows = 'row(s)'
+    counters = 'counters'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report the drifted {}, do not fix them.'.format(self.counters),
+        )
+
+    def handle(self, *args, **options):
+        check_only = options['check']
+        drifted = 0
+
+        for model in self.get_models():
+            mismatches = self.find_mismatches(model)
+            drifted += len(mismatches)
+
+            for pk, values in mismatches.items():
+                self.stdout.write('{} {}: {}'.format(model.__name__, pk, ' '.join(
+                    '{}={}'.format(field, value) for field, value in values.items())))
+
+            if not check_only:
+                with transaction.atomic():
+                    self.update(model, mismatches)
+
+        if check_only:
+            message = '{} {} with drifted {}'.format(drifted, self.rows, self.counters)
+            if drifted:
+                self.stdout.write(self.style.ERROR(message))
+            else:
+                self.stdout.write(self.style.SUCCESS(message))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                '{} {} had their {} fixed'.format(drifted, self.rows, self.counters)))
+
+    def get_models(self):
+        return [self.model]
+
+    def find_mismatches(self, model):
+        raise NotImplementedError('subclasses of ReconcileCommand must provide a find_mismatches() method')
+
+    @staticmethod
+    def update(model, mismatches):
+        """Store the recounted values of the drifted rows"""
+        for pk, values in mismatches.items():
+            model.objects.filter(pk=pk).update(**values)
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authors.apps.articles.models import Articles
+
+
+class Command(BaseCommand):
+    """
+    Django command to compute the stored read time and text statistics
+    of existing articles, a chunk of rows at a time
+    """
+    help = 'Compute read time, word count, image count and excerpt for stored articles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of articles loaded and updated per transaction.',
+        )
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only process articles that have no statistics yet.',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        queryset = Articles.objects.only('id', 'body').order_by('pk')
+        if options['missing']:
+            queryset = queryset.filter(word_count=0).exclude(body='')
+
+        last_pk = 0
+        processed = 0
+        while True:
+            chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+            if not chunk:
+                break
+
+            for article in chunk:
+                article.refresh_text_stats()
+
+            with transaction.atomic():
+                Articles.objects.bulk_update(chunk, Articles.text_stat_fields)
+
+            last_pk = chunk[-1].pk
+            processed += len(chunk)
+
+        self.stdout.write(self.style.SUCCESS(
+            '{} article(s) had their text statistics computed'.format(processed)))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.articles.models import Articles
+
+
+class Command(BaseCommand):
+    """
+    Django command to build the full-text search vector of existing
+    articles, a range of rows per UPDATE
+    """
+    help = 'Build the full-text search vector of stored articles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of articles updated per statement.',
+        )
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only process articles that have no search vector yet.',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        queryset = Articles.objects.order_by('pk')
+        if options['missing']:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        last_pk = 0
+        processed = 0
+        while True:
+            pks = list(queryset.filter(pk__gt=last_pk).values_list('pk', flat=True)[:chunk_size])
+            if not pks:
+                break
+
+            processed += Articles.objects.filter(pk__in=pks).update(
+                search_vector=Articles.build_search_vector())
+            last_pk = pks[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            '{} article(s) had their search vector built'.format(processed)))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.articles.models import Articles
+
+
+class Command(BaseCommand):
+    """
+    Django command to rebuild the tag names column of existing
+    articles from their tags, a range of rows per UPDATE
+    """
+    help = 'Rebuild the tag names column of stored articles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of articles updated per statement.',
+        )
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only process articles that have no tag names yet.',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        queryset = Articles.objects.order_by('pk')
+        if options['missing']:
+            queryset = queryset.filter(tag_names=[])
+
+        last_pk = 0
+        processed = 0
+        while True:
+            pks = list(queryset.filter(pk__gt=last_pk).values_list('pk', flat=True)[:chunk_size])
+            if not pks:
+                break
+
+            processed += Articles.objects.filter(pk__in=pks).update(
+                tag_names=Articles.build_tag_names())
+            last_pk = pks[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            '{} article(s) had their tag names rebuilt'.format(processed)))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import (connection,
+                       transaction, )
+
+from authors.apps.articles.models import LikeDislike
+
+# keeps the latest vote of a user on an object
+DEDUPE_SQL = """
+    DELETE FROM {table} AS duplicate USING {table} AS latest
+    WHERE duplicate.content_type_id = latest.content_type_id
+        AND duplicate.object_id = latest.object_id
+        AND duplicate.user_id = latest.user_id
+        AND duplicate.id < latest.id
+"""
+
+
+class Command(BaseCommand):
+    """
+    Django command to delete the duplicate votes cast before votes were
+    unique per user and object, so the unique index can be created.
+    Runs before the migrations and only until the unique index exists,
+    the counters are left to sync_vote_counts
+    """
+    help = 'Delete all but the latest vote of each user on each object.'
+
+    def handle(self, *args, **options):
+        table = LikeDislike._meta.db_table
+        if table not in connection.introspection.table_names():
+            self.stdout.write(self.style.SUCCESS('No votes to dedupe'))
+            return
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            unique_votes = {constraint.name for constraint in LikeDislike._meta.constraints}
+            if unique_votes & set(connection.introspection.get_constraints(cursor, table)):
+                # the unique index keeps the votes unique from then on
+                self.stdout.write(self.style.SUCCESS('Votes are already unique'))
+                return
+            cursor.execute(DEDUPE_SQL.format(table=connection.ops.quote_name(table)))
+            deleted = cursor.rowcount
+
+        self.stdout.write(self.style.SUCCESS(
+            '{} duplicate vote(s) were deleted'.format(deleted)))
+        if deleted:
+            self.stdout.write(self.style.WARNING(
+                'Run sync_vote_counts after the migrations to recount the votes'))
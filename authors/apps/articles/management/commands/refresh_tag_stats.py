@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import (Count,
+                              Max,
+                              Sum, )
+from django.db.models.functions import Coalesce
+from taggit.models import Tag
+
+from authors.apps.articles.models import TagStats
+
+
+class Command(BaseCommand):
+    """
+    Django command to rebuild the usage of every tag from the tagged
+    articles, replacing the incrementally maintained rows, or with
+    `--missing` only adding the rows of the tags that have none
+    """
+    help = 'Rebuild the usage statistics of the tags.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only add the tags that have no statistics yet, keep the others.',
+        )
+
+    def handle(self, *args, **options):
+        tags = Tag.objects.all()
+        if options['missing']:
+            tags = tags.filter(stats__isnull=True)
+        tags = tags.annotate(
+            article_count=Count('articles'),
+            like_count=Coalesce(Sum('articles__like_count'), 0),
+            last_used_at=Max('articles__created_at'),
+        ).values_list('id', 'name', 'article_count', 'like_count', 'last_used_at')
+
+        with transaction.atomic():
+            if not options['missing']:
+                TagStats.objects.all().delete()
+            created = TagStats.objects.bulk_create([
+                TagStats(tag_id=tag_id, name=name.lower(), article_count=article_count,
+                         like_count=like_count, last_used_at=last_used_at)
+                for tag_id, name, article_count, like_count, last_used_at in tags.iterator()
+            ], batch_size=1000, ignore_conflicts=True)
+
+        self.stdout.write(self.style.SUCCESS(
+            '{} tag(s) had their usage rebuilt'.format(len(created))))
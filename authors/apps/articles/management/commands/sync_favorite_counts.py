@@ -0,0 +1,33 @@
+from django.db.models import Count
+
+from authors.apps.articles.management.base import ReconcileCommand
+from authors.apps.articles.models import (Articles,
+                                          Favorite, )
+
+
+class Command(ReconcileCommand):
+    """
+    Django command to backfill and reconcile the favorite counts
+    stored on articles against the Favorite table
+    """
+    help = 'Recount favorites for every article and fix drifted counts.'
+    model = Articles
+    rows = 'article(s)'
+    counters = 'favorite counts'
+
+    def find_mismatches(self, model):
+        """
+        Return {pk: {favorite_count}} for each article whose stored count
+        disagrees with its favorites, using one grouped query for the favorites
+        """
+        favorites = Favorite.objects.values('article_id').annotate(
+            total=Count('id')).order_by()
+        actual = {row['article_id']: row['total'] for row in favorites}
+
+        mismatches = {}
+        stored = model.objects.values_list('pk', 'favorite_count').order_by()
+        for pk, favorite_count in stored.iterator():
+            total = actual.get(pk, 0)
+            if total != favorite_count:
+                mismatches[pk] = {'favorite_count': total}
+        return mismatches
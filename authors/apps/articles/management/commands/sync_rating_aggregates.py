@@ -0,0 +1,61 @@
+from django.db.models import (Count,
+                              Q,
+                              Sum, )
+
+from authors.apps.articles.management.base import ReconcileCommand
+from authors.apps.articles.models import (Articles,
+                                          Ratings, )
+
+
+class Command(ReconcileCommand):
+    """
+    Django command to backfill and reconcile the rating aggregates
+    stored on articles against the Ratings table
+    """
+    help = 'Recompute rating counts, sums, histograms and averages and fix drifted articles.'
+    model = Articles
+    rows = 'article(s)'
+    counters = 'rating aggregates'
+
+    @staticmethod
+    def aggregates(rating_count=0, rating_sum=0, **histogram):
+        """Return every stored rating column for the given count, sum and histogram"""
+        average, bayesian = Articles.rating_averages(rating_count, rating_sum)
+        aggregates = {
+            'rating_count': rating_count,
+            'rating_sum': rating_sum,
+            'average_rating': average,
+            'bayesian_rating': bayesian,
+        }
+        for value in Articles.RATING_VALUES:
+            field = Articles.histogram_field(value)
+            aggregates[field] = histogram.get(field, 0)
+        return aggregates
+
+    def find_mismatches(self, model):
+        """
+        Return {pk: aggregates} for each article whose stored aggregates
+        disagree with its ratings, using one grouped query for the ratings
+        """
+        histogram = {
+            Articles.histogram_field(value): Count('id', filter=Q(value=value))
+            for value in Articles.RATING_VALUES
+        }
+        rows = Ratings.objects.values('article_id').annotate(
+            rating_count=Count('id'),
+            rating_sum=Sum('value'),
+            **histogram
+        ).order_by()
+        actual = {
+            row.pop('article_id'): self.aggregates(**row)
+            for row in rows
+        }
+
+        mismatches = {}
+        stored = model.objects.values('pk', *Articles.rating_fields).order_by()
+        for row in stored.iterator():
+            pk = row.pop('pk')
+            aggregates = actual.get(pk) or self.aggregates()
+            if any(abs(row[field] - value) > 1e-9 for field, value in aggregates.items()):
+                mismatches[pk] = aggregates
+        return mismatches
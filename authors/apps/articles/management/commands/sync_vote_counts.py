@@ -0,0 +1,45 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import (Count,
+                              Q, )
+
+from authors.apps.articles.management.base import ReconcileCommand
+from authors.apps.articles.models import LikeDislike
+
+
+class Command(ReconcileCommand):
+    """
+    Django command to backfill and reconcile the denormalized
+    like/dislike counters against the LikeDislike table
+    """
+    help = 'Recount likes and dislikes for every voted object and fix drifted counters.'
+    rows = 'object(s)'
+    counters = 'vote counters'
+
+    def get_models(self):
+        """Models that keep like/dislike counters"""
+        return [
+            model for model in apps.get_models()
+            if {'like_count', 'dislike_count'} <= set(getattr(model, 'counter_fields', ()))
+        ]
+
+    def find_mismatches(self, model):
+        """
+        Return {pk: {like_count, dislike_count}} for each row of `model` whose
+        stored counters disagree with the votes, using one grouped query for the votes
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        votes = LikeDislike.objects.filter(content_type=content_type).values(
+            'object_id').annotate(
+            likes=Count('id', filter=Q(vote__gt=0)),
+            dislikes=Count('id', filter=Q(vote__lt=0)),
+        ).order_by()
+        actual = {row['object_id']: (row['likes'], row['dislikes']) for row in votes}
+
+        mismatches = {}
+        stored = model.objects.values_list('pk', 'like_count', 'dislike_count').order_by()
+        for pk, like_count, dislike_count in stored.iterator():
+            counts = actual.get(pk, (0, 0))
+            if counts != (like_count, dislike_count):
+                mismatches[pk] = {'like_count': counts[0], 'dislike_count': counts[1]}
+        return mismatches
@@ -0,0 +1,88 @@
+# Generated by Django 2.2.28 on 2026-10-16 20:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Articles',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('like_count', models.PositiveIntegerField(default=0)),
+                ('dislike_count', models.PositiveIntegerField(default=0)),
+                ('title', models.CharField(default='', max_length=100)),
+                ('slug', models.SlugField(blank=True, max_length=140, unique=True)),
+                ('body', models.TextField()),
+                ('description', models.CharField(default='', max_length=250)),
+                ('read_time', models.PositiveIntegerField(default=1)),
+                ('word_count', models.PositiveIntegerField(default=0)),
+                ('image_count', models.PositiveIntegerField(default=0)),
+                ('excerpt', models.CharField(blank=True, default='', max_length=200)),
+                ('rating_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('rating_1_count', models.PositiveIntegerField(default=0)),
+                ('rating_2_count', models.PositiveIntegerField(default=0)),
+                ('rating_3_count', models.PositiveIntegerField(default=0)),
+                ('rating_4_count', models.PositiveIntegerField(default=0)),
+                ('rating_5_count', models.PositiveIntegerField(default=0)),
+                ('average_rating', models.FloatField(default=0)),
+                ('bayesian_rating', models.FloatField(db_index=True, default=3.0)),
+                ('favorite_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='Favorite',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LikeDislike',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vote', models.SmallIntegerField(choices=[(-1, 'Dislike'), (1, 'Like')], verbose_name='vote')),
+                ('object_id', models.PositiveIntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Ratings',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('value', models.IntegerField()),
+                ('review', models.TextField(blank=True)),
+                ('slug', models.SlugField(blank=True, max_length=140)),
+            ],
+            options={
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='ReportArticles',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('report', models.CharField(max_length=140)),
+                ('type_of_report', models.CharField(choices=[('plagiarism', 'plagiarism'), ('spam', 'spam'), ('harassment', 'harassment'), ('rules violation', 'rules violation')], default='', max_length=20)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports', to='articles.Articles')),
+            ],
+            options={
+                'ordering': ('-created_at',),
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 2.2 on 2026-10-16 22:53
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_auto_20261016_2057'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articles',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='articles',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='articles_search_vector_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2 on 2026-10-16 23:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_auto_20261016_2253'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='articles',
+            name='average_rating',
+            field=models.FloatField(db_index=True, default=0),
+        ),
+    ]
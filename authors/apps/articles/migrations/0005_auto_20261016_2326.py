@@ -0,0 +1,24 @@
+# Generated by Django 2.2 on 2026-10-16 23:26
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_auto_20261016_2318'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articles',
+            name='tag_names',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=100), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddIndex(
+            model_name='articles',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tag_names'], name='articles_tag_names_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 2.2 on 2026-10-16 23:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taggit', '0003_taggeditem_add_unique_index'),
+        ('articles', '0005_auto_20261016_2326'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TagStats',
+            fields=[
+                ('tag', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='taggit.Tag')),
+                ('name', models.CharField(max_length=100)),
+                ('article_count', models.PositiveIntegerField(default=0)),
+                ('like_count', models.PositiveIntegerField(default=0)),
+                ('last_used_at', models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='tagstats',
+            index=models.Index(fields=['-article_count', 'name'], name='tagstats_popular_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tagstats',
+            index=models.Index(fields=['-last_used_at'], name='tagstats_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tagstats',
+            index=models.Index(fields=['name'], name='tagstats_name_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
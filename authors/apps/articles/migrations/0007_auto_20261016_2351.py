@@ -0,0 +1,17 @@
+# Generated by Django 2.2 on 2026-10-16 23:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0006_auto_20261016_2331'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='likedislike',
+            constraint=models.UniqueConstraint(fields=('content_type', 'object_id', 'user'), name='likedislike_unique_vote'),
+        ),
+    ]
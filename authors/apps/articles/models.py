@@ -1,13 +1,44 @@
+import operator
+import re
+from functools import reduce
+
 from django.contrib.contenttypes.fields import (GenericForeignKey,
                                                 GenericRelation, )
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
-from django.db.models import Avg
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (SearchVector,
+                                            SearchVectorField, )
+from django.db import (IntegrityError,
+                       connection,
+                       connections,
+                       models,
+                       router,
+                       transaction, )
+from django.db.models import (Case,
+                              Count,
+                              F,
+                              FloatField,
+                              Func,
+                              Max,
+                              OuterRef,
+                              Q,
+                              Subquery,
+                              Value,
+                              When, )
+from django.db.models.functions import (Cast,
+                                        Greatest,
+                                        Lower,
+                                        NullIf,
+                                        Substr, )
 from django.utils.text import slugify
 from taggit.managers import TaggableManager
+from taggit.models import (Tag,
+                           TaggedItem, )
 
-from authors.apps.core.models import TimeStampModel
-from authors.apps.profiles.models import Profile
+from authors.apps.core.models import (TimeStampModel,
+                                      CounterCacheModel, )
+from authors.apps.articles.utils import article_text_stats
 from ..authentication.models import User
 
 
@@ -61,13 +92,152 @@ class LikeDislike(models.Model):
 
     objects = LikeDislikeManager()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored vote so that a flip can move the counters
+        instance._loaded_vote = instance.vote
+        return instance
+
     @property
     def article(self):
         return self.articles.first()
 
+    @staticmethod
+    def counter_field(vote):
+        """
+        Return the counter column on the voted object that tracks `vote`
+        """
+        return 'like_count' if vote > 0 else 'dislike_count'
+
+    def update_counters(self, previous_vote=None, removed=False):
+        """
+        Move the like/dislike counters of the voted object to reflect
+        this vote being created, flipped from `previous_vote` or removed.
+        """
+        deltas = {}
+        if previous_vote is not None:
+            deltas[self.counter_field(previous_vote)] = -1
+        if not removed:
+            field = self.counter_field(self.vote)
+            deltas[field] = deltas.get(field, 0) + 1
+
+        model = ContentType.objects.get_for_id(self.content_type_id).model_class()
+        model.adjust_counters(self.object_id, **deltas)
+
+    def save(self, *args, **kwargs):
+        previous_vote = getattr(self, '_loaded_vote', None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if previous_vote != self.vote:
+                self.update_counters(previous_vote=previous_vote)
+        self._loaded_vote = self.vote
+
+    # Takes back the vote of a user when it is the one cast again, otherwise
+    # inserts it or flips the opposite one. The unique index settles
+    # concurrent toggles: a vote cast twice at once is only counted once.
+    TOGGLE_SQL = """
+        WITH removed AS (
+            DELETE FROM {table}
+            WHERE content_type_id = %(content_type)s AND object_id = %(object_id)s
+                AND user_id = %(user)s AND vote = %(vote)s
+            RETURNING id
+        ), upserted AS (
+            INSERT INTO {table} (content_type_id, object_id, user_id, vote)
+            SELECT %(content_type)s, %(object_id)s, %(user)s, %(vote)s
+            WHERE NOT EXISTS (SELECT 1 FROM removed)
+            ON CONFLICT (content_type_id, object_id, user_id)
+            DO UPDATE SET vote = EXCLUDED.vote WHERE {table}.vote <> EXCLUDED.vote
+            RETURNING id, xmax = 0 AS created
+        )
+        SELECT id, 'removed' FROM removed
+        UNION ALL
+        SELECT id, CASE WHEN created THEN 'created' ELSE 'flipped' END FROM upserted
+    """
+
+    @classmethod
+    def toggle(cls, obj, user, vote):
+        """
+        Cast `vote` on `obj` for `user`, or take it back when it is already
+        cast, in one statement, moving and re-reading the counters of `obj`
+        in the same transaction. Return the vote and what happened to it:
+        'created', 'flipped' or 'removed', (None, None) when a concurrent
+        request cast the same vote first
+        """
+        content_type_id = ContentType.objects.get_for_model(obj).id
+        db = router.db_for_write(cls)
+        with transaction.atomic(using=db):
+            with connections[db].cursor() as cursor:
+                cursor.execute(cls.TOGGLE_SQL.format(table=cls._meta.db_table), {
+                    'content_type': content_type_id,
+                    'object_id': obj.pk,
+                    'user': user.pk,
+                    'vote': vote,
+                })
+                row = cursor.fetchone()
+            if row is None:
+                obj.refresh_from_db(fields=['like_count', 'dislike_count'])
+                return None, None
+
+            vote_id, action = row
+            instance = cls(id=vote_id, content_type_id=content_type_id, object_id=obj.pk,
+                           user=user, vote=vote)
+            # the receivers of the vote see what a save() or delete() sends,
+            # the counters of a removed vote follow in the post_delete one
+            if action == 'removed':
+                models.signals.post_delete.send(sender=cls, instance=instance, using=db)
+            else:
+                instance.update_counters(previous_vote=-vote if action == 'flipped' else None)
+                instance._state.adding = False
+                instance._loaded_vote = vote
+                models.signals.post_save.send(sender=cls, instance=instance, created=action == 'created',
+                                              update_fields=None, raw=False, using=db)
+            # the counters were moved with F() expressions, re-read them
+            obj.refresh_from_db(fields=['like_count', 'dislike_count'])
+        return instance, action
+
+    class Meta:
+        constraints = [
+            # one vote per user and object, what `toggle` upserts on
+            models.UniqueConstraint(fields=['content_type', 'object_id', 'user'],
+                                    name='likedislike_unique_vote'),
+        ]
+
+
+class ArraySubquery(Func):
+    """The values of a single column subquery as an array"""
+    function = 'ARRAY'
+    template = '%(function)s%(expressions)s'
+
 
-class Articles(TimeStampModel):
+class ArticleQuerySet(models.QuerySet):
+    """
+    Queryset for articles with helpers that load what the
+    ArticleSerializer reads, so serializing a page takes a fixed
+    number of queries whatever the number of articles.
+    """
+
+    def with_author(self):
+        """Join the author and the author's profile into the same query"""
+        return self.select_related('author', 'author__profile')
+
+    def for_listing(self):
+        """
+        Load the author in the same query and prefetch the latest
+        favoriters (at most FAVORITERS_PREVIEW per article),
+        the tags are read from the `tag_names` column
+        """
+        return self.with_author().prefetch_related(
+            models.Prefetch('favorites',
+                            queryset=Favorite.objects.latest_per_article(Articles.FAVORITERS_PREVIEW),
+                            to_attr='favoriters_preview'),
+        )
+
+
+class Articles(TimeStampModel, CounterCacheModel):
     likes = GenericRelation(LikeDislike, related_query_name='articles')
+    like_count = models.PositiveIntegerField(default=0)
+    dislike_count = models.PositiveIntegerField(default=0)
     author = models.ForeignKey('authentication.User', related_name='articles',
                                on_delete=models.CASCADE, null=False, default='')
     title = models.CharField(max_length=100, default='')
@@ -75,37 +245,303 @@ class Articles(TimeStampModel):
     body = models.TextField()
     description = models.CharField(max_length=250, default='')
     tags = TaggableManager()
+    # Lower case names of the tags, sorted, rebuilt whenever the tags change
+    # so tags are filtered with a GIN index and served without a join
+    tag_names = ArrayField(models.CharField(max_length=100), default=list, blank=True, editable=False)
+    # Text statistics computed from the body whenever it changes
+    read_time = models.PositiveIntegerField(default=1)
+    word_count = models.PositiveIntegerField(default=0)
+    image_count = models.PositiveIntegerField(default=0)
+    excerpt = models.CharField(max_length=200, blank=True, default='')
+    # Weighted full-text search document, rebuilt when the searched text changes
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Bayesian average: every article starts with RATING_PRIOR_WEIGHT
+    # imaginary ratings of RATING_PRIOR_MEAN, so a single 5 star rating
+    # does not outrank an article with hundreds of 4 star ratings
+    RATING_PRIOR_MEAN = 3.0
+    RATING_PRIOR_WEIGHT = 5
+    RATING_VALUES = range(1, 6)
+
+    # Rating aggregates kept in step with the Ratings table
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+    average_rating = models.FloatField(default=0, db_index=True)
+    bayesian_rating = models.FloatField(default=RATING_PRIOR_MEAN, db_index=True)
+
+    rating_fields = ('rating_count', 'rating_sum', 'rating_1_count', 'rating_2_count',
+                     'rating_3_count', 'rating_4_count', 'rating_5_count',
+                     'average_rating', 'bayesian_rating')
+    # Number of users who favorited the article, the usernames are
+    # served page by page from the favoriters endpoint
+    favorite_count = models.PositiveIntegerField(default=0)
+    # Number of favoriters usernames inlined in the article
+    FAVORITERS_PREVIEW = 5
+    # Times a save picks a new slug after losing an insert race
+    SLUG_ALLOCATION_ATTEMPTS = 5
+
+    counter_fields = ('like_count', 'dislike_count', 'favorite_count') + rating_fields
+    # rebuilt from the tags by `sync_tag_names` and `update_tags` only
+    derived_fields = ('tag_names',)
+    text_stat_fields = ('read_time', 'word_count', 'image_count', 'excerpt')
+    # Columns matched by the full-text search and their weights, A ranks highest
+    search_weights = (('title', 'A'), ('description', 'B'), ('body', 'C'))
+    SEARCH_CONFIG = 'english'
+
+    objects = ArticleQuerySet.as_manager()
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored body so unchanged bodies are not parsed again
+        instance._loaded_body = instance.__dict__.get('body')
+        return instance
+
+    def refresh_text_stats(self):
+        """Recompute the read time and text statistics from the body"""
+        for field, value in article_text_stats(self.body).items():
+            setattr(self, field, value)
+
+    @classmethod
+    def build_search_vector(cls, column=F):
+        """
+        Return the weighted search vector expression of the searched text,
+        `column` maps a field name to the expression of its value,
+        the stored columns by default
+        """
+        return reduce(operator.add, [
+            SearchVector(column(field), weight=weight, config=cls.SEARCH_CONFIG)
+            for field, weight in cls.search_weights
+        ])
+
+    def refresh_search_vector(self):
+        """Rebuild the search vector from the text being saved"""
+        self.search_vector = self.build_search_vector(
+            lambda field: Value(getattr(self, field), output_field=models.TextField()))
+
+    @classmethod
+    def build_tag_names(cls):
+        """Return the expression of the sorted lower case tag names of an article"""
+        names = TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(cls), object_id=OuterRef('pk'),
+        ).annotate(name=Lower('tag__name')).order_by('name').values('name')
+        return ArraySubquery(Subquery(names), output_field=cls._meta.get_field('tag_names'))
+
+    @staticmethod
+    def normalize_tag_names(names):
+        """The `tag_names` of the given tag names"""
+        return sorted({name.strip().lower() for name in names if name.strip()})
+
+    def sync_tag_names(self):
+        """Rebuild the tag names column from the tags of the article"""
+        Articles.objects.filter(pk=self.pk).update(tag_names=self.build_tag_names())
+        self.refresh_from_db(fields=['tag_names'])
+
+    @classmethod
+    def adjust_counters(cls, pk, **deltas):
+        super().adjust_counters(pk, **deltas)
+        if deltas.get('like_count'):
+            # the likes of an article count for each of its tags
+            TagStats.adjust_counters_of(
+                TagStats.objects.filter(tag__in=Articles.tag_ids(pk)), like_count=deltas['like_count'])
+
+    @staticmethod
+    def tag_ids(pk):
+        """Subquery of the ids of the tags of an article"""
+        return TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Articles), object_id=pk).values('tag_id')
+
+    def update_tags(self, add=(), remove=()):
+        """
+        Tag the article with the names of `add` and untag it from those of
+        `remove`, compared with its current `tag_names`: nothing is written
+        when the tags do not change, otherwise one DELETE and one INSERT of
+        tagged items in a transaction, the m2m_changed signals of taggit
+        being sent as `tags.add` and `tags.remove` would
+        """
+        current = set(self.tag_names)
+        added = set(self.normalize_tag_names(add)) - current
+        removed = set(self.normalize_tag_names(remove)) & current
+        if not added and not removed:
+            return False
+
+        tagged_items = TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Articles), object_id=self.pk)
+        with transaction.atomic():
+            if removed:
+                removed_ids = set(tagged_items.annotate(name=Lower('tag__name')).filter(
+                    name__in=removed).values_list('tag_id', flat=True))
+                self.send_tags_changed('pre_remove', removed_ids)
+                tagged_items.filter(tag_id__in=removed_ids).delete()
+                self.send_tags_changed('post_remove', removed_ids)
+            if added:
+                tags = {tag.name: tag for tag in Tag.objects.filter(name__in=added)}
+                # new tags one by one, taggit makes their slugs unique on save
+                tags.update((name, Tag.objects.get_or_create(name=name)[0])
+                            for name in added - set(tags))
+                added_ids = {tag.pk for tag in tags.values()} - set(
+                    tagged_items.values_list('tag_id', flat=True))
+                self.send_tags_changed('pre_add', added_ids)
+                TaggedItem.objects.bulk_create([
+                    TaggedItem(content_object=self, tag_id=tag_id) for tag_id in added_ids
+                ])
+                self.send_tags_changed('post_add', added_ids)
+        return True
+
+    def send_tags_changed(self, action, tag_ids):
+        models.signals.m2m_changed.send(
+            sender=TaggedItem, action=action, instance=self, reverse=False,
+            model=Tag, pk_set=tag_ids, using=self._state.db,
+        )
+
     def get_unique_slug(self):
+        """
+        Return the slug of the title, suffixed with the next free number
+        if it is taken e.g `my-title-3` when `my-title-2` is the highest.
+        An article keeps its current slug if it still matches the title.
+
+        Finds the highest suffix in one query over the slug prefix
+        (a range scan of the slug index) however many articles share it.
+        """
         slug = slugify(self.title)
-        unique_slug = slug
-        num = 1
-        while Articles.objects.filter(slug=unique_slug).exists():
-            unique_slug = '{}-{}'.format(slug, num)
-            num += 1
-        return unique_slug
+        pattern = r'^{}(-[0-9]{{1,9}})?$'.format(re.escape(slug))
+        suffix = Substr('slug', len(slug) + 2)
+        taken = Articles.objects.filter(
+            slug__startswith=slug, slug__regex=pattern
+        ).exclude(pk=self.pk).aggregate(
+            count=Count('id'),
+            clashes=Count('id', filter=Q(slug=self.slug)),
+            highest=Max(Cast(NullIf(suffix, Value('')), models.IntegerField())),
+        )
+        if self.slug and re.match(pattern, self.slug) and not taken['clashes']:
+            return self.slug
+        if not taken['count']:
+            return slug
+        return '{}-{}'.format(slug, (taken['highest'] or 0) + 1)
+
+    def slug_is_taken(self):
+        return Articles.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+
+    def save_with_unique_slug(self, *args, **kwargs):
+        """
+        Save the article and pick the next free slug if a concurrent
+        request took this one between allocating and inserting it
+        """
+        for attempt in range(self.SLUG_ALLOCATION_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                if attempt + 1 == self.SLUG_ALLOCATION_ATTEMPTS or not self.slug_is_taken():
+                    raise
+                self.slug = self.get_unique_slug()
 
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = self.get_unique_slug()
-        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        body_changed = self._state.adding or self.body != getattr(self, '_loaded_body', None)
+        if body_changed and (update_fields is None or 'body' in update_fields):
+            self.refresh_text_stats()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | set(self.text_stat_fields)
+
+        # the search vector is a PostgreSQL type, other databases search
+        # with the fallback backend of `authors.apps.search.backends`
+        searched_fields = {field for field, _ in self.search_weights}
+        if connection.vendor == 'postgresql' and (
+                update_fields is None or searched_fields & set(update_fields)):
+            self.refresh_search_vector()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(kwargs['update_fields']) | {'search_vector'}
+
+        self.save_with_unique_slug(*args, **kwargs)
+        self._loaded_body = self.body
 
     def get_absolute_url(self):
         return 'authors:articles', (self.slug,)
 
     def get_average_rating(self):
-        if Ratings.objects.all().count() > 0:
-            rating = Ratings.objects.filter(article=self.id).all().aggregate(Avg('value'))
-            return round(rating['value__avg'], 1) if rating['value__avg'] else 0
-        return 0
+        return round(self.average_rating, 1)
+
+    @property
+    def rating_histogram(self):
+        """Number of ratings given for each value e.g {1: 0, 2: 3, ...}"""
+        return {
+            value: getattr(self, self.histogram_field(value))
+            for value in self.RATING_VALUES
+        }
+
+    @staticmethod
+    def histogram_field(value):
+        """Return the column that counts ratings of `value`"""
+        return 'rating_{}_count'.format(int(value))
+
+    @classmethod
+    def rating_averages(cls, rating_count, rating_sum):
+        """
+        Return the plain and Bayesian averages for the given count and sum
+        as (average_rating, bayesian_rating)
+        """
+        average = rating_sum / rating_count if rating_count else 0
+        bayesian = ((cls.RATING_PRIOR_WEIGHT * cls.RATING_PRIOR_MEAN + rating_sum) /
+                    (cls.RATING_PRIOR_WEIGHT + rating_count))
+        return average, bayesian
+
+    @classmethod
+    def adjust_ratings(cls, pk, added=None, removed=None):
+        """
+        Atomically move the rating aggregates of one article to reflect
+        a rating of value `added` being given and/or a rating of value
+        `removed` being taken back (both are set when a rating is edited).
+
+        The averages are computed from the new count and sum in the same
+        UPDATE, so concurrent ratings never leave them out of step.
+        """
+        deltas = {'rating_count': 0, 'rating_sum': 0}
+        for value, step in ((removed, -1), (added, 1)):
+            if value is None:
+                continue
+            field = cls.histogram_field(value)
+            deltas['rating_count'] += step
+            deltas['rating_sum'] += step * int(value)
+            deltas[field] = deltas.get(field, 0) + step
+
+        updates = {
+            field: Greatest(F(field) + delta, 0)
+            for field, delta in deltas.items() if delta
+        }
+        if not updates:
+            return
+
+        # The right hand side of an UPDATE sees the values before the update
+        rating_count = Greatest(F('rating_count') + deltas['rating_count'], 0)
+        rating_sum = Cast(Greatest(F('rating_sum') + deltas['rating_sum'], 0), FloatField())
+        updates['average_rating'] = Case(
+            When(rating_count__lte=-deltas['rating_count'], then=Value(0.0)),
+            default=rating_sum / rating_count,
+            output_field=FloatField(),
+        )
+        updates['bayesian_rating'] = (
+            (Value(cls.RATING_PRIOR_WEIGHT * cls.RATING_PRIOR_MEAN) + rating_sum) /
+            (Value(cls.RATING_PRIOR_WEIGHT) + rating_count)
+        )
+        cls.objects.filter(pk=pk).update(**updates)
 
     def get_author(self):
-        profile = Profile.objects.get(user=self.author)
+        # the author and profile come preloaded from `with_author()`
+        profile = self.author.profile
         author = {
-            "username": profile.get_username,
+            "username": self.author.username,
             "bio": profile.bio,
             "image": profile.get_cloudinary_url
         }
@@ -113,15 +549,24 @@ class Articles(TimeStampModel):
 
     @property
     def favoriters(self):
-        queryset = Favorite.objects.filter(article_id=self)
-        favoriters = []
-        for favoriter in queryset:
-            profile = Profile.objects.get(user=favoriter.user_id)
-            favoriters.append(profile.get_username)
-        return favoriters
+        """
+        Usernames of the latest FAVORITERS_PREVIEW users who favorited
+        the article, see `favorite_count` for the total
+        """
+        favorites = getattr(self, 'favoriters_preview', None)
+        if favorites is None:
+            # not loaded by `for_listing()`, join the users in one query
+            favorites = self.favorites.select_related('user_id').order_by('-id')[:self.FAVORITERS_PREVIEW]
+        return [favorite.user_id.username for favorite in favorites]
 
     class Meta:
         ordering = ('-created_at',)
+        indexes = [
+            # backs the (created_at, id) keyset pagination of the feed
+            models.Index(fields=['-created_at', '-id'], name='articles_created_id_idx'),
+            GinIndex(fields=['search_vector'], name='articles_search_vector_idx'),
+            GinIndex(fields=['tag_names'], name='articles_tag_names_idx'),
+        ]
 
 
 # add ratings model
@@ -135,16 +580,67 @@ class Ratings(TimeStampModel):
     def __str__(self):
         return str(self.value)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored value so that an edit can move the aggregates
+        instance._loaded_value = instance.value
+        return instance
+
+    def update_article_aggregates(self, previous_value=None, removed=False):
+        """
+        Move the rating aggregates of the rated article to reflect this
+        rating being created, changed from `previous_value` or removed.
+        """
+        Articles.adjust_ratings(
+            self.article_id,
+            added=None if removed else self.value,
+            removed=previous_value,
+        )
+
+    def save(self, *args, **kwargs):
+        previous_value = getattr(self, '_loaded_value', None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if previous_value is None or int(previous_value) != int(self.value):
+                self.update_article_aggregates(previous_value=previous_value)
+                # keep an article instance held by the caller in step
+                if Ratings.article.is_cached(self):
+                    self.article.refresh_from_db(fields=Articles.rating_fields)
+        self._loaded_value = self.value
+
     class Meta:
         ordering = ('-created_at',)
         unique_together = (('author', 'article'),)
 
 
+class FavoriteQuerySet(models.QuerySet):
+
+    def latest_per_article(self, limit):
+        """
+        Keep the `limit` latest favorites of each article, with their users
+        joined, so a page of articles gets capped favoriters in one query
+        """
+        latest = Favorite.objects.filter(
+            article_id=models.OuterRef('article_id')).order_by('-id').values('id')[:limit]
+        return self.filter(
+            id__in=models.Subquery(latest)).select_related('user_id').order_by('-id')
+
+
 class Favorite(models.Model):
     """Implement storage of favorites"""
     user_id = models.ForeignKey('authentication.User', on_delete=models.CASCADE, related_name='favorites')
     article_id = models.ForeignKey('articles.articles', on_delete=models.CASCADE, related_name='favorites')
 
+    objects = FavoriteQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                Articles.adjust_counters(self.article_id_id, favorite_count=1)
+
 
 class ReportArticles(TimeStampModel):
     """ Model to hold instances of reports posted by users. """
@@ -172,3 +668,69 @@ class ReportArticles(TimeStampModel):
 
     class Meta:
         ordering = ('-created_at',)
+
+
+class TagStats(CounterCacheModel):
+    """
+    Usage of a tag by articles, kept in step with the tags of the articles
+    and the likes of the tagged articles, rebuilt by `refresh_tag_stats`
+    """
+    tag = models.OneToOneField('taggit.Tag', primary_key=True, related_name='stats',
+                               on_delete=models.CASCADE)
+    # lower case, as in the `tag_names` of the articles
+    name = models.CharField(max_length=100)
+    article_count = models.PositiveIntegerField(default=0)
+    # total likes of the tagged articles
+    like_count = models.PositiveIntegerField(default=0)
+    # creation of the newest tagged article
+    last_used_at = models.DateTimeField(null=True)
+
+    counter_fields = ('article_count', 'like_count')
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def adjust_counters_of(cls, queryset, **deltas):
+        """Add the given deltas to the counters of the tags of `queryset`"""
+        updates = cls.counter_updates(**deltas)
+        if updates:
+            queryset.update(**updates)
+
+    @classmethod
+    def tag_article(cls, article_id, tag_ids):
+        """Count an article tagged with the tags of `tag_ids`"""
+        cls.objects.bulk_create([
+            cls(tag_id=tag_id, name=name.lower())
+            for tag_id, name in Tag.objects.filter(pk__in=tag_ids).values_list('id', 'name')
+        ], ignore_conflicts=True)
+        article = Articles.objects.filter(pk=article_id)
+        cls.objects.filter(pk__in=tag_ids).update(
+            article_count=F('article_count') + 1,
+            like_count=F('like_count') + Subquery(article.values('like_count')),
+            # GREATEST skips the NULL of a tag used for the first time
+            last_used_at=Greatest(F('last_used_at'), Subquery(article.values('created_at'))),
+        )
+
+    @classmethod
+    def untag_article(cls, article_id, tag_ids):
+        """Stop counting an article for the tags of `tag_ids`"""
+        likes = Articles.objects.filter(pk=article_id).values('like_count')
+        # the article may still be tagged, on delete
+        newest = Articles.objects.filter(tags__id=OuterRef('pk')).exclude(pk=article_id).order_by(
+            '-created_at').values('created_at')[:1]
+        cls.objects.filter(pk__in=tag_ids).update(
+            article_count=Greatest(F('article_count') - 1, 0),
+            like_count=Greatest(F('like_count') - Subquery(likes), 0),
+            last_used_at=Subquery(newest),
+        )
+
+    class Meta:
+        indexes = [
+            # top tags, and the most recently used ones
+            models.Index(fields=['-article_count', 'name'], name='tagstats_popular_idx'),
+            models.Index(fields=['-last_used_at'], name='tagstats_recent_idx'),
+            # LIKE 'prefix%' lookups whatever the collation
+            models.Index(fields=['name'], name='tagstats_name_prefix_idx',
+                         opclasses=['varchar_pattern_ops']),
+        ]
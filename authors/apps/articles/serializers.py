@@ -1,9 +1,7 @@
 import os
 from urllib import parse
 
-import readtime
-from django.contrib.auth.models import AnonymousUser
-from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from rest_framework import serializers
 from taggit_serializer.serializers import (TagListSerializerField,
                                            TaggitSerializer, )
@@ -11,7 +9,11 @@ from taggit_serializer.serializers import (TagListSerializerField,
 from authors.apps.articles.models import (Articles,
                                           Ratings,
                                           Favorite,
-                                          ReportArticles, LikeDislike)
+                                          ReportArticles, LikeDislike,
+                                          TagStats, )
+from authors.apps.articles.loaders import (ArticleViewerState,
+                                           ViewerStateListSerializer,
+                                           ViewerStateMixin, )
 from authors.apps.articles.utils import ChoicesField
 
 
@@ -23,8 +25,14 @@ class TagSerializer(TagListSerializerField):
         'not_a_str': 'All list items must be of string type.'
     }
 
+    def get_attribute(self, instance):
+        if isinstance(instance, Articles):
+            # the denormalized names of the article, no query per article
+            return list(instance.tag_names)
+        return super().get_attribute(instance)
+
 
-class ArticleSerializer(TaggitSerializer, serializers.HyperlinkedModelSerializer):
+class ArticleSerializer(ViewerStateMixin, TaggitSerializer, serializers.HyperlinkedModelSerializer):
     id = serializers.IntegerField(read_only=True)
     title = serializers.CharField(
         required=True,
@@ -33,37 +41,43 @@ class ArticleSerializer(TaggitSerializer, serializers.HyperlinkedModelSerializer
     description = serializers.CharField(required=True, max_length=250)
     author = serializers.ReadOnlyField(source='get_author')
     average_rating = serializers.ReadOnlyField(source='get_average_rating')
-    likes = serializers.ReadOnlyField(source='likes.likes')
-    dislikes = serializers.ReadOnlyField(source='likes.dislikes')
+    rating_count = serializers.ReadOnlyField()
+    # rating weighted towards the prior, used to rank articles
+    bayesian_rating = serializers.ReadOnlyField()
+    likes = serializers.ReadOnlyField(source='like_count')
+    dislikes = serializers.ReadOnlyField(source='dislike_count')
     has_liked = serializers.SerializerMethodField()
     has_disliked = serializers.SerializerMethodField()
+    has_favorited = serializers.SerializerMethodField()
+    has_bookmarked = serializers.SerializerMethodField()
     tags = TagSerializer()
+    # tags added to or removed from those of the article, `tags` replaces them
+    add_tags = TagSerializer(write_only=True, required=False)
+    remove_tags = TagSerializer(write_only=True, required=False)
     share_links = serializers.SerializerMethodField()
     # string describe the read time of an article e.g '1 min read'
     read_time = serializers.ReadOnlyField()
+    word_count = serializers.ReadOnlyField()
+    image_count = serializers.ReadOnlyField()
+    excerpt = serializers.ReadOnlyField()
+    # the latest favoriters only, the full list is paginated on its own endpoint
     favorited = serializers.ReadOnlyField(source="favoriters")
+    favorites_count = serializers.ReadOnlyField(source="favorite_count")
     has_rating = serializers.SerializerMethodField()
     auth_user_rating = serializers.SerializerMethodField()
 
+    viewer_state_class = ArticleViewerState
+    # fields that depend on who is reading, the rest is shared by all readers
+    viewer_fields = ('has_liked', 'has_disliked', 'has_favorited', 'has_bookmarked',
+                     'has_rating', 'auth_user_rating')
+
     def get_has_liked(self, instance):
         """
         Handle checking if a user has liked an article before
         :param instance:
         :return:
         """
-
-        request = self.context.get('request')
-
-        ld = []
-
-        if request and not isinstance(request.user, AnonymousUser):
-            ct = ContentType.objects.get_for_model(Articles)
-            ld = LikeDislike.objects.filter(content_type=ct,
-                                            user=request.user,
-                                            object_id=instance.id,
-                                            vote=1)
-
-        return bool(len(list(ld)))
+        return self.viewer_state.vote(instance) == LikeDislike.LIKE
 
     def get_has_disliked(self, instance):
         """
@@ -71,63 +85,73 @@ class ArticleSerializer(TaggitSerializer, serializers.HyperlinkedModelSerializer
         :param instance:
         :return:
         """
+        return self.viewer_state.vote(instance) == LikeDislike.DISLIKE
 
-        request = self.context.get('request')
-
-        ld = []
-
-        if request and not isinstance(request.user, AnonymousUser):
-            ct = ContentType.objects.get_for_model(Articles)
-            ld = LikeDislike.objects.filter(content_type=ct,
-                                            user=request.user,
-                                            object_id=instance.id,
-                                            vote=-1)
+    def get_has_favorited(self, instance):
+        """
+        Handle checking if a user has favorited an article
+        :param instance:
+        :return:
+        """
+        return self.viewer_state.has_favorited(instance)
 
-        return bool(len(list(ld)))
+    def get_has_bookmarked(self, instance):
+        """
+        Handle checking if a user has bookmarked an article
+        :param instance:
+        :return:
+        """
+        return self.viewer_state.has_bookmarked(instance)
 
     def to_representation(self, instance):
         """ Add the read time of the article."""
         article_rep = super().to_representation(instance)
-        # Get read time for an article instance,
-        #  given it has HTML elements e.g images
-        # read time (seconds) = num_words / 265 * 60 + img_weight * num_images
-        article_rep['read_time'] = str(readtime.of_html(article_rep['body']))
+        # The read time is computed from the body when the article is saved,
+        # here we only format the stored number of minutes
+        if 'read_time' in article_rep:
+            article_rep['read_time'] = '{} min read'.format(article_rep['read_time'])
         # return the article's details along with it's read time
         return article_rep
 
-    def get_auth_user_rating(self, instance):
-        rating = {}
+    def viewer_representation(self, instance):
+        """
+        Return only the `viewer_fields` of an article, the instance only
+        needs its primary key
+        """
+        return self.viewer_representations([instance])[0]
 
-        if isinstance(instance, Articles):
-            request = self.context.get('request')
+    def viewer_representations(self, instances):
+        """
+        Return the `viewer_fields` of several articles, the state of the
+        reader is loaded for all of them at once
+        """
+        self.viewer_state = self.load_viewer_state(instances)
+        return [
+            {name: self.fields[name].to_representation(instance) for name in self.viewer_fields}
+            for instance in instances
+        ]
 
-            if request and not isinstance(request.user, AnonymousUser):
-                rating = Ratings.objects.filter(
-                    author=request.user, article=instance).first()
+    @classmethod
+    def shared_representation(cls, data):
+        """Drop the `viewer_fields` of a representation, keeping what all readers share"""
+        return {name: value for name, value in data.items() if name not in cls.viewer_fields}
 
-            if rating:
-                rating = {
-                    'id': rating.id,
-                    'created_at': rating.created_at.strftime('%c'),
-                    'updated_at': rating.updated_at.strftime('%c'),
-                    'value': rating.value,
-                    'review': rating.review,
-                }
+    def get_auth_user_rating(self, instance):
+        rating = self.viewer_state.rating(instance)
+
+        if rating:
+            rating = {
+                'id': rating.id,
+                'created_at': rating.created_at.strftime('%c'),
+                'updated_at': rating.updated_at.strftime('%c'),
+                'value': rating.value,
+                'review': rating.review,
+            }
 
-        return rating
+        return rating or {}
 
     def get_has_rating(self, instance):
-
-        has_rating = False
-
-        if isinstance(instance, Articles):
-            request = self.context.get('request')
-
-            if request and not isinstance(request.user, AnonymousUser):
-                has_rating = Ratings.objects.filter(
-                    author=request.user, article=instance).exists()
-
-        return has_rating
+        return self.viewer_state.rating(instance) is not None
 
     def get_share_links(self, obj):
         links = {}
@@ -156,36 +180,46 @@ class ArticleSerializer(TaggitSerializer, serializers.HyperlinkedModelSerializer
         """
         Create and return a new `Article` instance, given the validated data.
         """
-        tags = [tag.lower() for tag in validated_data.pop('tags')]
-        instance = super().create(validated_data)
-        instance.tags.set(*tags)
+        tags = validated_data.pop('tags')
+        validated_data.pop('add_tags', None)
+        validated_data.pop('remove_tags', None)
+        with transaction.atomic():
+            instance = super().create(validated_data)
+            instance.update_tags(add=tags)
         return instance
 
     def update(self, instance, validated_data):
         """
         Update and return an existing `Article`, given the validated data.
+        Its tags are replaced by `tags`, or changed by `add_tags` and
+        `remove_tags`, only the difference with the current tags is written.
         """
-        old_tags = [tag for tag in instance.tags.all()]
-        tags = validated_data.pop('tags', old_tags)
+        add = validated_data.pop('add_tags', [])
+        remove = validated_data.pop('remove_tags', [])
+        if 'tags' in validated_data:
+            tags = Articles.normalize_tag_names(validated_data.pop('tags'))
+            add, remove = tags, set(instance.tag_names) - set(tags)
         instance.title = validated_data.get('title', instance.title)
         instance.body = validated_data.get('body', instance.body)
         instance.description = validated_data.get(
             'description', instance.description)
-        unique_tags = list(set(old_tags + tags))
-        instance.tags.set(*unique_tags)
-
-        if validated_data.get('title'):
-            instance.slug = instance.get_unique_slug()
 
-        instance.save()
+        with transaction.atomic():
+            instance.update_tags(add=add, remove=remove)
+            if validated_data.get('title'):
+                instance.slug = instance.get_unique_slug()
+            instance.save()
         return instance
 
     class Meta:
         model = Articles
+        list_serializer_class = ViewerStateListSerializer
 
-        fields = ('id', 'likes', 'dislikes', 'has_liked', 'has_disliked', 'created_at', 'updated_at',
-                  'author', 'title', 'tags', 'body', 'description',
-                  'average_rating', 'slug', 'read_time', 'share_links', 'has_rating', 'auth_user_rating', 'favorited')
+        fields = ('id', 'likes', 'dislikes', 'has_liked', 'has_disliked', 'has_favorited', 'has_bookmarked',
+                  'created_at', 'updated_at', 'author', 'title', 'tags', 'body', 'description',
+                  'average_rating', 'rating_count', 'bayesian_rating', 'slug', 'read_time', 'word_count', 'image_count', 'excerpt',
+                  'share_links', 'has_rating', 'auth_user_rating', 'favorited',
+                  'favorites_count', 'add_tags', 'remove_tags')
 
         extra_kwargs = {
             'url': {
@@ -244,6 +278,16 @@ class FavoriteSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
+class TagStatsSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the usage of a tag
+    """
+
+    class Meta:
+        model = TagStats
+        fields = ('name', 'article_count', 'like_count', 'last_used_at')
+
+
 # add reports serializer
 class ReportsSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField(read_only=True)
@@ -0,0 +1,145 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import (m2m_changed,
+                                      post_delete,
+                                      post_save,
+                                      pre_delete, )
+from django.dispatch import receiver
+
+from authors.apps.articles.cache import invalidate_article
+from authors.apps.articles.models import (Articles,
+                                          Favorite,
+                                          LikeDislike,
+                                          Ratings,
+                                          TagStats, )
+from authors.apps.profiles.models import Profile
+
+
+@receiver(post_delete, sender=LikeDislike)
+def remove_vote_from_counters(sender, **kwargs):
+    """
+    Keep the like/dislike counters in step with deleted votes,
+    including votes removed by a cascade.
+    """
+    instance = kwargs.get('instance')
+    instance.update_counters(previous_vote=instance.vote, removed=True)
+
+
+@receiver(post_delete, sender=Ratings)
+def remove_rating_from_aggregates(sender, **kwargs):
+    """
+    Keep the rating aggregates of an article in step with deleted ratings
+    """
+    instance = kwargs.get('instance')
+    instance.update_article_aggregates(previous_value=instance.value, removed=True)
+
+
+@receiver(post_delete, sender=Favorite)
+def remove_favorite_from_count(sender, **kwargs):
+    """
+    Keep the favorite count of an article in step with deleted favorites
+    """
+    instance = kwargs.get('instance')
+    Articles.adjust_counters(instance.article_id_id, favorite_count=-1)
+
+
+@receiver(post_save, sender=Articles)
+@receiver(post_delete, sender=Articles)
+def invalidate_cached_article(sender, **kwargs):
+    """
+    Drop the cached payload of an edited or deleted article
+    """
+    invalidate_article(kwargs.get('instance').pk)
+
+
+@receiver(m2m_changed, sender=Articles.tags.through)
+def sync_article_tag_names(sender, **kwargs):
+    """
+    Keep the tag names column of an article in step with its tags
+    """
+    instance = kwargs.get('instance')
+    action = kwargs.get('action')
+    if not isinstance(instance, Articles):
+        return
+    # taggit sends post_add even when every tag was already there
+    if action == 'post_clear' or (action in ('post_add', 'post_remove') and kwargs.get('pk_set')):
+        instance.sync_tag_names()
+
+
+@receiver(m2m_changed, sender=Articles.tags.through)
+def update_tag_stats(sender, **kwargs):
+    """
+    Keep the usage of the tags in step with the tags of an article
+    """
+    instance = kwargs.get('instance')
+    action = kwargs.get('action')
+    if not isinstance(instance, Articles):
+        return
+    if action == 'pre_clear':
+        # post_clear does not say which tags were cleared
+        instance._cleared_tag_ids = list(Articles.tag_ids(instance.pk).values_list('tag_id', flat=True))
+    elif action == 'post_clear':
+        TagStats.untag_article(instance.pk, instance.__dict__.pop('_cleared_tag_ids', []))
+    elif action == 'post_add' and kwargs.get('pk_set'):
+        TagStats.tag_article(instance.pk, kwargs['pk_set'])
+    elif action == 'post_remove' and kwargs.get('pk_set'):
+        TagStats.untag_article(instance.pk, kwargs['pk_set'])
+
+
+@receiver(pre_delete, sender=Articles)
+def remove_article_from_tag_stats(sender, **kwargs):
+    """
+    Stop counting a deleted article for its tags, the tagged items
+    go with the article without any m2m_changed
+    """
+    instance = kwargs.get('instance')
+    TagStats.untag_article(instance.pk, list(Articles.tag_ids(instance.pk).values_list('tag_id', flat=True)))
+
+
+@receiver(m2m_changed, sender=Articles.tags.through)
+def invalidate_cached_article_tags(sender, **kwargs):
+    """
+    Drop the cached payload of an article when its tags change
+    """
+    instance = kwargs.get('instance')
+    if isinstance(instance, Articles):
+        invalidate_article(instance.pk)
+
+
+@receiver(post_save, sender=LikeDislike)
+@receiver(post_delete, sender=LikeDislike)
+def invalidate_cached_article_votes(sender, **kwargs):
+    """
+    Drop the cached payload of an article when its votes change
+    """
+    instance = kwargs.get('instance')
+    if instance.content_type_id == ContentType.objects.get_for_model(Articles).id:
+        invalidate_article(instance.object_id)
+
+
+@receiver(post_save, sender=Ratings)
+@receiver(post_delete, sender=Ratings)
+def invalidate_cached_article_ratings(sender, **kwargs):
+    """
+    Drop the cached payload of an article when its ratings change
+    """
+    invalidate_article(kwargs.get('instance').article_id)
+
+
+@receiver(post_save, sender=Favorite)
+@receiver(post_delete, sender=Favorite)
+def invalidate_cached_article_favorites(sender, **kwargs):
+    """
+    Drop the cached payload of an article when its favoriters change
+    """
+    invalidate_article(kwargs.get('instance').article_id_id)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_cached_author_articles(sender, **kwargs):
+    """
+    Drop the cached payloads of the articles of an author whose
+    profile, embedded in each article, has changed
+    """
+    instance = kwargs.get('instance')
+    article_ids = Articles.objects.filter(author_id=instance.user_id).values_list('id', flat=True)
+    invalidate_article(*article_ids)
@@ -0,0 +1,37 @@
+"""
+Benchmark of article creation as articles with the same title pile up.
+
+Not part of the default test run, run it with
+    python manage.py test authors.apps.articles.tests.bench_slugs
+"""
+import time
+
+from django.test import TestCase
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+
+BATCH = 50
+BATCHES = 8
+
+
+class SlugAllocationBenchmark(TestCase):
+
+    def test_create_latency_stays_flat(self):
+        user = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        timings = []
+        for batch in range(BATCHES):
+            start = time.perf_counter()
+            for _ in range(BATCH):
+                Articles.objects.create(
+                    title='a very popular title', body='body',
+                    description='description', author=user)
+            timings.append((time.perf_counter() - start) / BATCH * 1000)
+
+        print('\nexisting same-title articles -> ms per create')
+        for batch, timing in enumerate(timings):
+            print('{:>6} -> {:.2f}'.format(batch * BATCH, timing))
+
+        # a per-suffix lookup would make the last batch many times slower
+        self.assertLess(timings[-1], timings[0] * 3)
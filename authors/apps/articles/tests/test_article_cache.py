@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import (Articles,
+                                          Favorite,
+                                          LikeDislike,
+                                          Ratings, )
+from authors.apps.articles.serializers import ArticleSerializer
+from authors.apps.authentication.models import User
+
+
+class ArticleDetailCacheTest(TestCase):
+    """Tests for the versioned cache and ETags of the article detail"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.author = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        self.reader = User.objects.create(
+            username='reader', email='reader@mail.com', password='password')
+        self.reader.is_verified = True
+        self.reader.save()
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {self.reader.token}'}
+        self.article = Articles.objects.create(
+            title='cached article', body='body', description='description', author=self.author)
+        self.url = reverse('articles:article', args=[self.article.slug])
+
+    def get(self, **headers):
+        return self.client.get(self.url, **headers)
+
+    def test_shared_payload_is_served_from_the_cache(self):
+        first = self.get()
+        with patch.object(ArticleSerializer, 'get_share_links') as share_links:
+            second = self.get()
+        share_links.assert_not_called()
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first['ETag'], second['ETag'])
+
+    def test_matching_etag_returns_not_modified(self):
+        etag = self.get()['ETag']
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_viewer_flags_are_merged_per_reader(self):
+        self.article.likes.create(user=self.reader, vote=LikeDislike.LIKE)
+        anonymous = self.get()
+        reader = self.get(**self.headers)
+
+        self.assertFalse(anonymous.data['has_liked'])
+        self.assertTrue(reader.data['has_liked'])
+        self.assertEqual(anonymous.data['likes'], reader.data['likes'])
+        self.assertNotEqual(anonymous['ETag'], reader['ETag'])
+
+    def test_writes_invalidate_the_cached_payload(self):
+        writes = [
+            lambda: Articles.objects.get(pk=self.article.pk).save(),
+            lambda: self.article.likes.create(user=self.reader, vote=LikeDislike.LIKE),
+            lambda: Ratings.objects.create(
+                author=self.reader, article=self.article, value=5, review='good'),
+            lambda: Favorite.objects.create(user_id=self.reader, article_id=self.article),
+            lambda: self.article.tags.add('cache'),
+        ]
+        for write in writes:
+            etag = self.get()['ETag']
+            write()
+            response = self.get(HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response['ETag'], etag)
+
+        data = self.get().data
+        self.assertEqual(data['likes'], 1)
+        self.assertEqual(data['rating_count'], 1)
+        self.assertEqual(data['favorites_count'], 1)
+        self.assertEqual(data['tags'], ['cache'])
+
+    def test_author_profile_edit_invalidates_the_cached_payload(self):
+        self.get()
+        profile = self.author.profile
+        profile.bio = 'a new bio'
+        profile.save()
+        self.assertEqual(self.get().data['author']['bio'], 'a new bio')
+
+    def test_missing_article_is_not_found(self):
+        response = self.client.get(reverse('articles:article', args=['missing']))
+        self.assertEqual(response.status_code, 404)
@@ -1,3 +1,7 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
 from rest_framework import status
 from .favorites_base_test import ArticlesBaseTest
 from authors.apps.articles.views import *
@@ -61,4 +65,64 @@ class FavoriteArticleTestCase(ArticlesBaseTest):
                                    **self.header_user1)
         detail = "This article has not been found."
         self.assertEqual(response.data.get('errors'), detail)
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    def create_favoriters(self, count):
+        for index in range(count):
+            user = User.objects.create(
+                username='fan{}'.format(index),
+                email='fan{}@mail.com'.format(index),
+                password='password')
+            Favorite.objects.create(user_id=user, article_id=self.article1)
+
+    def test_favorite_count_follows_favorites(self):
+        """Test the favorite count is stored on the article"""
+        self.client.post(self.favorite_article_url, **self.header_user1)
+        self.client.post(self.favorite_article_url, **self.header_user2)
+        self.article1.refresh_from_db()
+        self.assertEqual(self.article1.favorite_count, 2)
+
+        self.client.delete(self.favorite_article_url, **self.header_user1)
+        self.article1.refresh_from_db()
+        self.assertEqual(self.article1.favorite_count, 1)
+
+    def test_sync_favorite_counts_reconciles_drift(self):
+        """Test the command reports and fixes drifted favorite counts"""
+        self.create_favoriters(2)
+        Articles.objects.filter(pk=self.article1.pk).update(favorite_count=5)
+
+        out = StringIO()
+        call_command('sync_favorite_counts', '--check', stdout=out)
+        self.assertIn('Articles {}: favorite_count=2'.format(self.article1.pk), out.getvalue())
+        self.assertIn('1 article(s) with drifted favorite counts', out.getvalue())
+
+        call_command('sync_favorite_counts', stdout=StringIO())
+        self.article1.refresh_from_db()
+        self.assertEqual(self.article1.favorite_count, 2)
+
+    def test_inline_favoriters_are_capped(self):
+        """Test the article only inlines the latest favoriters"""
+        self.create_favoriters(Articles.FAVORITERS_PREVIEW + 2)
+        response = self.client.get(
+            '/api/articles/{}/'.format(self.article1.slug), **self.header_user1)
+        article = response.data
+        self.assertEqual(article['favorites_count'], Articles.FAVORITERS_PREVIEW + 2)
+        self.assertEqual(len(article['favorited']), Articles.FAVORITERS_PREVIEW)
+        self.assertEqual(article['favorited'][0], 'fan{}'.format(Articles.FAVORITERS_PREVIEW + 1))
+
+        listed = Articles.objects.for_listing().get(pk=self.article1.pk)
+        self.assertEqual(listed.favoriters, article['favorited'])
+
+    def test_list_favoriters(self):
+        """Test the favoriters of an article are paginated"""
+        self.create_favoriters(3)
+        url = reverse('articles:favoriters', args=[self.article1.slug])
+        response = self.client.get(url, {'limit': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(response.data['results'], ['fan2', 'fan1'])
+
+        response = self.client.get(url, {'limit': 2, 'offset': 2})
+        self.assertEqual(response.data['results'], ['fan0'])
+
+        response = self.client.get(reverse('articles:favoriters', args=['invalid-slug']))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,67 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import (Articles,
+                                          Favorite, )
+from authors.apps.authentication.models import User
+
+
+class ArticleListQueryCountTest(TestCase):
+    """The article list endpoints take a fixed number of queries per page"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.reader = User.objects.create(
+            username='reader', email='reader@mail.com', password='password')
+        self.reader.is_verified = True
+        self.reader.save()
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {self.reader.token}'}
+        self.writers = 0
+
+    def create_articles(self, count):
+        for _ in range(count):
+            self.writers += 1
+            writer = User.objects.create(
+                username='writer{}'.format(self.writers),
+                email='writer{}@mail.com'.format(self.writers),
+                password='password')
+            article = Articles.objects.create(
+                title='article {}'.format(self.writers),
+                body='body',
+                description='description',
+                author=writer
+            )
+            article.tags.add('django', 'queries')
+            Favorite.objects.create(user_id=self.reader, article_id=article)
+
+    def count_queries(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params, **self.headers)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assertConstantQueries(self, url, **params):
+        self.create_articles(2)
+        few = self.count_queries(url, **params)
+        self.create_articles(5)
+        many = self.count_queries(url, **params)
+        self.assertEqual(few, many)
+
+    def test_article_list_queries_are_constant(self):
+        self.assertConstantQueries(reverse('articles:articles'))
+
+    def test_search_queries_are_constant(self):
+        self.assertConstantQueries(reverse('articles:search'), tags='django')
+
+    def test_favorites_queries_are_constant(self):
+        self.assertConstantQueries(reverse('articles:get_favorites'))
+
+    def test_author_is_embedded_from_the_article_query(self):
+        self.create_articles(1)
+        article = Articles.objects.with_author().get()
+        with self.assertNumQueries(0):
+            author = article.get_author()
+        self.assertEqual(author['username'], 'writer1')
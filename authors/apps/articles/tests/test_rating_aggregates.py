@@ -0,0 +1,117 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import (Articles,
+                                          Ratings, )
+from authors.apps.authentication.models import User
+
+
+class RatingAggregatesTest(TestCase):
+    """Tests for the rating aggregates stored on articles"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.author = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        self.readers = []
+        for index in range(3):
+            reader = User.objects.create(
+                username='reader{}'.format(index),
+                email='reader{}@mail.com'.format(index),
+                password='password')
+            reader.is_verified = True
+            reader.save()
+            self.readers.append(reader)
+        self.article = Articles.objects.create(
+            title='rate me',
+            body='please',
+            description='ratings',
+            author=self.author
+        )
+
+    def headers(self, user):
+        return {'HTTP_AUTHORIZATION': f'Bearer {user.token}'}
+
+    def rate(self, user, value):
+        return self.client.post(
+            reverse('articles:ratings-list', args=[self.article.slug]),
+            {'rating': {'value': value, 'review': 'my review'}},
+            format='json',
+            **self.headers(user)
+        )
+
+    def test_new_and_updated_ratings_move_aggregates(self):
+        self.rate(self.readers[0], 5)
+        self.rate(self.readers[1], 3)
+        # rating again goes through update_or_create
+        self.rate(self.readers[1], 4)
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.rating_count, 2)
+        self.assertEqual(self.article.rating_sum, 9)
+        self.assertEqual(self.article.rating_histogram, {1: 0, 2: 0, 3: 0, 4: 1, 5: 1})
+        self.assertEqual(self.article.average_rating, 4.5)
+        self.assertAlmostEqual(self.article.bayesian_rating, (5 * 3.0 + 9) / (5 + 2))
+
+    def test_edit_and_delete_move_aggregates(self):
+        self.rate(self.readers[0], 2)
+        rating = Ratings.objects.get(author=self.readers[0])
+
+        self.client.put(
+            reverse('articles:rating-detail', args=[rating.pk]),
+            {'value': 5, 'review': 'changed my mind'},
+            format='json',
+            **self.headers(self.readers[0])
+        )
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.rating_histogram, {1: 0, 2: 0, 3: 0, 4: 0, 5: 1})
+        self.assertEqual(self.article.average_rating, 5)
+
+        self.client.delete(
+            reverse('articles:rating-detail', args=[rating.pk]),
+            **self.headers(self.readers[0])
+        )
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.rating_count, 0)
+        self.assertEqual(self.article.rating_sum, 0)
+        self.assertEqual(self.article.average_rating, 0)
+        self.assertEqual(self.article.bayesian_rating, Articles.RATING_PRIOR_MEAN)
+
+    def test_average_rating_is_read_from_the_article(self):
+        self.rate(self.readers[0], 4)
+        article = Articles.objects.get(pk=self.article.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(article.get_average_rating(), 4)
+
+    def test_articles_can_be_sorted_by_bayesian_rating(self):
+        other = Articles.objects.create(
+            title='rated often', body='body', description='d', author=self.author)
+        # a single 5 star rating
+        self.rate(self.readers[0], 5)
+        # many 4 star ratings
+        for reader in self.readers:
+            Ratings.objects.create(author=reader, article=other, value=4)
+
+        response = self.client.get(reverse('articles:articles'), {'sort': 'top_rated'})
+        slugs = [article['slug'] for article in response.data['results']]
+        self.assertEqual(slugs, [other.slug, self.article.slug])
+
+    def test_sync_rating_aggregates_reconciles_drift(self):
+        self.rate(self.readers[0], 3)
+        Articles.objects.filter(pk=self.article.pk).update(
+            rating_count=7, rating_sum=1, average_rating=0)
+
+        out = StringIO()
+        call_command('sync_rating_aggregates', '--check', stdout=out)
+        self.assertIn('1 article(s) with drifted rating aggregates', out.getvalue())
+
+        call_command('sync_rating_aggregates', stdout=StringIO())
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.rating_count, 1)
+        self.assertEqual(self.article.rating_sum, 3)
+        self.assertEqual(self.article.rating_3_count, 1)
+        self.assertEqual(self.article.average_rating, 3)
@@ -233,3 +233,32 @@ class RatingsviewsTest(TestCase):
         article = rating1[2]
         avg = article.get_average_rating()
         self.assertEqual(avg, 1)
+
+    def test_get_ratings_is_scoped_to_the_article(self):
+        """ test whether the ratings, their count and histogram only cover the requested article. """
+        rating, slug, article = self.create_rating()
+        other = self.create_article()
+        Ratings.objects.create(value=4, review='another song', author=self.user2, article=other)
+        Ratings.objects.create(value=5, review='a third song', author=self.user2, article=article)
+
+        response = self.client.get(ratings_url(slug), **self.headers, format='json')
+        data = response.data
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(data['RatingsCount'], 2)
+        self.assertEqual(data['histogram'], {1: 1, 2: 0, 3: 0, 4: 0, 5: 1})
+        self.assertEqual({item['slug'] for item in data['data']}, {slug})
+
+    def test_get_ratings_is_paginated(self):
+        """ test whether the ratings are listed a page at a time in constant queries. """
+        rating, slug, article = self.create_rating()
+        for index in range(3):
+            user = User.objects.create(
+                username='rater{}'.format(index), email='rater{}@mail.com'.format(index))
+            Ratings.objects.create(value=3, review='ok', author=user, article=article)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(ratings_url(slug), {'limit': 2}, format='json')
+        self.assertEqual(len(response.data['data']), 2)
+        self.assertEqual(response.data['RatingsCount'], 4)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+
+
+class UniqueSlugTest(TestCase):
+    """Tests for the allocation of unique article slugs"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+
+    def create_article(self, title='the same title', **kwargs):
+        return Articles.objects.create(
+            title=title, body='body', description='description', author=self.user, **kwargs)
+
+    def test_duplicate_titles_get_the_next_suffix(self):
+        slugs = [self.create_article().slug for _ in range(3)]
+        self.assertEqual(slugs, ['the-same-title', 'the-same-title-1', 'the-same-title-2'])
+
+        # suffixes are never reused after a delete
+        Articles.objects.filter(slug='the-same-title-1').delete()
+        self.assertEqual(self.create_article().slug, 'the-same-title-3')
+
+    def test_other_titles_sharing_the_prefix_are_ignored(self):
+        self.create_article()
+        self.create_article(title='the same title again')
+        self.create_article(title='the same title again 2')
+        self.assertEqual(self.create_article().slug, 'the-same-title-1')
+
+    def test_titles_ending_in_a_number_take_that_suffix(self):
+        self.create_article()
+        self.create_article(title='the same title 7')
+        self.assertEqual(self.create_article().slug, 'the-same-title-8')
+
+    def test_article_keeps_its_slug_when_the_title_is_unchanged(self):
+        article = self.create_article()
+        self.create_article()
+        self.assertEqual(article.get_unique_slug(), 'the-same-title')
+
+        article.title = 'a new title'
+        self.assertEqual(article.get_unique_slug(), 'a-new-title')
+
+    def test_allocation_takes_one_query_however_many_duplicates(self):
+        self.create_article()
+        with self.assertNumQueries(1):
+            Articles(title='the same title').get_unique_slug()
+
+        for _ in range(20):
+            self.create_article()
+        with self.assertNumQueries(1):
+            slug = Articles(title='the same title').get_unique_slug()
+        self.assertEqual(slug, 'the-same-title-21')
+
+    def test_a_slug_taken_concurrently_is_reallocated(self):
+        self.create_article()
+        allocate = Articles.get_unique_slug
+        calls = []
+
+        def stale_then_fresh(article):
+            # the first allocation answers as if the other insert had not happened yet
+            calls.append(article)
+            return 'the-same-title' if len(calls) == 1 else allocate(article)
+
+        with patch.object(Articles, 'get_unique_slug', stale_then_fresh):
+            article = self.create_article()
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(article.slug, 'the-same-title-1')
@@ -0,0 +1,114 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.articles.models import Articles
+from authors.apps.articles.serializers import ArticleSerializer
+from authors.apps.authentication.models import User
+
+
+class TagNamesTest(TestCase):
+    """Tests for the denormalized tag names of articles"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        self.article = Articles.objects.create(
+            title='tagged', body='body', description='description', author=self.user)
+
+    def stored_names(self):
+        return Articles.objects.get(pk=self.article.pk).tag_names
+
+    def test_names_follow_tag_changes(self):
+        self.article.tags.add('Python', 'django')
+        self.assertEqual(self.article.tag_names, ['django', 'python'])
+        self.assertEqual(self.stored_names(), ['django', 'python'])
+
+        self.article.tags.remove('django')
+        self.assertEqual(self.stored_names(), ['python'])
+        self.article.tags.set('web', 'api')
+        self.assertEqual(self.stored_names(), ['api', 'web'])
+        self.article.tags.clear()
+        self.assertEqual(self.stored_names(), [])
+
+    def test_adding_present_tags_skips_the_rebuild(self):
+        self.article.tags.add('python')
+        # taggit's own lookups only, no UPDATE of the names
+        with self.assertNumQueries(3):
+            self.article.tags.add('python')
+
+    def test_saving_the_article_keeps_the_names(self):
+        self.article.tags.add('python')
+        self.article.title = 'retitled'
+        self.article.save()
+        self.assertEqual(self.stored_names(), ['python'])
+
+    def test_tags_are_serialized_from_the_column(self):
+        self.article.tags.add('python', 'web')
+        article = Articles.objects.get(pk=self.article.pk)
+        with self.assertNumQueries(0):
+            tags = ArticleSerializer().fields['tags'].to_representation(
+                ArticleSerializer().fields['tags'].get_attribute(article))
+        self.assertEqual(list(tags), ['python', 'web'])
+
+    def test_backfill_command_rebuilds_the_names(self):
+        self.article.tags.add('python')
+        Articles.objects.update(tag_names=[])
+        out = StringIO()
+        call_command('backfill_tag_names', '--missing', stdout=out)
+        self.assertIn('1 article(s)', out.getvalue())
+        self.assertEqual(self.stored_names(), ['python'])
+
+
+class TagUpdateTest(TestCase):
+    """Tests for the tag edits of the article serializer"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username='editor', email='editor@mail.com', password='password')
+        self.article = ArticleSerializer().create({
+            'title': 'edited', 'body': 'body', 'description': 'description',
+            'author': self.user, 'tags': ['Python', 'django'],
+        })
+
+    def update(self, **data):
+        serializer = ArticleSerializer(self.article, data=data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Articles.objects.get(pk=self.article.pk)
+
+    def test_tags_replace_the_current_ones(self):
+        article = self.update(tags=['django', 'web'])
+        self.assertEqual(article.tag_names, ['django', 'web'])
+        self.assertEqual(sorted(article.tags.names()), ['django', 'web'])
+
+    def test_add_and_remove_tags(self):
+        self.assertEqual(self.update(add_tags=['web']).tag_names, ['django', 'python', 'web'])
+        self.assertEqual(self.update(remove_tags=['python', 'absent']).tag_names, ['django', 'web'])
+        article = self.update(add_tags=['api'], remove_tags=['django'])
+        self.assertEqual(article.tag_names, ['api', 'web'])
+        self.assertEqual(sorted(article.tags.names()), ['api', 'web'])
+
+    def tag_queries(self, **data):
+        """The statements on the tags of an update"""
+        with CaptureQueriesContext(connection) as queries:
+            self.update(**data)
+        return [query['sql'].split(' ')[0] for query in queries.captured_queries
+                if 'taggit_' in query['sql']]
+
+    def test_unchanged_tags_are_not_written(self):
+        with self.assertNumQueries(0):
+            self.assertFalse(self.article.update_tags(add=['python'], remove=['absent']))
+        self.assertEqual(self.tag_queries(tags=['DJANGO', 'python'], body='autosaved'), [])
+        self.assertEqual(self.tag_queries(add_tags=['django'], remove_tags=['web']), [])
+
+    def test_tag_changes_are_bulk_writes(self):
+        statements = self.tag_queries(tags=['python', 'web', 'api'])
+        self.assertEqual(statements.count('DELETE'), 1)
+        self.assertEqual(statements.count('INSERT'), 3)
+        # the two new tags, then all the tagged items at once
+        statements = self.tag_queries(add_tags=['one', 'two'])
+        self.assertEqual(statements.count('INSERT'), 3)
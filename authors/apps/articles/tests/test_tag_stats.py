@@ -0,0 +1,137 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import (Articles,
+                                          LikeDislike,
+                                          TagStats, )
+from authors.apps.authentication.models import User
+
+TAGS_URL = reverse('articles:tags')
+
+
+class TagStatsTest(TestCase):
+    """Tests for the usage statistics of the tags"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create(
+            username='tagger', email='tagger@mail.com', password='password')
+        self.first = self.create_article('first')
+        self.second = self.create_article('second')
+
+    def create_article(self, title):
+        return Articles.objects.create(
+            title=title, body='body', description='description', author=self.user)
+
+    def stats(self):
+        return {
+            stats.name: (stats.article_count, stats.like_count)
+            for stats in TagStats.objects.all()
+        }
+
+    def list_tags(self, **params):
+        response = self.client.get(TAGS_URL, params)
+        return [tag['name'] for tag in json.loads(response.content)['tags']]
+
+    def test_stats_follow_tag_changes(self):
+        self.first.tags.add('Python', 'django')
+        self.second.tags.add('python')
+        self.assertEqual(self.stats(), {'python': (2, 0), 'django': (1, 0)})
+
+        self.first.tags.set('web', 'django')
+        self.assertEqual(self.stats(), {'python': (1, 0), 'django': (1, 0), 'web': (1, 0)})
+        self.second.tags.clear()
+        self.assertEqual(self.stats()['python'], (0, 0))
+
+    def test_adding_present_tags_keeps_the_counts(self):
+        self.first.tags.add('python')
+        self.first.tags.add('python')
+        self.assertEqual(self.stats(), {'python': (1, 0)})
+
+    def test_likes_count_for_the_tags(self):
+        self.first.tags.add('python', 'django')
+        self.first.likes.create(user=self.user, vote=LikeDislike.LIKE)
+        self.assertEqual(self.stats(), {'python': (1, 1), 'django': (1, 1)})
+
+        # a liked article brings its likes along
+        self.second.likes.create(user=self.user, vote=LikeDislike.LIKE)
+        self.second.tags.add('python')
+        self.assertEqual(self.stats()['python'], (2, 2))
+
+        self.first.tags.remove('python')
+        self.assertEqual(self.stats()['python'], (1, 1))
+        self.first.likes.all().delete()
+        self.assertEqual(self.stats()['django'], (1, 0))
+
+    def test_deleted_article_is_no_longer_counted(self):
+        self.first.tags.add('python')
+        self.first.likes.create(user=self.user, vote=LikeDislike.LIKE)
+        self.first.delete()
+        self.assertEqual(self.stats(), {'python': (0, 0)})
+
+    def test_endpoint_lists_top_tags_and_prefixes(self):
+        self.first.tags.add('python', 'django', 'pytest')
+        self.second.tags.add('python', 'pytest')
+        self.create_article('third').tags.add('python')
+
+        self.assertEqual(self.list_tags(), ['python', 'pytest', 'django'])
+        self.assertEqual(self.list_tags(limit=2), ['python', 'pytest'])
+        self.assertEqual(self.list_tags(prefix='PY'), ['python', 'pytest'])
+        self.assertEqual(self.list_tags(prefix='dj'), ['django'])
+
+    def test_endpoint_lists_recent_tags(self):
+        # by the newest tagged article, not by the time of the tagging
+        self.second.tags.add('new')
+        self.first.tags.add('old')
+        self.assertEqual(self.list_tags(sort='recent'), ['new', 'old'])
+        self.first.tags.add('new')
+        self.assertEqual(TagStats.objects.get(name='new').last_used_at, self.second.created_at)
+
+    def test_untagging_falls_back_to_the_newest_remaining_article(self):
+        self.first.tags.add('python')
+        self.second.tags.add('python')
+        self.second.tags.remove('python')
+        self.assertEqual(TagStats.objects.get(name='python').last_used_at, self.first.created_at)
+
+        self.second.tags.add('python')
+        self.second.delete()
+        self.assertEqual(TagStats.objects.get(name='python').last_used_at, self.first.created_at)
+        self.first.tags.clear()
+        self.assertIsNone(TagStats.objects.get(name='python').last_used_at)
+
+    def test_unused_tags_are_not_listed(self):
+        self.first.tags.add('python', 'gone')
+        self.first.tags.remove('gone')
+        self.assertEqual(self.list_tags(), ['python'])
+
+    def test_endpoint_is_one_query(self):
+        self.first.tags.add('python')
+        with self.assertNumQueries(1):
+            self.client.get(TAGS_URL, {'prefix': 'py'})
+
+    def test_command_rebuilds_the_stats(self):
+        self.first.tags.add('python', 'django')
+        self.second.tags.add('python')
+        Articles.objects.filter(pk=self.first.pk).update(like_count=3)
+        TagStats.objects.all().delete()
+
+        out = StringIO()
+        call_command('refresh_tag_stats', stdout=out)
+        self.assertEqual(self.stats(), {'python': (2, 3), 'django': (1, 3)})
+        self.assertEqual(TagStats.objects.get(name='python').last_used_at, self.second.created_at)
+        self.assertIn('2 tag(s)', out.getvalue())
+
+    def test_command_only_adds_missing_stats(self):
+        self.first.tags.add('python', 'django')
+        TagStats.objects.filter(name='django').delete()
+        TagStats.objects.filter(name='python').update(article_count=5)
+
+        out = StringIO()
+        call_command('refresh_tag_stats', '--missing', stdout=out)
+        self.assertEqual(self.stats(), {'python': (5, 0), 'django': (1, 0)})
+        self.assertIn('1 tag(s)', out.getvalue())
@@ -0,0 +1,68 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from authors.apps.articles.models import Articles
+from authors.apps.articles.serializers import ArticleSerializer
+from authors.apps.authentication.models import User
+
+
+class ArticleTextStatsTest(TestCase):
+    """Tests for the read time and text statistics stored on articles"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="user",
+            email="user@mail.com",
+            password="Pa@bbgbh"
+        )
+        self.article = Articles.objects.create(
+            author=self.user,
+            title="the 3 musketeers",
+            body="<p>all for one</p><p>and one for all</p><img src='swords.png'>",
+            description="not written by me"
+        )
+
+    def test_stats_are_computed_on_create(self):
+        self.assertEqual(self.article.word_count, 7)
+        self.assertEqual(self.article.image_count, 1)
+        self.assertEqual(self.article.read_time, 1)
+        self.assertIn('all for one', self.article.excerpt)
+
+    def test_body_is_not_parsed_again_when_unchanged(self):
+        article = Articles.objects.get(pk=self.article.pk)
+        with patch('authors.apps.articles.models.article_text_stats') as stats:
+            article.title = 'twenty years after'
+            article.save()
+        stats.assert_not_called()
+
+    def test_stats_follow_body_edits(self):
+        article = Articles.objects.get(pk=self.article.pk)
+        article.body = ' '.join(['word'] * 600)
+        article.save()
+
+        article.refresh_from_db()
+        self.assertEqual(article.word_count, 600)
+        self.assertEqual(article.image_count, 0)
+        self.assertEqual(article.read_time, 3)
+
+    def test_serializer_reads_stored_read_time(self):
+        with patch('authors.apps.articles.models.article_text_stats') as stats:
+            data = ArticleSerializer(Articles.objects.get(pk=self.article.pk)).data
+        stats.assert_not_called()
+        self.assertEqual(data['read_time'], '1 min read')
+        self.assertEqual(data['word_count'], 7)
+
+    def test_backfill_command_fills_missing_stats(self):
+        Articles.objects.filter(pk=self.article.pk).update(
+            word_count=0, image_count=0, excerpt='')
+
+        out = StringIO()
+        call_command('backfill_article_stats', '--missing', '--chunk-size', '1', stdout=out)
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.word_count, 7)
+        self.assertEqual(self.article.image_count, 1)
+        self.assertIn('1 article(s)', out.getvalue())
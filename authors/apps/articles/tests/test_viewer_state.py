@@ -0,0 +1,64 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.loaders import ArticleViewerState
+from authors.apps.articles.models import (Articles,
+                                          Favorite,
+                                          LikeDislike,
+                                          Ratings, )
+from authors.apps.authentication.models import User
+from authors.apps.bookmarks.models import Bookmark
+
+
+class ArticleViewerStateTest(TestCase):
+    """Tests for the batched has_liked/has_rating/... resolution"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.author = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        self.reader = User.objects.create(
+            username='reader', email='reader@mail.com', password='password')
+        self.reader.is_verified = True
+        self.reader.save()
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {self.reader.token}'}
+        self.articles = [
+            Articles.objects.create(
+                title='article {}'.format(number),
+                body='body',
+                description='description',
+                author=self.author
+            ) for number in range(5)
+        ]
+
+    def test_loader_runs_fixed_number_of_queries(self):
+        # votes, ratings, favorites and bookmarks: one query each
+        with self.assertNumQueries(4):
+            ArticleViewerState.load(self.reader, self.articles[:1])
+        with self.assertNumQueries(4):
+            ArticleViewerState.load(self.reader, self.articles)
+
+    def test_anonymous_reader_costs_no_queries(self):
+        with self.assertNumQueries(0):
+            state = ArticleViewerState.load(None, self.articles)
+        self.assertIsNone(state.vote(self.articles[0]))
+
+    def test_list_endpoint_reports_viewer_flags(self):
+        liked, rated = self.articles[0], self.articles[1]
+        liked.likes.create(user=self.reader, vote=LikeDislike.LIKE)
+        Ratings.objects.create(author=self.reader, article=rated, value=4, review='good')
+        Favorite.objects.create(user_id=self.reader, article_id=rated)
+        Bookmark.objects.create(profile=self.reader.profile, article=liked)
+
+        response = self.client.get(reverse('articles:articles'), **self.headers)
+        results = {article['slug']: article for article in response.data['results']}
+
+        self.assertTrue(results[liked.slug]['has_liked'])
+        self.assertFalse(results[liked.slug]['has_disliked'])
+        self.assertTrue(results[liked.slug]['has_bookmarked'])
+        self.assertFalse(results[liked.slug]['has_rating'])
+        self.assertTrue(results[rated.slug]['has_rating'])
+        self.assertTrue(results[rated.slug]['has_favorited'])
+        self.assertEqual(results[rated.slug]['auth_user_rating']['value'], 4)
+        self.assertEqual(results[self.articles[2].slug]['auth_user_rating'], {})
@@ -0,0 +1,167 @@
+import threading
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import (TestCase,
+                         TransactionTestCase, )
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import (Articles,
+                                          LikeDislike, )
+from authors.apps.authentication.models import User
+from authors.apps.comments.models import Comment
+
+
+class VoteCountersTest(TestCase):
+    """Tests for the denormalized like/dislike counters"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create(
+            username='voter', email='voter@mail.com', password='password')
+        self.user.is_verified = True
+        self.user.save()
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {self.user.token}'}
+        self.article = Articles.objects.create(
+            title='counting votes',
+            body='one by one',
+            description='counters',
+            author=self.user
+        )
+
+    def counts(self, obj):
+        obj.refresh_from_db()
+        return obj.like_count, obj.dislike_count
+
+    def test_like_flip_and_unlike_move_counters(self):
+        like_url = reverse('articles:article_like', args=[self.article.slug])
+        dislike_url = reverse('articles:article_dislike', args=[self.article.slug])
+
+        self.client.post(like_url, **self.headers)
+        self.assertEqual(self.counts(self.article), (1, 0))
+
+        res = self.client.post(dislike_url, **self.headers)
+        self.assertEqual(self.counts(self.article), (0, 1))
+        self.assertEqual(res.data['dislike_count'], 1)
+        self.assertEqual(res.data['like_count'], 0)
+
+        self.client.post(dislike_url, **self.headers)
+        self.assertEqual(self.counts(self.article), (0, 0))
+
+    def test_article_save_does_not_overwrite_counters(self):
+        stale = Articles.objects.get(pk=self.article.pk)
+        self.article.likes.create(user=self.user, vote=LikeDislike.LIKE)
+
+        stale.title = 'a new title'
+        stale.save()
+
+        self.assertEqual(self.counts(self.article), (1, 0))
+
+    def test_article_save_does_not_overwrite_tag_names(self):
+        stale = Articles.objects.get(pk=self.article.pk)
+        Articles.objects.get(pk=self.article.pk).tags.add('python')
+
+        stale.title = 'a new title'
+        stale.save()
+
+        article = Articles.objects.get(pk=self.article.pk)
+        self.assertEqual(list(article.tags.names()), ['python'])
+        self.assertEqual(article.tag_names, ['python'])
+
+    def test_comment_counters_follow_votes(self):
+        comment = Comment.objects.create(
+            article=self.article, author=self.user, body='nice')
+        vote = comment.likes.create(user=self.user, vote=LikeDislike.DISLIKE)
+        self.assertEqual(self.counts(comment), (0, 1))
+
+        vote.delete()
+        self.assertEqual(self.counts(comment), (0, 0))
+
+    def test_sync_vote_counts_reconciles_drift(self):
+        LikeDislike.objects.create(
+            content_type=ContentType.objects.get_for_model(Articles),
+            object_id=self.article.id, user=self.user, vote=LikeDislike.LIKE)
+        Articles.objects.filter(pk=self.article.pk).update(like_count=7, dislike_count=3)
+
+        out = StringIO()
+        call_command('sync_vote_counts', '--check', stdout=out)
+        self.assertIn('1 object(s) with drifted vote counters', out.getvalue())
+        self.assertEqual(self.counts(self.article), (7, 3))
+
+        call_command('sync_vote_counts', stdout=StringIO())
+        self.assertEqual(self.counts(self.article), (1, 0))
+
+    def test_dedupe_votes_stops_once_votes_are_unique(self):
+        out = StringIO()
+        call_command('dedupe_votes', stdout=out)
+        self.assertIn('Votes are already unique', out.getvalue())
+
+
+class VoteToggleTest(TransactionTestCase):
+    """Tests for the vote toggle under concurrent requests"""
+    threads = 8
+    toggles = 5
+
+    def setUp(self):
+        self.author = User.objects.create(
+            username='author', email='author@mail.com', password='password')
+        self.article = Articles.objects.create(
+            title='hammered', body='body', description='description', author=self.author)
+        self.voters = [
+            User.objects.create(username=f'voter{number}', email=f'voter{number}@mail.com',
+                                password='password')
+            for number in range(self.threads)
+        ]
+
+    def hammer(self, voters, votes):
+        """Toggle the votes of `voters`, each from its own thread and connection"""
+        barrier = threading.Barrier(len(voters))
+        errors = []
+
+        def toggle(voter):
+            try:
+                barrier.wait()
+                for vote in votes:
+                    LikeDislike.toggle(self.article, voter, vote)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=toggle, args=(voter,)) for voter in voters]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(errors, [])
+
+    def assert_counters_match_votes(self):
+        votes = LikeDislike.objects.filter(object_id=self.article.pk)
+        self.article.refresh_from_db()
+        self.assertEqual(
+            (self.article.like_count, self.article.dislike_count),
+            (votes.filter(vote=LikeDislike.LIKE).count(), votes.filter(vote=LikeDislike.DISLIKE).count()),
+        )
+
+    def test_toggle_casts_flips_and_takes_back(self):
+        voter = self.voters[0]
+        self.assertEqual(LikeDislike.toggle(self.article, voter, LikeDislike.LIKE)[1], 'created')
+        self.assertEqual(LikeDislike.toggle(self.article, voter, LikeDislike.DISLIKE)[1], 'flipped')
+        self.assertEqual((self.article.like_count, self.article.dislike_count), (0, 1))
+        self.assertEqual(LikeDislike.toggle(self.article, voter, LikeDislike.DISLIKE)[1], 'removed')
+        self.assertEqual((self.article.like_count, self.article.dislike_count), (0, 0))
+        self.assertFalse(LikeDislike.objects.exists())
+
+    def test_many_voters_at_once(self):
+        self.hammer(self.voters, [LikeDislike.LIKE, LikeDislike.DISLIKE, LikeDislike.LIKE])
+        self.assertEqual(LikeDislike.objects.filter(vote=LikeDislike.LIKE).count(), self.threads)
+        self.assert_counters_match_votes()
+
+    def test_one_voter_double_clicking(self):
+        # the same user from every thread, at most one vote survives
+        self.hammer([self.voters[0]] * self.threads, [LikeDislike.LIKE] * self.toggles)
+        self.assertLessEqual(LikeDislike.objects.filter(user=self.voters[0]).count(), 1)
+        self.assert_counters_match_votes()
@@ -5,13 +5,15 @@ from authors.apps.articles.views import (
     RetrieveUpdateDeleteArticleAPIView,
     LikesView,
     FavoriteView,
+    ArticleFavoritersView,
     GetUserFavoritesView,
     CreateListRatingsAPIView,
     RetrieveUpdateDeleteRatingAPIView,
     CreateListReportsAPIView,
     RetrieveUpdateDeleteReportAPIView,
     ListReportsAPIView,
-    CreateListAuthorsAPIView
+    CreateListAuthorsAPIView,
+    TagStatsListAPIView,
 )
 from authors.apps.search.views import SearchArticleListAPIView
 from .models import Articles, LikeDislike
@@ -36,6 +38,8 @@ urlpatterns = [
          name='article_dislike'),
     path('articles/favorites/me/', GetUserFavoritesView.as_view(), name="get_favorites"),
     path('articles/<slug:slug>/favorite/', FavoriteView.as_view(), name="favorite"),
+    path('articles/<slug:slug>/favoriters/', ArticleFavoritersView.as_view(), name="favoriters"),
+    path('tags/', TagStatsListAPIView.as_view(), name='tags'),
     path('reports/articles/',
          ListReportsAPIView.as_view(), name='reports'),
     path('articles/<slug:slug>/reports/',
@@ -1,6 +1,16 @@
+import re
+
+from django.utils.text import Truncator
+from pyquery import PyQuery
+from readtime.utils import (parse_html,
+                            read_time_as_seconds, )
 from rest_framework import serializers
+
 # from collections import OrderedDict
 
+EXCERPT_LENGTH = 200
+WORD_DELIMITER = re.compile(r'\W+')
+
 class ChoicesField(serializers.Field):
     """Custom ChoiceField serializer field."""
 
@@ -18,4 +28,33 @@ class ChoicesField(serializers.Field):
         for i in self._choices:
             if i == data.lower():
                 return i
-        raise serializers.ValidationError("Acceptable values are {0}.".format(self._choices))
\ No newline at end of file
+        raise serializers.ValidationError("Acceptable values are {0}.".format(self._choices))
+
+
+def article_text_stats(body):
+    """
+    Parse an article body once and return the statistics stored on the article
+
+    Params
+    -------
+    body: HTML (or plain text) body of an article
+
+    Returns
+    --------
+    dict with the read time in minutes, word count, image count
+    and a plain text excerpt of the body
+    """
+    element = PyQuery(body or '')
+    _, images = parse_html(element)
+    # PyQuery separates block elements e.g paragraphs with whitespace
+    text = ' '.join(element.text().split())
+    # read time (seconds) = num_words / 265 * 60 + img_weight * num_images
+    seconds = read_time_as_seconds(text, images=images)
+
+    return {
+        # Medium's formula has a minimum of 1 min read time
+        'read_time': max(1, -(-seconds // 60)),
+        'word_count': len([word for word in WORD_DELIMITER.split(text) if word]),
+        'image_count': images,
+        'excerpt': Truncator(text).chars(EXCERPT_LENGTH),
+    }
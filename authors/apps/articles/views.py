@@ -1,15 +1,22 @@
-from django.contrib.contenttypes.models import ContentType
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import (generics,
                             status, )
 from rest_framework.generics import (RetrieveUpdateAPIView,
                                      ListAPIView, )
 from rest_framework.pagination import LimitOffsetPagination
-from rest_framework.permissions import (IsAuthenticatedOrReadOnly,
+from rest_framework.permissions import (AllowAny,
+                                        IsAuthenticatedOrReadOnly,
                                         IsAuthenticated, )
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from authors.apps.articles.cache import (article_etag,
+                                         article_version,
+                                         get_payload,
+                                         set_payload, )
 from authors.apps.articles.exceptions import (ArticleNotFound,
                                               RatingNotFound,
                                               ReportNotFound,
@@ -17,7 +24,8 @@ from authors.apps.articles.exceptions import (ArticleNotFound,
 from authors.apps.articles.models import (Articles,
                                           Favorite,
                                           Ratings,
-                                          ReportArticles, )
+                                          ReportArticles,
+                                          TagStats, )
 from authors.apps.articles.permissions import (IsOwnerOrReadOnly,
                                                IsVerified, )
 from authors.apps.articles.renderers import (ArticleJSONRenderer,
@@ -26,11 +34,13 @@ from authors.apps.articles.renderers import (ArticleJSONRenderer,
 from authors.apps.articles.response_messages import ERROR_MESSAGES
 from authors.apps.articles.serializers import (ArticleSerializer,
                                                RatingsSerializer,
-                                               ReportsSerializer, )
+                                               ReportsSerializer,
+                                               TagStatsSerializer, )
 from authors.apps.authentication.models import User
 from authors.apps.authentication.permissions import IsVerifiedUser
 from authors.apps.authentication.serializers import UserSerializer
 from authors.apps.comments.models import Comment
+from authors.apps.core.pagination import KeysetPagination
 from authors.apps.core.utils import send_notifications
 from .models import LikeDislike
 from .serializers import FavoriteSerializer
@@ -46,11 +56,21 @@ class CreateArticlesAPIView(APIView):
     permission_classes = (IsAuthenticatedOrReadOnly, IsVerifiedUser,)
     serializer_class = ArticleSerializer
     renderer_classes = (ArticleJSONRenderer,)
-    pagination_class = LimitOffsetPagination
+    pagination_class = KeysetPagination
+    # ?sort=top_rated ranks articles by their Bayesian rating
+    sort_orderings = {
+        'top_rated': ('-bayesian_rating', '-rating_count', '-created_at'),
+    }
 
     def get(self, request, format=None):
-        articles = Articles.objects.all()
-        paginator = self.pagination_class()
+        articles = Articles.objects.for_listing()
+        ordering = self.sort_orderings.get(request.query_params.get('sort'))
+        if ordering:
+            articles = articles.order_by(*ordering)
+            # rankings are not keyed on (created_at, id), page them by offset
+            paginator = LimitOffsetPagination()
+        else:
+            paginator = self.pagination_class()
         page = paginator.paginate_queryset(articles, request)
         serializer = self.serializer_class(
             page, many=True, context={'request': request})
@@ -101,19 +121,53 @@ class RetrieveUpdateDeleteArticleAPIView(RetrieveUpdateAPIView):
 
         """
         try:
-            return Articles.objects.get(slug=slug)
+            return Articles.objects.with_author().get(slug=slug)
         except Articles.DoesNotExist:
             raise ArticleNotFound
 
     def get(self, request, slug, format=None):
-        article = self.get_object(slug)
-        serializer = ArticleSerializer(article, context={'request': request})
+        """
+        Method to return an article, the part shared by all readers is
+        served from the cache and the reader's own fields merged on top
+
+        Params
+        -------
+        request: Object with request data and functions.
+        slug: reference to article to be returned
+
+        Returns
+        --------
+        the article with a strong ETag
+        304 Not Modified if the ETag matches If-None-Match
+
+        """
+        article_id = Articles.objects.filter(slug=slug).values_list('id', flat=True).first()
+        if article_id is None:
+            raise ArticleNotFound
+        article = Articles(pk=article_id)
 
         # Reporting the reading starts of an article
         if request.user.is_authenticated:
             reporting(user=request.user, article=article)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        version = article_version(article_id)
+        serializer = ArticleSerializer(context={'request': request})
+        viewer_data = serializer.viewer_representation(article)
+        etag = article_etag(version, viewer_data)
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = HttpResponseNotModified()
+        else:
+            shared_data = get_payload(article_id, version)
+            if shared_data is None:
+                data = ArticleSerializer(self.get_object(slug), context={'request': request}).data
+                shared_data = ArticleSerializer.shared_representation(data)
+                set_payload(article_id, version, shared_data)
+            response = Response(dict(shared_data, **viewer_data), status=status.HTTP_200_OK)
+
+        response['ETag'] = etag
+        # the reader's own fields are part of the body
+        patch_vary_headers(response, ('Authorization',))
+        return response
 
     @swagger_auto_schema(request_body=ArticleSerializer,
                          responses={
@@ -147,6 +201,7 @@ class CreateListRatingsAPIView(APIView):
     permission_classes = (IsAuthenticatedOrReadOnly, IsVerifiedUser,)
     serializer_class = RatingsSerializer
     renderer_classes = (RatingJSONRenderer,)
+    pagination_class = LimitOffsetPagination
 
     def get_object(self, slug):
         """
@@ -169,7 +224,7 @@ class CreateListRatingsAPIView(APIView):
 
     def get(self, request, slug):
         """
-        Method to return ratings of a particular article
+        Method to return ratings of a particular article, a page at a time
 
         Params
         -------
@@ -178,16 +233,26 @@ class CreateListRatingsAPIView(APIView):
 
         Returns
         --------
-        ratings
+        a page of ratings with the number of ratings the article has
+        and how many were given for each value
         error message if not found
 
         """
-        ratings = Ratings.objects.all()
-        serializer = RatingsSerializer(ratings, many=True)
-        filtered_ratings = [x for x in serializer.data if x['slug'] == slug]
-        if filtered_ratings:
-            return Response({'data': filtered_ratings, 'RatingsCount': len(serializer.data)}, status=status.HTTP_200_OK)
-        return Response({'errors': 'no ratings for this article present'}, status=status.HTTP_404_NOT_FOUND)
+        article = self.get_object(slug)
+        if not article.rating_count:
+            return Response({'errors': 'no ratings for this article present'}, status=status.HTTP_404_NOT_FOUND)
+
+        ratings = Ratings.objects.filter(article=article).select_related('article').order_by('-id')
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(ratings, request)
+        serializer = self.serializer_class(page, many=True)
+        return Response({
+            'data': serializer.data,
+            'RatingsCount': article.rating_count,
+            'histogram': article.rating_histogram,
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+        }, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(request_body=RatingsSerializer,
                          responses={
@@ -367,23 +432,11 @@ class LikesView(APIView):
         except self.model.DoesNotExist:
             raise model_mapper[self.model][1]
 
-        # GenericForeignKey does not support get_or_create
-        content_type = ContentType.objects.get_for_model(obj)
-        try:
-            like_dislike = LikeDislike.objects.get(
-                content_type=content_type, object_id=obj.id, user=request.user
-            )
-            # Checks if the object has not been liked or disliked before
-            # then likes/dislikes if it hasn't if it has
-            # then the like/dislike is deleted
-            if like_dislike.vote is not self.vote_type:
-                like_dislike.vote = self.vote_type
-                like_dislike.save(update_fields=['vote'])
-            else:
-                like_dislike.delete()
-        except LikeDislike.DoesNotExist:
-            like_dislike = obj.likes.create(
-                user=request.user, vote=self.vote_type)
+        # likes/dislikes the object if the user has not voted it yet or
+        # voted the other way, takes the vote back if it is the same,
+        # the counters of `obj` are those left by the toggle
+        like_dislike, action = LikeDislike.toggle(obj, request.user, self.vote_type)
+        if action == 'created':
             send_notifications(request,
                                notification_type="resource_liked",
                                instance=like_dislike,
@@ -391,8 +444,8 @@ class LikesView(APIView):
 
         return Response(
             {
-                "like_count": obj.likes.likes(),
-                "dislike_count": obj.likes.dislikes()
+                "like_count": obj.like_count,
+                "dislike_count": obj.dislike_count
             },
             status=status.HTTP_200_OK
         )
@@ -472,24 +525,108 @@ class FavoriteView(generics.CreateAPIView):
         return Response(data=not_found, status=status.HTTP_404_NOT_FOUND)
 
 
+class ArticleFavoritersView(APIView):
+    """
+    Allow any user to hit this endpoint.
+    List the usernames of the users who favorited an article,
+    latest first, a page at a time
+    """
+    permission_classes = (IsAuthenticatedOrReadOnly,)
+    pagination_class = LimitOffsetPagination
+
+    def get(self, request, slug):
+        """
+        Method to return the favoriters of an article
+
+        Params
+        -------
+        request: Object with request data and functions.
+        slug: reference to the favorited article
+
+        Returns
+        --------
+        a page of usernames
+        error message if the article is not found
+        """
+        article = Articles.objects.filter(slug=slug).first()
+        if article is None:
+            not_found = {
+                "errors": "This article has not been found."
+            }
+            return Response(data=not_found, status=status.HTTP_404_NOT_FOUND)
+
+        # a single join of favorites and users per page
+        favoriters = Favorite.objects.filter(article_id=article).order_by(
+            '-id').values_list('user_id__username', flat=True)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(favoriters, request)
+        return paginator.get_paginated_response(page)
+
+
 class GetUserFavoritesView(APIView):
     """Gets one user's favorite articles"""
     permission_classes = (IsAuthenticatedOrReadOnly,)
 
     def get(self, request):
-        favorites_queryset = Favorite.objects.filter(
-            user_id=request.user.id)
+        # articles in the order they were favorited
+        articles = Articles.objects.for_listing().filter(
+            favorites__user_id=request.user.id).order_by('favorites__id')
 
-        favorite_articles = []
-        for favorite in favorites_queryset:
-            article = ArticleSerializer(favorite.article_id).data
-            favorite_articles.append(article)
+        serializer = ArticleSerializer(articles, many=True, context={'request': request})
         favorites = {
-            "favorites": favorite_articles
+            "favorites": serializer.data
         }
         return Response(data=favorites, status=status.HTTP_200_OK)
 
 
+class TagStatsListAPIView(APIView):
+    """
+    Allow any user to hit this endpoint.
+    List the most used tags, or the most recently used ones,
+    optionally those starting with a prefix
+    """
+    permission_classes = (AllowAny,)
+    default_limit = 20
+    max_limit = 100
+
+    def get(self, request):
+        """
+        Method to return the usage of the tags
+
+        Params
+        -------
+        request: Object with request data and functions,
+            `prefix` the start of the tag names, `limit` the number of tags,
+            `sort` either `popular` (default) or `recent`, by newest tagged article
+
+        Returns
+        --------
+        Response object:
+        {
+            "tags": [{"name": "...", "article_count": 1, "like_count": 0, "last_used_at": "..."}]
+        }
+        """
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        limit = min(max(limit, 1), self.max_limit)
+
+        # each ordering is served by its own index of the tag stats
+        tags = TagStats.objects.filter(article_count__gt=0)
+        if request.query_params.get('sort') == 'recent':
+            tags = tags.filter(last_used_at__isnull=False)
+            ordering = ('-last_used_at', 'name')
+        else:
+            ordering = ('-article_count', 'name')
+        prefix = request.query_params.get('prefix', '').strip().lower()
+        if prefix:
+            tags = tags.filter(name__startswith=prefix)
+
+        serializer = TagStatsSerializer(tags.order_by(*ordering)[:limit], many=True)
+        return Response(data={'tags': serializer.data}, status=status.HTTP_200_OK)
+
+
 class ListReportsAPIView(APIView):
     """
     View to handle fetching of reports for particular articles.
@@ -5,6 +5,7 @@ from django.conf import settings
 from django.contrib.auth.models import (
     AbstractBaseUser, BaseUserManager, PermissionsMixin
 )
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 
@@ -98,6 +99,14 @@ class User(AbstractBaseUser, PermissionsMixin):
     # objects of this type.
     objects = UserManager()
 
+    class Meta:
+        # Trigram index behind the typo tolerant username search,
+        # needs the pg_trgm extension (see authors.apps.search.signals)
+        indexes = [
+            GinIndex(fields=['username'], name='user_username_trgm_idx',
+                     opclasses=['gin_trgm_ops']),
+        ]
+
     def __str__(self):
         """
         Returns a string representation of this `User`.
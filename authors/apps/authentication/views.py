@@ -24,6 +24,8 @@ from social_core.exceptions import MissingBackend
 from social_django.utils import (load_backend,
                                  load_strategy, )
 
+from authors.apps.core.pagination import KeysetPagination
+
 from .backends import email_activation_token
 from .models import (User,
                      PasswordReset, )
@@ -402,18 +404,28 @@ class SetPasswordAPIView(APIView):
                 )
 
 
+class NotificationsPagination(KeysetPagination):
+    """
+    Keyset pagination of notifications, newest first.
+    Clients sending a `page` number get the legacy page number pagination.
+    """
+    ordering = ('-create_date', '-id')
+    legacy_pagination_class = PageNumberPagination
+    legacy_query_param = 'page'
+
+
 class NotificationsView(APIView):
     """
     View used to show or retrieve the authenticated user's notifications
     and to mark them as read
     """
     permission_classes = (IsAuthenticated,)
-    pagination_class = PageNumberPagination
+    pagination_class = NotificationsPagination
 
     def get(self, request):
         notifications = request.user.notifications.all()
 
-        paginator = PageNumberPagination()
+        paginator = self.pagination_class()
         page = paginator.paginate_queryset(notifications, request)
 
         notifications = NotificationSerializer(
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class CommentsConfig(AppConfig):
     name = 'authors.apps.comments'
+
+    def ready(self):
+        import authors.apps.comments.signals
@@ -0,0 +1,15 @@
+from authors.apps.articles.loaders import (ViewerState,
+                                           object_id, )
+from authors.apps.comments.models import Comment
+
+
+class CommentViewerState(ViewerState):
+    """Viewer state for a page of comments"""
+
+    @classmethod
+    def load(cls, user, objects):
+        comment_ids = [object_id(comment) for comment in objects if object_id(comment)]
+        if not comment_ids or user is None or not user.is_authenticated:
+            return cls(comment_ids)
+
+        return cls(comment_ids, votes=cls.load_votes(user, Comment, comment_ids))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from django.db.models import (CharField,
+                              OuterRef,
+                              Q,
+                              Subquery,
+                              Value, )
+from django.db.models.functions import (Cast,
+                                        Concat, )
+
+from authors.apps.comments.models import Comment
+
+
+class Command(BaseCommand):
+    """
+    Django command to fill in the path and depth of the replies stored
+    before they were kept, one level of replies per UPDATE
+    """
+    help = 'Fill in the thread paths of stored replies.'
+
+    def handle(self, *args, **options):
+        parents = Comment.objects.filter(pk=OuterRef('parent_id'))
+        # replies without a path whose parent has its own, or is top level
+        missing = Comment.objects.filter(parent__isnull=False, path='').filter(
+            Q(parent__parent__isnull=True) | ~Q(parent__path=''))
+
+        processed = 0
+        while True:
+            updated = missing.update(
+                path=Subquery(parents.annotate(reply_path=Concat(
+                    'path', Cast('id', CharField()), Value('/'), output_field=CharField(),
+                )).values('reply_path')),
+                depth=Subquery(parents.values('depth')) + 1,
+            )
+            if not updated:
+                break
+            processed += updated
+
+        self.stdout.write(self.style.SUCCESS(
+            '{} comment(s) had their thread path filled in'.format(processed)))
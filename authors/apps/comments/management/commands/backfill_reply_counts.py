@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from django.db.models import (Count,
+                              F,
+                              IntegerField,
+                              OuterRef,
+                              Subquery, )
+from django.db.models.functions import Coalesce
+
+from authors.apps.comments.models import Comment
+
+
+class Command(BaseCommand):
+    """
+    Django command to rebuild the reply count and the latest activity
+    of stored comments from their replies, a range of rows per UPDATE
+    """
+    help = 'Recount the replies of stored comments.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of comments updated per statement.',
+        )
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only process comments stored before their replies were counted.',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        replies = Comment.objects.filter(parent_id=OuterRef('pk')).order_by().values(
+            'parent_id').annotate(total=Count('id')).values('total')
+        queryset = Comment.objects.order_by('pk')
+        if options['missing']:
+            # a comment has its activity from the moment it is saved
+            queryset = queryset.filter(last_reply_at__isnull=True)
+
+        last_pk = 0
+        processed = 0
+        while True:
+            pks = list(queryset.filter(pk__gt=last_pk).values_list('pk', flat=True)[:chunk_size])
+            if not pks:
+                break
+
+            processed += Comment.objects.filter(pk__in=pks).update(
+                reply_count=Coalesce(Subquery(replies, output_field=IntegerField()), 0),
+                last_reply_at=Coalesce(Subquery(Comment.latest_reply()), F('created_at')),
+            )
+            last_pk = pks[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            '{} comment(s) had their replies recounted'.format(processed)))
@@ -0,0 +1,85 @@
+from itertools import groupby
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authors.apps.comments.models import Comment
+
+
+class Command(BaseCommand):
+    """
+    Django command to compact the edit history of comments: drop the
+    versions saved without a change of the body, optionally all but the
+    latest versions and the versions of deleted comments, and count the
+    edits of comments stored before the edit count was kept
+    """
+    help = 'Drop redundant and old versions of comments.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=0,
+            help='Number of latest versions kept per comment, all of them when 0.',
+        )
+        parser.add_argument(
+            '--deleted',
+            action='store_true',
+            help='Also drop the versions of deleted comments.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of comments processed at a time.',
+        )
+
+    def handle(self, *args, **options):
+        versions = Comment.history.model.objects
+        comment_ids = versions.order_by('id').values_list('id', flat=True).distinct()
+
+        last_id = 0
+        dropped = 0
+        while True:
+            ids = list(comment_ids.filter(id__gt=last_id)[:options['chunk_size']])
+            if not ids:
+                break
+
+            drop, edit_counts = self.compact(ids, options['keep'], options['deleted'])
+            with transaction.atomic():
+                dropped += versions.filter(history_id__in=drop).delete()[0]
+                for comment_id, edit_count in edit_counts.items():
+                    Comment.objects.filter(pk=comment_id, edit_count__lt=edit_count).update(
+                        edit_count=edit_count)
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            '{} comment version(s) were dropped'.format(dropped)))
+
+    @staticmethod
+    def compact(comment_ids, keep, deleted):
+        """
+        Return the history ids of the versions to drop among those of
+        `comment_ids`, and the {comment id: edit count} of their edits
+        """
+        rows = Comment.history.model.objects.filter(id__in=comment_ids).order_by(
+            'id', 'history_date', 'history_id').values_list('history_id', 'id', 'body', 'history_type')
+
+        drop = []
+        edit_counts = {}
+        for comment_id, comment_versions in groupby(rows.iterator(), key=lambda row: row[1]):
+            comment_versions = list(comment_versions)
+            if deleted and comment_versions[-1][3] == '-':
+                drop.extend(history_id for history_id, _, _, _ in comment_versions)
+                continue
+
+            kept = []
+            for history_id, _, body, history_type in comment_versions:
+                if history_type == '~' and kept and kept[-1][2] == body:
+                    drop.append(history_id)
+                else:
+                    kept.append((history_id, comment_id, body, history_type))
+            edit_counts[comment_id] = sum(1 for version in kept if version[3] == '~')
+            if keep:
+                drop.extend(history_id for history_id, _, _, _ in kept[:-keep])
+        return drop, edit_counts
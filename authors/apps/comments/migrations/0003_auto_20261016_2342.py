@@ -0,0 +1,27 @@
+# Generated by Django 2.2 on 2026-10-16 23:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0002_auto_20261016_2340'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='last_reply_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='reply_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['article', 'parent', '-last_reply_at'], name='comment_activity_idx'),
+        ),
+    ]
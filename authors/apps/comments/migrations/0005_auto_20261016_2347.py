@@ -0,0 +1,30 @@
+# Generated by Django 2.2 on 2026-10-16 23:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0004_auto_20261016_2346'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='historicalcomment',
+            name='article',
+        ),
+        migrations.RemoveField(
+            model_name='historicalcomment',
+            name='author',
+        ),
+        migrations.RemoveField(
+            model_name='historicalcomment',
+            name='parent',
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='edit_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,15 +1,56 @@
-from django.db import models
+import operator
+from functools import reduce
+
+from django.db import (models,
+                       transaction, )
+from django.db.models import (Case,
+                              CharField,
+                              F,
+                              OuterRef,
+                              Q,
+                              Subquery,
+                              Value,
+                              When, )
+from django.db.models.functions import (Cast,
+                                        Coalesce,
+                                        Concat, )
 from django.contrib.contenttypes.fields import GenericRelation
-                                                
+from django.utils import timezone
+
 from authors.apps.articles.models import Articles, LikeDislike
 from simple_history.models import HistoricalRecords
 
 from authors.apps.articles.models import Articles
 from authors.apps.authentication.models import User
-from authors.apps.core.models import TimeStampModel
+from authors.apps.core.models import (TimeStampModel,
+                                      CounterCacheModel, )
+
+
+class CommentQuerySet(models.QuerySet):
+    """
+    Queryset for comments with helpers that load a thread
+    and what the CommentSerializer reads in a fixed number of queries
+    """
 
+    def for_listing(self):
+        """Join the article and the author into the same query"""
+        return self.select_related('article', 'author')
 
-class Comment(TimeStampModel):
+    def replies_to(self, comments, depth):
+        """
+        The replies to `comments`, siblings of the same page, and their
+        replies down to `depth` levels below them: one range of the path
+        index per comment, the replies are nested by the caller
+        """
+        if not comments or depth < 1:
+            return self.none()
+        return self.filter(
+            reduce(operator.or_, (Q(path__startswith=comment.reply_path) for comment in comments)),
+            depth__lte=comments[0].depth + depth,
+        ).for_listing()
+
+
+class Comment(TimeStampModel, CounterCacheModel):
     """
     Handles adding comments a specified article
     """
@@ -17,8 +58,28 @@ class Comment(TimeStampModel):
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     body = models.TextField(max_length=255, null=False, blank=False)
     parent = models.ForeignKey('self', null=True, blank=True, on_delete=models.CASCADE)
+    # ids of the ancestors of the comment, root first, each followed by a
+    # slash e.g `12/15/`, empty for a top level comment
+    path = models.TextField(default='', blank=True, editable=False)
+    depth = models.PositiveIntegerField(default=0, editable=False)
     likes = GenericRelation(LikeDislike, related_query_name='comments')
-    history = HistoricalRecords()
+    like_count = models.PositiveIntegerField(default=0)
+    dislike_count = models.PositiveIntegerField(default=0)
+    # direct replies to the comment
+    reply_count = models.PositiveIntegerField(default=0)
+    # latest reply at any depth below the comment, its own creation until
+    # it has one, so threads are sorted by activity from a plain index
+    last_reply_at = models.DateTimeField(null=True, editable=False)
+    # edits that changed the body, one version each in the history
+    edit_count = models.PositiveIntegerField(default=0, editable=False)
+    # versions only keep what an edit can change
+    history = HistoricalRecords(excluded_fields=['article', 'author', 'parent', 'like_count',
+                                                 'dislike_count', 'reply_count', 'last_reply_at',
+                                                 'edit_count', 'path', 'depth'])
+
+    objects = CommentQuerySet.as_manager()
+
+    counter_fields = ('like_count', 'dislike_count', 'reply_count', 'last_reply_at', 'edit_count')
 
     def __str__(self):
         """
@@ -29,6 +90,87 @@ class Comment(TimeStampModel):
 
     class Meta:
         ordering = ('-created_at',)
+        indexes = [
+            # LIKE 'path%' lookups of the replies to a comment, at any depth
+            models.Index(fields=['path'], name='comment_path_idx', opclasses=['text_pattern_ops']),
+            # the comments of an article, or the replies to a comment,
+            # in each of the sort orders of the listing
+            models.Index(fields=['article', 'parent', 'created_at', 'id'], name='comment_created_idx'),
+            models.Index(fields=['article', 'parent', '-like_count', '-id'], name='comment_likes_idx'),
+            models.Index(fields=['article', 'parent', '-reply_count', '-id'], name='comment_replies_idx'),
+            models.Index(fields=['article', 'parent', '-last_reply_at', '-id'], name='comment_activity_idx'),
+        ]
+
+    @property
+    def reply_path(self):
+        """The `path` of the replies to the comment"""
+        return '{}{}/'.format(self.path, self.pk)
+
+    @property
+    def ancestor_ids(self):
+        return [int(comment_id) for comment_id in self.path.split('/') if comment_id]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored body so that saves without an edit add no version
+        instance._loaded_body = instance.__dict__.get('body')
+        return instance
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            return self.save_edit(*args, **kwargs)
+        self.save_new(*args, **kwargs)
+        # as if loaded, a later save of the same body is no edit
+        self._loaded_body = self.body
+
+    def save_new(self, *args, **kwargs):
+        """Insert a comment, a reply also counts for its ancestors"""
+        self.last_reply_at = self.last_reply_at or timezone.now()
+        if not self.parent_id:
+            return super().save(*args, **kwargs)
+
+        self.path = self.parent.reply_path
+        self.depth = self.parent.depth + 1
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # one more reply to the parent, activity for the whole thread
+            Comment.objects.filter(pk__in=self.ancestor_ids).update(
+                reply_count=Case(When(pk=self.parent_id, then=F('reply_count') + 1),
+                                 default=F('reply_count')),
+                last_reply_at=self.created_at,
+            )
+
+    def save_edit(self, *args, **kwargs):
+        """Save a stored comment, counting an edit and adding a version when its body changed"""
+        if hasattr(self, 'skip_history_when_saving'):
+            return super().save(*args, **kwargs)
+        if self.body == getattr(self, '_loaded_body', None):
+            return self.save_without_historical_record(*args, **kwargs)
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            Comment.adjust_counters(self.pk, edit_count=1)
+        self.edit_count += 1
+        self._loaded_body = self.body
+
+    @classmethod
+    def latest_reply(cls):
+        """Subquery of the creation of the latest reply below a comment"""
+        return cls.objects.filter(
+            article_id=OuterRef('article_id'),
+            path__startswith=Concat(OuterRef('path'), Cast(OuterRef('id'), CharField()), Value('/')),
+        ).order_by('-created_at').values('created_at')[:1]
+
+    def remove_from_thread(self):
+        """
+        Take a deleted reply out of the counters of its parent
+        and the activity of its ancestors
+        """
+        if self.parent_id:
+            Comment.adjust_counters(self.parent_id, reply_count=-1)
+            Comment.objects.filter(pk__in=self.ancestor_ids).update(
+                last_reply_at=Coalesce(Subquery(Comment.latest_reply()), F('created_at')))
 
     def children(self):
         """
@@ -19,6 +19,15 @@ class CommentJSONRenderer(JSONRenderer):
                 # rendering errors.
                 return json.dumps(data)
 
+        if isinstance(data, dict) and 'results' in data:
+            # a page of comments, with the links to the pages around it
+            return json.dumps({
+                "comments": data['results'],
+                'commentsCount': data['count'],
+                'next': data.get('next'),
+                'previous': data.get('previous'),
+            })
+
         if isinstance(data, list):
             return json.dumps({
                 "comments": data,
@@ -1,13 +1,13 @@
 from rest_framework import serializers
-from django.contrib.auth.models import AnonymousUser
-from django.contrib.contenttypes.models import ContentType
 
+from authors.apps.articles.loaders import (ViewerStateListSerializer,
+                                           ViewerStateMixin, )
 from authors.apps.articles.models import LikeDislike
+from authors.apps.comments.loaders import CommentViewerState
 from authors.apps.comments.models import Comment
 
 
-
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(ViewerStateMixin, serializers.ModelSerializer):
     """
     Handles serialization and deserialization of Comment objects.
     """
@@ -15,31 +15,21 @@ class CommentSerializer(serializers.ModelSerializer):
     article = serializers.ReadOnlyField(source='article.slug')
     author = serializers.ReadOnlyField(source='author.username')
     body = serializers.CharField(max_length=250, required=True)
-    likes = serializers.ReadOnlyField(source='likes.likes')
-    dislikes = serializers.ReadOnlyField(source='likes.dislikes')
+    likes = serializers.ReadOnlyField(source='like_count')
+    dislikes = serializers.ReadOnlyField(source='dislike_count')
     has_liked = serializers.SerializerMethodField()
     has_disliked = serializers.SerializerMethodField()
     has_edits = serializers.SerializerMethodField()
 
+    viewer_state_class = CommentViewerState
+
     def get_has_liked(self, instance):
         """
         Handle checking if a user has liked an article before
         :param instance:
         :return:
         """
-
-        request = self.context.get('request')
-
-        ld = []
-
-        if request and not isinstance(request.user, AnonymousUser):
-            ct = ContentType.objects.get_for_model(Comment)
-            ld = LikeDislike.objects.filter(content_type=ct,
-                                            user=request.user,
-                                            object_id=instance.id,
-                                            vote=1)
-
-        return bool(len(list(ld)))
+        return self.viewer_state.vote(instance) == LikeDislike.LIKE
 
     def get_has_disliked(self, instance):
         """
@@ -47,29 +37,16 @@ class CommentSerializer(serializers.ModelSerializer):
         :param instance:
         :return:
         """
-
-        request = self.context.get('request')
-
-        ld = []
-
-        if request and not isinstance(request.user, AnonymousUser):
-            ct = ContentType.objects.get_for_model(Comment)
-            ld = LikeDislike.objects.filter(content_type=ct,
-                                        user=request.user,
-                                        object_id=instance.id,
-                                        vote=-1)
-
-        return bool(len(list(ld)))
-
+        return self.viewer_state.vote(instance) == LikeDislike.DISLIKE
 
     class Meta:
         model = Comment
+        list_serializer_class = ViewerStateListSerializer
         fields = ('id', 'article', 'author',
                   'body', 'has_liked', 'has_disliked', 'created_at', 'updated_at',
-                  'replies', 'parent', 'likes', 'dislikes', 'has_edits')
+                  'replies', 'last_reply_at', 'parent', 'likes', 'dislikes', 'has_edits')
         read_only_fields = ('id',)
 
-    
     @staticmethod
     def get_replies(obj):
         """
@@ -77,7 +54,13 @@ class CommentSerializer(serializers.ModelSerializer):
         :param obj:
         :return: [comment:replies]
         """
-        return len(CommentSerializer(obj.children(), many=True).data)
+        return obj.reply_count
+
+    def update(self, instance, validated_data):
+        # a reply stays under the comment it answered, moving it would
+        # leave the paths of its own replies behind
+        validated_data.pop('parent', None)
+        return super().update(instance, validated_data)
 
     def get_has_edits(self, instance):
         """
@@ -85,9 +68,7 @@ class CommentSerializer(serializers.ModelSerializer):
         :param instance:
         :return:
         """
-        edit_count = instance.history.count()
-
-        return True if edit_count > 1 else False
+        return instance.edit_count > 0
 
 
 class EditHistorySerializer(serializers.ModelSerializer):
@@ -97,3 +78,17 @@ class EditHistorySerializer(serializers.ModelSerializer):
         model = Comment
         fields = ('id', 'body', 'created_at', 'updated_at')
         read_only_fields = ('id',)
+
+
+def nest_replies(representations, parent_id=None):
+    """
+    Nest the flat representations of a thread, each under the `children`
+    of its parent, keeping their order. Return those replying to
+    `parent_id`, the top level comments when None
+    """
+    children = {}
+    for data in representations:
+        children.setdefault(data['parent'], []).append(data)
+    for data in representations:
+        data['children'] = children.get(data['id'], [])
+    return children.get(parent_id, [])
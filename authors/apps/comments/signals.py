@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from authors.apps.comments.models import Comment
+
+
+@receiver(post_delete, sender=Comment)
+def remove_reply_from_thread(sender, **kwargs):
+    """
+    Keep the reply count and the activity of a thread in step with
+    deleted replies, including replies removed by a cascade
+    """
+    kwargs.get('instance').remove_from_thread()
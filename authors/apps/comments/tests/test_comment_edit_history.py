@@ -1,10 +1,15 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from authors.apps.articles.models import Articles
 from authors.apps.authentication.models import User
 from authors.apps.comments.models import Comment
+from authors.apps.comments.serializers import CommentSerializer
 
 
 class TestCommentEdit(TestCase):
@@ -124,3 +129,79 @@ class TestCommentEdit(TestCase):
         data = response.data
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_saving_an_unchanged_body_adds_no_version(self):
+        comment = Comment.objects.create(
+            article=self.article,
+            author=self.reader,
+            body="I don't like this article"
+        )
+        comment = Comment.objects.get(pk=comment.pk)
+        comment.save()
+        comment.body = "I like it now"
+        comment.save()
+        comment.save()
+
+        self.assertEqual(comment.history.count(), 2)
+        self.assertEqual(comment.edit_count, 1)
+        self.assertEqual(Comment.objects.get(pk=comment.pk).edit_count, 1)
+
+    def test_saving_a_new_comment_again_is_no_edit(self):
+        comment = Comment.objects.create(
+            article=self.article,
+            author=self.reader,
+            body="I don't like this article"
+        )
+        comment.save()
+
+        self.assertEqual(comment.history.count(), 1)
+        self.assertEqual(Comment.objects.get(pk=comment.pk).edit_count, 0)
+        self.assertFalse(CommentSerializer().get_has_edits(comment))
+
+    def test_has_edits_reads_the_edit_count(self):
+        comment = Comment.objects.create(
+            article=self.article,
+            author=self.reader,
+            body="I don't like this article"
+        )
+        comment.body = "this is an update"
+        comment.save()
+        comment = Comment.objects.get(pk=comment.pk)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(CommentSerializer().get_has_edits(comment))
+
+    def test_compact_command_drops_redundant_and_old_versions(self):
+        comment = Comment.objects.create(
+            article=self.article,
+            author=self.reader,
+            body="first"
+        )
+        # versions of saves without an edit, from before they were skipped
+        for body in ("second", "second", "third", "third"):
+            comment.body = body
+            comment.save_without_historical_record()
+            comment.history.model.objects.create(
+                id=comment.id, body=body, created_at=comment.created_at,
+                updated_at=comment.updated_at, history_date=timezone.now(), history_type='~')
+        Comment.objects.filter(pk=comment.pk).update(edit_count=0)
+
+        out = StringIO()
+        call_command('compact_comment_history', stdout=out)
+        self.assertEqual([version.body for version in comment.history.order_by('history_date')],
+                         ["first", "second", "third"])
+        self.assertEqual(Comment.objects.get(pk=comment.pk).edit_count, 2)
+
+        call_command('compact_comment_history', '--keep', '1', stdout=out)
+        self.assertEqual([version.body for version in comment.history.all()], ["third"])
+        self.assertEqual(Comment.objects.get(pk=comment.pk).edit_count, 2)
+
+    def test_compact_command_drops_deleted_comments(self):
+        comment = Comment.objects.create(
+            article=self.article,
+            author=self.reader,
+            body="gone soon"
+        )
+        comment.delete()
+        call_command('compact_comment_history', '--deleted', stdout=StringIO())
+        self.assertFalse(Comment.history.model.objects.exists())
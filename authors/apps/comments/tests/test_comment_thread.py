@@ -0,0 +1,226 @@
+import json
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import Articles
+from authors.apps.comments.models import Comment
+from authors.apps.comments.response_messages import COMMENTS_MSG
+
+
+class CommentThreadTest(TestCase):
+    """Tests for the threads of replies read in one query"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user('threads@gmail.com', 'threads', 'T35tP45w0rd')
+        self.article = Articles.objects.create(
+            author=self.user, title='threads', body='body', description='description')
+        self.url = reverse('comments:comments', args=[self.article.slug])
+        self.first = self.comment('first')
+        self.reply = self.comment('reply', parent=self.first)
+        self.nested = self.comment('nested', parent=self.reply)
+        self.second = self.comment('second')
+
+    def comment(self, body, parent=None):
+        return Comment.objects.create(author=self.user, article=self.article, body=body, parent=parent)
+
+    def thread(self, **params):
+        response = self.client.get(self.url, params)
+        return json.loads(response.content)['comments']
+
+    def shape(self, comments):
+        return [(comment['body'], comment['replies'], self.shape(comment['children']))
+                for comment in comments]
+
+    def test_replies_keep_the_path_of_their_ancestors(self):
+        self.assertEqual((self.first.path, self.first.depth), ('', 0))
+        self.assertEqual((self.reply.path, self.reply.depth), (f'{self.first.pk}/', 1))
+        self.assertEqual(self.nested.path, f'{self.first.pk}/{self.reply.pk}/')
+
+    def test_depth_nests_the_replies(self):
+        self.assertEqual(self.shape(self.thread(depth='all')), [
+            ('second', 0, []),
+            ('first', 1, [('reply', 1, [('nested', 0, [])])]),
+        ])
+        # replies below the depth are counted, not listed
+        self.assertEqual(self.shape(self.thread(depth=1)), [
+            ('second', 0, []),
+            ('first', 1, [('reply', 1, [])]),
+        ])
+
+    def test_depth_under_a_parent(self):
+        self.assertEqual(self.shape(self.thread(parent=self.first.pk, depth=5)), [
+            ('reply', 1, [('nested', 0, [])]),
+        ])
+
+    def test_unknown_parent_is_not_found(self):
+        other = Articles.objects.create(
+            author=self.user, title='other', body='body', description='description')
+        elsewhere = Comment.objects.create(author=self.user, article=other, body='elsewhere')
+        for parent in ('abc', '', elsewhere.pk, elsewhere.pk + 1):
+            response = self.client.get(self.url, {'parent': parent})
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(json.loads(response.content), {'errors': COMMENTS_MSG['COMMENT_DOES_NOT_EXIST']})
+
+    def test_flat_listing_is_unchanged(self):
+        comments = self.thread()
+        self.assertEqual([comment['body'] for comment in comments], ['second', 'first'])
+        self.assertNotIn('children', comments[0])
+        self.assertEqual(comments[1]['replies'], 1)
+
+    def test_thread_query_count_does_not_grow(self):
+        for parent in (self.nested, self.reply, self.second):
+            self.comment('more', parent=parent)
+        # the article, the page, its replies and the count
+        with self.assertNumQueries(4):
+            self.thread(depth='all')
+
+    def test_backfill_command_fills_in_the_paths(self):
+        Comment.objects.update(path='', depth=0)
+        out = StringIO()
+        call_command('backfill_comment_paths', stdout=out)
+        self.assertIn('2 comment(s)', out.getvalue())
+        self.nested.refresh_from_db()
+        self.assertEqual((self.nested.path, self.nested.depth), (f'{self.first.pk}/{self.reply.pk}/', 2))
+
+
+class ReplyCountersTest(TestCase):
+    """Tests for the denormalized reply counts and thread activity"""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user('replies@gmail.com', 'replies', 'T35tP45w0rd')
+        self.article = Articles.objects.create(
+            author=self.user, title='replies', body='body', description='description')
+        self.root = self.comment('root')
+
+    def comment(self, body, parent=None):
+        return Comment.objects.create(author=self.user, article=self.article, body=body, parent=parent)
+
+    def state(self, comment):
+        comment.refresh_from_db()
+        return comment.reply_count, comment.last_reply_at
+
+    def test_replies_update_the_thread(self):
+        self.assertEqual(self.state(self.root), (0, self.root.last_reply_at))
+        reply = self.comment('reply', parent=self.root)
+        nested = self.comment('nested', parent=reply)
+        self.assertEqual(self.state(self.root), (1, nested.created_at))
+        self.assertEqual(self.state(reply), (1, nested.created_at))
+
+    def test_deleted_replies_leave_the_thread(self):
+        reply = self.comment('reply', parent=self.root)
+        nested = self.comment('nested', parent=reply)
+        nested.delete()
+        self.assertEqual(self.state(self.root), (1, reply.created_at))
+        self.assertEqual(self.state(reply), (0, reply.created_at))
+
+        self.comment('nested', parent=reply)
+        # the replies of a deleted reply go with it
+        reply.delete()
+        self.assertEqual(self.state(self.root), (0, self.root.created_at))
+
+    def test_stale_save_keeps_the_counters(self):
+        stale = Comment.objects.get(pk=self.root.pk)
+        reply = self.comment('reply', parent=self.root)
+        stale.body = 'edited'
+        stale.save()
+        self.assertEqual(self.state(self.root), (1, reply.created_at))
+
+    def test_backfill_command_recounts_the_replies(self):
+        reply = self.comment('reply', parent=self.root)
+        nested = self.comment('nested', parent=reply)
+        Comment.objects.update(reply_count=0, last_reply_at=None)
+        out = StringIO()
+        call_command('backfill_reply_counts', stdout=out)
+        self.assertIn('3 comment(s)', out.getvalue())
+        self.assertEqual(self.state(self.root), (1, nested.created_at))
+        self.assertEqual(self.state(nested), (0, nested.created_at))
+
+    def test_backfill_command_skips_counted_comments(self):
+        reply = self.comment('reply', parent=self.root)
+        Comment.objects.filter(pk=reply.pk).update(reply_count=0, last_reply_at=None)
+        out = StringIO()
+        call_command('backfill_reply_counts', '--missing', stdout=out)
+        self.assertIn('1 comment(s)', out.getvalue())
+        self.assertEqual(self.state(reply), (0, reply.created_at))
+
+
+class CommentListingTest(TestCase):
+    """Tests for the paginated and sorted listing of comments"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user('listing@gmail.com', 'listing', 'T35tP45w0rd')
+        self.article = Articles.objects.create(
+            author=self.user, title='listing', body='body', description='description')
+        self.url = reverse('comments:comments', args=[self.article.slug])
+        self.comments = [
+            Comment.objects.create(author=self.user, article=self.article, body=f'comment {number}')
+            for number in range(5)
+        ]
+
+    def get(self, url=None, **params):
+        response = self.client.get(url or self.url, params)
+        return json.loads(response.content)
+
+    def bodies(self, payload):
+        return [comment['body'] for comment in payload['comments']]
+
+    def test_pages_follow_the_cursor(self):
+        first = self.get(limit=2)
+        self.assertEqual(self.bodies(first), ['comment 4', 'comment 3'])
+        self.assertEqual(first['commentsCount'], 5)
+        self.assertIsNone(first['previous'])
+
+        second = self.get(first['next'])
+        self.assertEqual(self.bodies(second), ['comment 2', 'comment 1'])
+        last = self.get(second['next'])
+        self.assertEqual(self.bodies(last), ['comment 0'])
+        self.assertIsNone(last['next'])
+        self.assertEqual(self.bodies(self.get(last['previous'])), ['comment 2', 'comment 1'])
+
+    def test_count_is_the_total_of_the_listing(self):
+        for number in range(5, 25):
+            Comment.objects.create(author=self.user, article=self.article, body=f'comment {number}')
+        Comment.objects.create(author=self.user, article=self.article, body='reply',
+                               parent=self.comments[0])
+        first = self.get(limit=10)
+        self.assertEqual(len(first['comments']), 10)
+        self.assertEqual(first['commentsCount'], 25)
+        self.assertIsNotNone(first['next'])
+        self.assertEqual(self.get(first['next'])['commentsCount'], 25)
+        self.assertEqual(self.get(parent=self.comments[0].pk)['commentsCount'], 1)
+        self.assertEqual(self.get(limit=10, offset=20)['commentsCount'], 25)
+
+    def test_sort_modes(self):
+        Comment.adjust_counters(self.comments[1].pk, like_count=3)
+        Comment.adjust_counters(self.comments[3].pk, like_count=1)
+        Comment.objects.create(author=self.user, article=self.article, body='reply',
+                               parent=self.comments[2])
+
+        self.assertEqual(self.bodies(self.get(sort='oldest', limit=2)), ['comment 0', 'comment 1'])
+        self.assertEqual(self.bodies(self.get(sort='most_liked', limit=2)), ['comment 1', 'comment 3'])
+        self.assertEqual(self.bodies(self.get(sort='most_replies', limit=1)), ['comment 2'])
+        self.assertEqual(self.bodies(self.get(sort='active', limit=1)), ['comment 2'])
+
+        page = self.get(sort='most_liked', limit=3)
+        self.assertEqual(self.bodies(self.get(page['next'])), ['comment 2', 'comment 0'])
+
+    def test_page_of_threads(self):
+        Comment.objects.create(author=self.user, article=self.article, body='reply',
+                               parent=self.comments[4])
+        Comment.objects.create(author=self.user, article=self.article, body='hidden',
+                               parent=self.comments[2])
+        payload = self.get(limit=2, depth=1)
+        self.assertEqual(self.bodies(payload), ['comment 4', 'comment 3'])
+        self.assertEqual([reply['body'] for reply in payload['comments'][0]['children']], ['reply'])
+
+    def test_page_query_count_is_fixed(self):
+        # the article, the page and the count
+        with self.assertNumQueries(3):
+            self.get(limit=2)
@@ -72,7 +72,7 @@ class PublicCommentAPiTest(TestCase):
         comments = Comment.objects.all().order_by('created_at')
         serializers = CommentSerializer(comments, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializers.data)
+        self.assertEqual(res.data['results'], serializers.data)
 
     def test_retrieve_comment_if_article_is_invalid(self):
         """Test retrieving and article where the article is not found"""
@@ -11,7 +11,8 @@ from authors.apps.authentication.permissions import IsVerifiedUser
 from authors.apps.comments.models import Comment
 from authors.apps.comments.renderers import CommentJSONRenderer
 from authors.apps.comments.response_messages import COMMENTS_MSG
-from authors.apps.comments.serializers import CommentSerializer, EditHistorySerializer
+from authors.apps.comments.serializers import CommentSerializer, EditHistorySerializer, nest_replies
+from authors.apps.core.pagination import KeysetPagination
 from authors.apps.core.utils import send_notifications
 
 
@@ -23,28 +24,77 @@ class RetrieveCommentAPIView(APIView):
     permission_classes = (IsAuthenticatedOrReadOnly, IsVerifiedUser,)
     serializer_class = CommentSerializer
     renderer_classes = (CommentJSONRenderer,)
+    pagination_class = KeysetPagination
+    # each ordering is unique and served by an index of the comments
+    sort_orderings = {
+        'newest': ('-created_at', '-id'),
+        'oldest': ('created_at', 'id'),
+        'most_liked': ('-like_count', '-id'),
+        'most_replies': ('-reply_count', '-id'),
+        'active': ('-last_reply_at', '-id'),
+    }
+    # levels of replies nested under the listed comments at most
+    max_depth = 50
 
     # @swagger_auto_schema(request_body=CommentSerializer,
     #                      responses={
     #                          200: CommentSerializer()})
     def get(self, request, slug):
         """
-        Handles listing all comments on an article
+        Handles listing the comments on an article a page at a time, the
+        replies to the `parent` comment when given, in the `sort` order
+        (newest, oldest, most_liked, most_replies or active). With `depth`,
+        each comment also has its replies nested in its `children` down to
+        `depth` levels, all of them read in one more query
 
         :param slug:
         :return: [comments]
         """
         try:
             article = Articles.objects.get(slug=slug)
-            comments = Comment.objects.all().filter(article_id=article.id, parent=request.query_params.get("parent",
-                                                                                                           None))
-            serializer = self.serializer_class(comments, many=True)
-
-            return Response(serializer.data,
-                            status=status.HTTP_200_OK)
         except Articles.DoesNotExist:
             return Response({"errors": COMMENTS_MSG['ARTICLE_DOES_NOT_EXIST']}, status=status.HTTP_404_NOT_FOUND)
 
+        parent_id = request.query_params.get("parent", None)
+        if parent_id is not None:
+            try:
+                parent_id = int(parent_id)
+            except ValueError:
+                parent_id = None
+            if parent_id is None or not Comment.objects.filter(pk=parent_id, article=article).exists():
+                return Response({"errors": COMMENTS_MSG['COMMENT_DOES_NOT_EXIST']},
+                                status=status.HTTP_404_NOT_FOUND)
+
+        ordering = self.sort_orderings.get(request.query_params.get('sort'), self.sort_orderings['newest'])
+        comments = Comment.objects.for_listing().filter(
+            article_id=article.id, parent=parent_id).order_by(*ordering)
+        paginator = self.pagination_class(ordering)
+        page = paginator.paginate_queryset(comments, request)
+
+        depth = request.query_params.get("depth", None)
+        if depth is None:
+            serializer = self.serializer_class(page, many=True, context={'request': request})
+            return self.get_paginated_response(paginator, comments, serializer.data)
+
+        try:
+            depth = min(max(int(depth), 0), self.max_depth)
+        except ValueError:
+            # e.g `depth=all`, the whole thread
+            depth = self.max_depth
+        thread = page + list(Comment.objects.replies_to(page, depth))
+        serializer = self.serializer_class(thread, many=True, context={'request': request})
+        return self.get_paginated_response(
+            paginator, comments, nest_replies(serializer.data, parent_id=page[0].parent_id if page else None))
+
+    @staticmethod
+    def get_paginated_response(paginator, comments, data):
+        """The page with the number of comments in the whole listing"""
+        response = paginator.get_paginated_response(data)
+        if response.data['count'] is None:
+            # the keyset pages skip the count, the listing still shows it
+            response.data['count'] = comments.order_by().count()
+        return response
+
     @swagger_auto_schema(request_body=CommentSerializer,
                          responses={
                              200: CommentSerializer()})
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.utils.translation import ugettext_lazy as _
 
 
@@ -9,3 +11,52 @@ class TimeStampModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class CounterCacheModel(models.Model):
+    """
+    Abstract model for rows that carry denormalized counter columns.
+
+    Counter columns listed in `counter_fields` are only ever written through
+    `adjust_counters` (an `F()` expression UPDATE), so a regular `save()` on
+    an existing row leaves them out. Otherwise a stale in-memory instance
+    would overwrite increments made by other requests.
+
+    Columns listed in `derived_fields` are rebuilt by their own UPDATE from
+    other tables, and are left out of a regular `save()` for the same reason.
+    """
+    counter_fields = ()
+    derived_fields = ()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        skipped = self.counter_fields + self.derived_fields
+        if (skipped and not self._state.adding
+                and kwargs.get('update_fields') is None
+                and not kwargs.get('force_insert')):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in skipped
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def adjust_counters(cls, pk, **deltas):
+        """
+        Atomically add the given deltas to the counter columns of one row
+        e.g `Articles.adjust_counters(article.id, like_count=1)`
+        Counters never drop below zero.
+        """
+        updates = cls.counter_updates(**deltas)
+        if updates:
+            cls.objects.filter(pk=pk).update(**updates)
+
+    @staticmethod
+    def counter_updates(**deltas):
+        """Return the UPDATE expressions adding the non zero deltas to their counters"""
+        return {
+            field: Greatest(F(field) + delta, 0)
+            for field, delta in deltas.items() if delta
+        }
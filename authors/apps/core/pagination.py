@@ -0,0 +1,153 @@
+import json
+from base64 import (b64decode,
+                    b64encode, )
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (BasePagination,
+                                       LimitOffsetPagination,
+                                       _positive_int, )
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination on a unique, index backed ordering,
+    by default the `(created_at, id)` of a row, newest first.
+
+    Every page is a `WHERE (created_at, id) < (cursor)` range scan of the
+    index so deep pages cost the same as the first one, and no `COUNT(*)`
+    is run. The response keeps the `count/next/previous/results` envelope
+    of the offset paginators with `count` set to null.
+
+    Clients that still send an `offset` get the legacy paginator instead.
+    """
+    ordering = ('-created_at', '-id')
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+    max_page_size = 100
+    invalid_cursor_message = 'Invalid cursor'
+    legacy_pagination_class = LimitOffsetPagination
+    legacy_query_param = 'offset'
+
+    def __init__(self, ordering=None):
+        if ordering is not None:
+            self.ordering = ordering
+        self.legacy_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.legacy_query_param in request.query_params:
+            self.legacy_paginator = self.legacy_pagination_class()
+            return self.legacy_paginator.paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        position, self.reverse = self.decode_cursor(request)
+        if position is not None:
+            position = self.to_python(queryset.model, position)
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = tuple(self.flip(field) for field in ordering)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after(position, ordering))
+
+        # one extra row tells whether there is a page after this one
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+
+        self.has_next = has_more if not self.reverse else True
+        self.has_previous = position is not None if not self.reverse else has_more
+        return self.page
+
+    def get_paginated_response(self, data):
+        if self.legacy_paginator is not None:
+            return self.legacy_paginator.get_paginated_response(data)
+        return Response(OrderedDict([
+            ('count', None),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return api_settings.PAGE_SIZE or self.max_page_size
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    @staticmethod
+    def flip(field):
+        return field[1:] if field.startswith('-') else '-' + field
+
+    @staticmethod
+    def after(position, ordering):
+        """
+        Build the filter for the rows that come after `position`
+        in `ordering` i.e `a < x OR (a = x AND b < y)` for `-a, -b`
+        """
+        condition = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            step = Q(**{'{}__{}'.format(name, lookup): position[index]})
+            for previous, value in zip(ordering[:index], position):
+                step &= Q(**{previous.lstrip('-'): value})
+            condition |= step
+        return condition
+
+    def to_python(self, model, position):
+        """Convert the cursor values to the types of the ordering fields"""
+        try:
+            return [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance, reverse):
+        position = [str(getattr(instance, field.lstrip('-'))) for field in self.ordering]
+        payload = {'p': position}
+        if reverse:
+            payload['r'] = 1
+        cursor = b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        """Return the (position, reverse) the request cursor points at"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(b64decode(encoded.encode('ascii')).decode('utf-8'))
+            position = payload['p']
+            reverse = bool(payload.get('r'))
+        except (AttributeError, TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
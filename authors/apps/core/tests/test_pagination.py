@@ -0,0 +1,80 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from notifications.models import Notification
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+
+
+class KeysetPaginationTest(TestCase):
+    """Tests for the keyset pagination of the article and notification feeds"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create(
+            username='reader', email='reader@mail.com', password='password')
+        self.user.is_verified = True
+        self.user.save()
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {self.user.token}'}
+        self.articles = [
+            Articles.objects.create(
+                title='article {}'.format(index), body='body',
+                description='description', author=self.user)
+            for index in range(5)
+        ]
+
+    def walk(self, url, **params):
+        """Follow the next links from `url` and return the pages"""
+        pages = []
+        response = self.client.get(url, params, **self.headers)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            if not response.data['next']:
+                return pages
+            response = self.client.get(response.data['next'], **self.headers)
+
+    def article_ids(self, pages):
+        return [article['id'] for page in pages for article in page['results']]
+
+    def test_articles_are_paged_newest_first(self):
+        pages = self.walk(reverse('articles:articles'), limit=2)
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0]['count'])
+        self.assertIsNone(pages[0]['previous'])
+        expected = [article.id for article in reversed(self.articles)]
+        self.assertEqual(self.article_ids(pages), expected)
+
+        previous = self.client.get(pages[1]['previous'], **self.headers)
+        self.assertEqual(previous.data['results'], pages[0]['results'])
+
+    def test_rows_sharing_a_timestamp_are_not_skipped(self):
+        Articles.objects.update(created_at=timezone.now())
+        pages = self.walk(reverse('articles:articles'), limit=2)
+        self.assertEqual(sorted(self.article_ids(pages)),
+                         sorted(article.id for article in self.articles))
+
+    def test_offset_pagination_is_opt_in(self):
+        response = self.client.get(reverse('articles:articles'), {'offset': 1, 'limit': 2})
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('articles:articles'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_notifications_are_paged_by_cursor(self):
+        for index in range(3):
+            Notification.objects.create(
+                recipient=self.user, source=self.user, source_display_name='reader',
+                action='read', category='test', short_description='note {}'.format(index))
+        url = reverse('authentication:notifications')
+
+        pages = self.walk(url, limit=2)
+        descriptions = [note['short_description'] for page in pages for note in page['results']]
+        self.assertEqual(descriptions, ['note 2', 'note 1', 'note 0'])
+
+        response = self.client.get(url, {'page': 1}, **self.headers)
+        self.assertEqual(response.data['count'], 3)
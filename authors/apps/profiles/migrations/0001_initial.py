@@ -0,0 +1,56 @@
+# Generated by Django 2.2.28 on 2026-10-16 20:57
+
+import cloudinary.models
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomFollows',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Profile',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('first_name', models.CharField(blank=True, max_length=30, null=True, verbose_name='first name')),
+                ('last_name', models.CharField(blank=True, max_length=30, null=True, verbose_name='last name')),
+                ('birth_date', models.DateField(blank=True, null=True, verbose_name='last name')),
+                ('bio', models.TextField(blank=True, default='', null=True, verbose_name='bio')),
+                ('city', models.CharField(blank=True, default='', max_length=100, null=True, verbose_name='city')),
+                ('country', models.CharField(blank=True, default='', max_length=100, null=True, verbose_name='country')),
+                ('phone', models.IntegerField(blank=True, default=0, null=True, verbose_name='phone')),
+                ('website', models.URLField(blank=True, default='', null=True, verbose_name='website')),
+                ('image', cloudinary.models.CloudinaryField(default='image/upload/t_media_lib_thumb/v1554230107/samples/people/boy-snow-hoodie.jpg', max_length=255, verbose_name='image')),
+                ('follows', models.ManyToManyField(related_name='followed_by', through='profiles.CustomFollows', to='profiles.Profile')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='customfollows',
+            name='from_profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='from_profile', to='profiles.Profile'),
+        ),
+        migrations.AddField(
+            model_name='customfollows',
+            name='to_profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='to_profile', to='profiles.Profile'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 2.2 on 2026-10-16 23:12
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['first_name'], name='profile_first_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['last_name'], name='profile_last_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from cloudinary import CloudinaryImage
 from cloudinary.models import CloudinaryField
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models.signals import post_save
 
@@ -36,6 +37,15 @@ class Profile(TimeStampModel):
                                      related_name="followed_by",
                                      symmetrical=False)
 
+    class Meta:
+        # Trigram indexes behind the typo tolerant name search
+        indexes = [
+            GinIndex(fields=['first_name'], name='profile_first_name_trgm_idx',
+                     opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['last_name'], name='profile_last_name_trgm_idx',
+                     opclasses=['gin_trgm_ops']),
+        ]
+
     def __str__(self):
         return self.user.username
 
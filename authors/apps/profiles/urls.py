@@ -1,5 +1,7 @@
 from django.urls import path
 
+from authors.apps.search.views import SearchProfileListAPIView
+
 from .views import (
     ProfileRetrieveAPIView, ProfilesListAPIView,
     ProfileFollowUserAPIView, ProfileMyFollowingAPIView,
@@ -12,6 +14,7 @@ urlpatterns = [
     path('profiles/me/',
          GetMyProfileAPIView.as_view(),
          name='my_profile'),
+    path('profiles/q', SearchProfileListAPIView.as_view(), name='search'),
     path('profiles/follow/',
          ProfileMyFollowingAPIView.as_view(),
          name='my_following'),
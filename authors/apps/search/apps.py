@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    name = 'authors.apps.search'
+
+    def ready(self):
+        import authors.apps.search.signals
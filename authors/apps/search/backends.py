@@ -0,0 +1,171 @@
+"""
+Search backends find and rank the articles matching a free text query.
+
+A backend filters an article queryset down to the matches, best first,
+annotated with a `rank` and a highlighted `snippet` of the body.
+The SEARCH_BACKEND setting picks the backend by dotted path, by default
+the full-text search of the database.
+"""
+from django.conf import settings
+from django.contrib.postgres.search import (SearchQuery,
+                                            SearchRank, )
+from django.db import connection
+from django.db.models import (Case,
+                              F,
+                              FloatField,
+                              Func,
+                              Q,
+                              TextField,
+                              Value,
+                              When, )
+from django.utils.module_loading import import_string
+
+from authors.apps.articles.models import Articles
+from authors.apps.search.index import InvertedIndex
+
+# best matches found outside the database and handed to it to be
+# filtered, ranked and paged, ranking is a CASE over their ids so keep
+# it to a few pages
+MAX_RANKED_RESULTS = 200
+
+
+def rank_of(scores):
+    """CASE expression giving each id of [(id, score)] its score"""
+    return Case(*[When(id=item_id, then=Value(score)) for item_id, score in scores],
+                default=Value(0.0), output_field=FloatField())
+
+
+class StripTags(Func):
+    """Replace the HTML tags of a text column with spaces"""
+    function = 'REGEXP_REPLACE'
+    template = "%(function)s(%(expressions)s, '<[^>]*>', ' ', 'g')"
+    output_field = TextField()
+
+
+class Headline(Func):
+    """Fragments of a document with the words matching a query highlighted"""
+    function = 'TS_HEADLINE'
+    output_field = TextField()
+
+
+class SearchBackend:
+    """Base class of the search backends"""
+
+    def search(self, queryset, query):
+        """
+        Return the articles of `queryset` matching `query`, best first,
+        annotated with their `rank` and a highlighted `snippet`
+        """
+        raise NotImplementedError
+
+    def index(self, article):
+        """Take a saved article into account, nothing to do for database backends"""
+
+    def remove(self, article_id):
+        """Forget a deleted article, nothing to do for database backends"""
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Full-text search over the stored search vector of the articles,
+    a GIN index scan ranked by the weights of the title, description and body
+    """
+    headline_options = 'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5'
+
+    def search(self, queryset, query):
+        search_query = SearchQuery(query, config=Articles.SEARCH_CONFIG)
+        return queryset.filter(search_vector=search_query).annotate(
+            rank=SearchRank(F('search_vector'), search_query),
+            snippet=Headline(Value(Articles.SEARCH_CONFIG), StripTags(F('body')),
+                             search_query, Value(self.headline_options)),
+        ).order_by('-rank', '-created_at', '-id')
+
+
+class ContainsSearchBackend(SearchBackend):
+    """
+    Substring search for databases without full-text search,
+    articles matching on the title rank first
+    """
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) | Q(description__icontains=query) | Q(body__icontains=query)
+        ).annotate(
+            rank=Case(When(title__icontains=query, then=Value(1.0)),
+                      default=Value(0.0), output_field=FloatField()),
+            snippet=F('excerpt'),
+        ).order_by('-rank', '-created_at', '-id')
+
+
+class InvertedIndexSearchBackend(SearchBackend):
+    """
+    BM25 search over an inverted index held in the memory of the process,
+    for small deployments and tests.
+
+    The index is built from the database on the first search and then kept
+    current by the article post_save/post_delete receivers. It only sees
+    the writes of its own process, so run a single process with it.
+
+    Only the articles left by the other filters of the search are ranked.
+    Queries matching more than `max_results` of them are handed to the
+    search of the database, which pages every match.
+    """
+    field_weights = (('title', 3), ('description', 2), ('body', 1))
+    max_results = MAX_RANKED_RESULTS
+
+    def __init__(self):
+        self.inverted_index = InvertedIndex(self.field_weights)
+        self.built = False
+
+    def document(self, article):
+        return {field: getattr(article, field) for field, _ in self.field_weights}
+
+    def build(self):
+        """Index every stored article"""
+        fields = [field for field, _ in self.field_weights]
+        for values in Articles.objects.order_by().values('id', *fields).iterator():
+            self.inverted_index.add(values['id'], values)
+        self.built = True
+
+    def index(self, article):
+        if self.built:
+            self.inverted_index.add(article.pk, self.document(article))
+
+    def remove(self, article_id):
+        self.inverted_index.remove(article_id)
+
+    def search(self, queryset, query):
+        if not self.built:
+            self.build()
+        accept = None
+        if queryset.query.where:
+            accept = set(queryset.order_by().values_list('id', flat=True)).__contains__
+        scores = self.inverted_index.search(query, limit=self.max_results + 1, accept=accept)
+        if len(scores) > self.max_results:
+            return get_search_backend(database_backend_path()).search(queryset, query)
+        return queryset.filter(id__in=[article_id for article_id, _ in scores]).annotate(
+            rank=rank_of(scores),
+            snippet=F('excerpt'),
+        ).order_by('-rank', '-created_at', '-id')
+
+
+_backends = {}
+
+
+def database_backend_path():
+    """Dotted path of the search backend of the database in use"""
+    if connection.vendor == 'postgresql':
+        return 'authors.apps.search.backends.PostgresSearchBackend'
+    return 'authors.apps.search.backends.ContainsSearchBackend'
+
+
+def get_search_backend(path=None):
+    """
+    Return the search backend at `path`, by default the one named by the
+    SEARCH_BACKEND setting or the full-text search of the database in use.
+    Backends are created once per process, they may hold an index.
+    """
+    path = path or getattr(settings, 'SEARCH_BACKEND', None) or database_backend_path()
+    if path not in _backends:
+        _backends[path] = import_string(path)()
+    return _backends[path]
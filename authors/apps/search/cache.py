@@ -0,0 +1,112 @@
+"""
+Cache of the article search results.
+
+A search is cached as the list of the ids of its matches (with their rank
+and snippet when searched by text), keyed by its normalized query and the
+search generation. Writes to articles, their tags, favorites and ratings
+bump the generation, so results cached before a write are never read
+again and simply expire. The generation is read from the cache on every
+search, not kept by the process: with the cache shared by the workers
+(see CACHES in the settings) a write in one worker is seen by all.
+
+Pages of cached results are hydrated from the payload cache of the
+article detail, see authors.apps.articles.cache.
+"""
+import hashlib
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import urlencode
+
+from authors.apps.articles.cache import (article_versions,
+                                         get_payloads,
+                                         set_payloads, )
+from authors.apps.articles.models import Articles
+from authors.apps.articles.serializers import ArticleSerializer
+
+SEARCH_CACHE_TIMEOUT = 5 * 60
+# results with more matches are paged from the database, ranking
+# and highlighting more than a few pages up front would not pay off
+MAX_CACHED_RESULTS = 200
+GENERATION_KEY = 'search:generation'
+# query parameters that page or shape the response, not the matches
+IGNORED_PARAMS = ('limit', 'offset', 'facets')
+
+
+def normalized_query(query_params):
+    """The query string of a search, whatever the order of its parameters"""
+    return urlencode(sorted(
+        (name, value.strip())
+        for name in query_params if name not in IGNORED_PARAMS
+        for value in query_params.getlist(name) if value.strip()
+    ))
+
+
+def search_generation():
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def _bump_generation():
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        # evicted, any new value leaves the cached results behind
+        cache.add(GENERATION_KEY, 1, None)
+
+
+def bump_generation():
+    """Leave every cached search behind"""
+    _bump_generation()
+    # and again on commit, a search may have cached the rows being replaced
+    transaction.on_commit(_bump_generation)
+
+
+def search_key(kind, query_params):
+    digest = hashlib.md5(normalized_query(query_params).encode('utf-8')).hexdigest()
+    return 'search:{}:{}:{}'.format(kind, search_generation(), digest)
+
+
+def search_results(articles):
+    """
+    Return the cacheable results of the filtered `articles`:
+    {'entries': [{'id': ..., 'rank': ..., 'snippet': ...}]} best first,
+    or {'entries': None} when there are too many to cache
+    """
+    fields = ['id'] + [name for name in ('rank', 'snippet') if name in articles.query.annotations]
+    entries = list(articles.prefetch_related(None).values(*fields)[:MAX_CACHED_RESULTS + 1])
+    return {'entries': entries if len(entries) <= MAX_CACHED_RESULTS else None}
+
+
+def hydrate(entries, request):
+    """
+    Return the representations of a page of cached entries: the shared
+    payload of the articles from the article cache, fetching the missing
+    ones in one query, the fields of the reader loaded in one batch
+    """
+    article_ids = [entry['id'] for entry in entries]
+    versions = article_versions(article_ids)
+    payloads = get_payloads(versions)
+
+    serializer = ArticleSerializer(context={'request': request})
+    missing = [article_id for article_id in article_ids if article_id not in payloads]
+    if missing:
+        articles = Articles.objects.for_listing().filter(id__in=missing)
+        fetched = {
+            data['id']: ArticleSerializer.shared_representation(data)
+            for data in ArticleSerializer(articles, many=True, context=serializer.context).data
+        }
+        set_payloads(versions, fetched)
+        payloads.update(fetched)
+
+    viewer = serializer.viewer_representations([Articles(pk=article_id) for article_id in article_ids])
+    return [
+        # a deleted article has no payload, it drops out of the page
+        dict(payloads[entry['id']], **viewer_data, **{
+            name: value for name, value in entry.items() if name != 'id'
+        })
+        for entry, viewer_data in zip(entries, viewer) if entry['id'] in payloads
+    ]
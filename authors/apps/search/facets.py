@@ -0,0 +1,88 @@
+"""
+Facet counts of the article search: how many of the matching articles
+have each tag, author, rating and month, to build filter sidebars.
+
+Each facet is one grouped aggregate over the matching article ids, so
+the counts cost a handful of queries whatever the number of matches.
+They are cached for a short while per normalized query, and dropped
+by the writes that bump the search generation.
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import (Count,
+                              Q, )
+from django.db.models.functions import TruncMonth
+from taggit.models import TaggedItem
+
+from authors.apps.articles.models import Articles
+from authors.apps.search.cache import search_key
+
+FACETS_CACHE_TIMEOUT = 60
+# entries of the tag and author facets
+FACET_SIZE = 10
+MONTHS = 12
+
+
+def tag_facet(matched):
+    return [
+        {'tag': row['tag__name'], 'count': row['count']}
+        for row in TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Articles), object_id__in=matched,
+        ).values('tag__name').annotate(count=Count('id')).order_by('-count', 'tag__name')[:FACET_SIZE]
+    ]
+
+
+def author_facet(matched):
+    return [
+        {'author': row['author__username'], 'count': row['count']}
+        for row in Articles.objects.filter(pk__in=matched).values('author__username').annotate(
+            count=Count('id')).order_by('-count', 'author__username')[:FACET_SIZE]
+    ]
+
+
+def rating_facet(matched):
+    """Articles per star of their average rating, in one pass"""
+    counts = Articles.objects.filter(pk__in=matched).aggregate(
+        unrated=Count('id', filter=Q(rating_count=0)),
+        **{
+            str(stars): Count('id', filter=Q(rating_count__gt=0, average_rating__gte=stars,
+                                             average_rating__lt=stars + 1))
+            for stars in Articles.RATING_VALUES
+        },
+    )
+    buckets = [{'rating': stars, 'count': counts[str(stars)]} for stars in Articles.RATING_VALUES]
+    return buckets + [{'rating': None, 'count': counts['unrated']}]
+
+
+def month_facet(matched):
+    """Articles per month of creation, latest first"""
+    return [
+        {'month': row['month'].strftime('%Y-%m'), 'count': row['count']}
+        for row in Articles.objects.filter(pk__in=matched).annotate(
+            month=TruncMonth('created_at'),
+        ).order_by().values('month').annotate(count=Count('id')).order_by('-month')[:MONTHS]
+    ]
+
+
+def compute_facets(articles):
+    matched = articles.order_by().values('pk')
+    return {
+        'tags': tag_facet(matched),
+        'authors': author_facet(matched),
+        'ratings': rating_facet(matched),
+        'months': month_facet(matched),
+    }
+
+
+def article_facets(articles, query_params):
+    """
+    Return the facet counts of the filtered `articles`, from the cache
+    when the same search was counted less than FACETS_CACHE_TIMEOUT ago
+    and nothing was written since
+    """
+    key = search_key('facets', query_params)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_facets(articles)
+        cache.set(key, facets, FACETS_CACHE_TIMEOUT)
+    return facets
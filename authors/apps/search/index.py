@@ -0,0 +1,113 @@
+"""
+In-memory inverted index of articles scored with BM25.
+
+Every term maps to a postings list of {article id: term frequency}, so a
+query only visits the articles containing its terms. Terms of the title
+and description count more than terms of the body, mirroring the weights
+of the database search vector.
+"""
+import heapq
+import math
+import re
+import threading
+from collections import (Counter,
+                         defaultdict, )
+
+TAG = re.compile(r'<[^>]*>')
+TOKEN = re.compile(r'\w+')
+STOP_WORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+    'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'with',
+))
+
+
+def tokenize(text):
+    """Lower case words of a text (or HTML) without the stop words"""
+    words = TOKEN.findall(TAG.sub(' ', text or '').lower())
+    return [word for word in words if word not in STOP_WORDS]
+
+
+class InvertedIndex:
+    """
+    Postings lists with BM25 scoring, updated one document at a time.
+    A document is a dict of field name to text.
+    """
+    # BM25 term frequency saturation and length normalisation
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self, field_weights):
+        self.field_weights = dict(field_weights)
+        self.postings = defaultdict(dict)
+        # terms and weighted length of each document
+        self.terms = {}
+        self.lengths = {}
+        self.total_length = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.lengths
+
+    def term_frequencies(self, document):
+        """Return the weighted frequency of each term of a document"""
+        frequencies = Counter()
+        for field, weight in self.field_weights.items():
+            for term in tokenize(document.get(field)):
+                frequencies[term] += weight
+        return frequencies
+
+    def add(self, doc_id, document):
+        """Index a document, replacing its previous version"""
+        frequencies = self.term_frequencies(document)
+        with self.lock:
+            self._remove(doc_id)
+            for term, frequency in frequencies.items():
+                self.postings[term][doc_id] = frequency
+            self.terms[doc_id] = list(frequencies)
+            self.lengths[doc_id] = sum(frequencies.values())
+            self.total_length += self.lengths[doc_id]
+
+    def remove(self, doc_id):
+        with self.lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        length = self.lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        for term in self.terms.pop(doc_id):
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+
+    def search(self, query, limit=None, accept=None):
+        """
+        Return [(doc_id, score)] of the documents containing any term
+        of the query, best first, those for which `accept(doc_id)` is
+        false are skipped
+        """
+        terms = set(tokenize(query))
+        with self.lock:
+            count = len(self.lengths)
+            if not count:
+                return []
+            average_length = self.total_length / count
+            scores = defaultdict(float)
+            for term in terms:
+                postings = self.postings.get(term, {})
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    if accept is not None and not accept(doc_id):
+                        continue
+                    norm = 1 - self.b + self.b * self.lengths[doc_id] / average_length
+                    scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+
+        best_first = lambda item: (item[1], item[0])
+        if limit:
+            return heapq.nlargest(limit, scores.items(), key=best_first)
+        return sorted(scores.items(), key=best_first, reverse=True)
@@ -0,0 +1,74 @@
+"""
+Typo tolerant search of users by username and profile names.
+
+Matching uses pg_trgm: two strings are similar when they share enough of
+their three letter sequences, and the GIN trigram indexes on the username
+and the profile names find the similar rows without scanning the tables.
+The username and the names live in different tables, so each is searched
+on its own index and the best matches are merged by their similarity.
+"""
+import heapq
+import re
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Q
+from django.db.models.functions import Greatest
+
+from authors.apps.authentication.models import User
+from authors.apps.profiles.models import Profile
+from authors.apps.search.backends import (MAX_RANKED_RESULTS,
+                                          rank_of, )
+
+
+def starts_with(field, prefix):
+    """
+    Case insensitive prefix filter the trigram indexes can serve,
+    unlike `istartswith` which compares UPPER() of the column
+    """
+    return Q(**{'{}__iregex'.format(field): '^' + re.escape(prefix)})
+
+
+def similar_to(field, query):
+    return Q(**{'{}__trigram_similar'.format(field): query})
+
+
+def matching_profiles(query, prefix=False):
+    """
+    Return [(profile id, similarity)] of the best matches for `query`,
+    profiles whose username or names start with it in `prefix` mode
+    """
+    match = starts_with if prefix else similar_to
+    by_username = Profile.objects.filter(match('user__username', query)).annotate(
+        similarity=TrigramSimilarity('user__username', query))
+    by_name = Profile.objects.filter(
+        match('first_name', query) | match('last_name', query)
+    ).annotate(similarity=Greatest(TrigramSimilarity('first_name', query),
+                                   TrigramSimilarity('last_name', query)))
+
+    best = {}
+    for matches in (by_username, by_name):
+        for profile_id, similarity in matches.order_by('-similarity').values_list(
+                'id', 'similarity')[:MAX_RANKED_RESULTS]:
+            best[profile_id] = max(similarity or 0.0, best.get(profile_id, 0.0))
+    return heapq.nlargest(MAX_RANKED_RESULTS, best.items(), key=lambda item: (item[1], -item[0]))
+
+
+def search_profiles(queryset, query, prefix=False):
+    """
+    Return the profiles of `queryset` matching `query`, most similar first,
+    annotated with their `similarity`
+    """
+    scores = matching_profiles(query, prefix=prefix)
+    return queryset.filter(id__in=[profile_id for profile_id, _ in scores]).annotate(
+        similarity=rank_of(scores),
+    ).order_by('-similarity', 'user__username')
+
+
+def closest_username(query):
+    """
+    Subquery of the id of the user whose username is the most similar
+    to `query`, an exact match being the most similar of all
+    """
+    return User.objects.filter(username__trigram_similar=query).annotate(
+        similarity=TrigramSimilarity('username', query),
+    ).order_by('-similarity', 'username').values('id')[:1]
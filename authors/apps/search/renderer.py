@@ -11,7 +11,25 @@ class SearchJSONRenderer(JSONRenderer):
         # or something similar), `data` will contain an `errors` key. We want
         # the default JSONRenderer to handle rendering errors, so we need to
         # check for this case.
-        return json.dumps({
-            "articles": data,
+        if 'count' not in data:
+            return super().render(data, media_type, renderer_context)
+        rendered = {
+            "articles": {key: value for key, value in data.items() if key != 'facets'},
             'articlesCount': data['count'],
+        }
+        if 'facets' in data:
+            rendered['facets'] = data['facets']
+        return json.dumps(rendered)
+
+
+class ProfileSearchJSONRenderer(JSONRenderer):
+    charset = 'utf-8'
+
+    def render(self, data, media_type=None, renderer_context=None):
+        if 'count' not in data:
+            # errors are rendered as they come
+            return super().render(data, media_type, renderer_context)
+        return json.dumps({
+            "profiles": data,
+            'profilesCount': data['count'],
         })
@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from authors.apps.articles.serializers import ArticleSerializer
+from authors.apps.profiles.serializers import GetProfileSerializer
+
+
+class ArticleSearchSerializer(ArticleSerializer):
+    """
+    An article in the search results, with its rank and the fragments
+    of its body that match the query when searched by text
+    """
+    rank = serializers.ReadOnlyField()
+    snippet = serializers.ReadOnlyField()
+
+    class Meta(ArticleSerializer.Meta):
+        fields = ArticleSerializer.Meta.fields + ('rank', 'snippet')
+
+
+class ProfileSearchSerializer(GetProfileSerializer):
+    """
+    A profile in the search results, with the similarity of its
+    username or names to the query
+    """
+    similarity = serializers.ReadOnlyField()
+
+    class Meta(GetProfileSerializer.Meta):
+        fields = GetProfileSerializer.Meta.fields + ('similarity',)
@@ -0,0 +1,76 @@
+from django.db import connections
+from django.db.models.signals import (m2m_changed,
+                                      post_delete,
+                                      post_save,
+                                      pre_migrate, )
+from django.dispatch import receiver
+from taggit.models import Tag
+
+from authors.apps.articles.models import (Articles,
+                                          Favorite,
+                                          Ratings, )
+from authors.apps.search.backends import get_search_backend
+from authors.apps.search.cache import bump_generation
+from authors.apps.search.suggest import suggestions
+
+
+@receiver(post_save, sender=Articles)
+def index_article(sender, **kwargs):
+    """
+    Keep the search backend in step with saved articles
+    """
+    get_search_backend().index(kwargs.get('instance'))
+    suggestions.add_article(kwargs.get('instance'))
+
+
+@receiver(post_delete, sender=Articles)
+def remove_article_from_index(sender, **kwargs):
+    """
+    Keep the search backend in step with deleted articles
+    """
+    get_search_backend().remove(kwargs.get('instance').pk)
+    suggestions.remove_article(kwargs.get('instance').pk)
+
+
+@receiver(post_save, sender=Tag)
+def index_tag(sender, **kwargs):
+    """
+    Keep the tag suggestions in step with saved tags
+    """
+    suggestions.add_tag(kwargs.get('instance'))
+
+
+@receiver(post_delete, sender=Tag)
+def remove_tag_from_index(sender, **kwargs):
+    """
+    Keep the tag suggestions in step with deleted tags
+    """
+    suggestions.remove_tag(kwargs.get('instance').pk)
+
+
+@receiver(post_save, sender=Articles)
+@receiver(post_delete, sender=Articles)
+@receiver(m2m_changed, sender=Articles.tags.through)
+@receiver(post_save, sender=Favorite)
+@receiver(post_delete, sender=Favorite)
+@receiver(post_save, sender=Ratings)
+@receiver(post_delete, sender=Ratings)
+def invalidate_search_results(sender, **kwargs):
+    """
+    Drop the cached search results and facets after a write that can
+    change which articles match a search or the order they come in
+    """
+    bump_generation()
+
+
+@receiver(pre_migrate, dispatch_uid='search_create_trigram_extension')
+def create_trigram_extension(sender, using, **kwargs):
+    """
+    Install pg_trgm ahead of the migrations that create the trigram
+    indexes of the user search, migrations are generated on release
+    so they can not carry a TrigramExtension operation
+    """
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
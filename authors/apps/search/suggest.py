@@ -0,0 +1,255 @@
+"""
+Type-ahead suggestions of article titles and tag names.
+
+Suggestions are served from sorted arrays held in the memory of the
+process: all the keys starting with a prefix are a contiguous run of the
+array, found with a binary search, so a keystroke costs no query.
+Every word of a title starts a key, "gardening with tomatoes" is
+suggested for "gar", "with t" and "tom".
+
+The arrays are built from the database on the first suggestion and kept
+current by the post_save/post_delete receivers of articles and tags.
+The receivers only see the writes of their own process, so the arrays
+are also rebuilt when they get older than `max_age` seconds.
+A build reads every title, about 3.3s for 100k articles, so it runs in a
+background thread: the previous arrays keep serving until the new ones
+are swapped in, and suggestions are queried from the database until the
+first arrays are ready.
+"""
+import bisect
+import threading
+import time
+
+from django.db import connection
+from django.db.models import Q
+from taggit.models import Tag
+
+from authors.apps.articles.models import Articles
+from authors.apps.search.index import TOKEN
+
+# longest prefix stored in the arrays, longer queries are checked
+# against the full title
+KEY_LENGTH = 32
+
+
+def normalize(text):
+    """Lower case words of a text separated by single spaces"""
+    return ' '.join(TOKEN.findall((text or '').lower()))
+
+
+class PrefixIndex:
+    """
+    Sorted (key, item id) pairs, updated one item at a time.
+    An item can have several keys, it is found by a prefix of any of them.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.keys = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def load(self, items):
+        """Replace the contents by the (item id, keys) of `items`"""
+        keys = {item_id: sorted(set(item_keys)) for item_id, item_keys in items}
+        entries = sorted((key, item_id) for item_id, item_keys in keys.items() for key in item_keys)
+        with self.lock:
+            self.keys, self.entries = keys, entries
+
+    def add(self, item_id, keys):
+        """Index an item, replacing its previous keys"""
+        keys = sorted(set(keys))
+        with self.lock:
+            self._remove(item_id)
+            for key in keys:
+                bisect.insort(self.entries, (key, item_id))
+            self.keys[item_id] = keys
+
+    def remove(self, item_id):
+        with self.lock:
+            self._remove(item_id)
+
+    def _remove(self, item_id):
+        for key in self.keys.pop(item_id, ()):
+            del self.entries[bisect.bisect_left(self.entries, (key, item_id))]
+
+    def search(self, prefix, limit, accept=None):
+        """
+        Return the ids of at most `limit` items with a key starting
+        with `prefix` in the order of their keys, those for which
+        `accept(item_id)` is false are skipped
+        """
+        found = []
+        with self.lock:
+            position = bisect.bisect_left(self.entries, (prefix,))
+            while position < len(self.entries) and len(found) < limit:
+                key, item_id = self.entries[position]
+                if not key.startswith(prefix):
+                    break
+                if item_id not in found and (accept is None or accept(item_id)):
+                    found.append(item_id)
+                position += 1
+        return found
+
+
+class SuggestArrays:
+    """Prefix indexes of the article titles and the tag names"""
+
+    def __init__(self):
+        self.titles = PrefixIndex()
+        self.tags = PrefixIndex()
+        # slug and title of the articles, name of the tags
+        self.articles = {}
+        self.tag_names = {}
+
+    @staticmethod
+    def title_keys(title):
+        words = normalize(title).split(' ')
+        return [' '.join(words[start:])[:KEY_LENGTH] for start in range(len(words))]
+
+    @staticmethod
+    def tag_keys(name):
+        return [normalize(name)[:KEY_LENGTH]]
+
+    def load(self):
+        """Index every stored article and tag"""
+        self.articles = {values['id']: (values['slug'], values['title'])
+                         for values in Articles.objects.order_by().values('id', 'slug', 'title').iterator()}
+        self.tag_names = dict(Tag.objects.order_by().values_list('id', 'name').iterator())
+        self.titles.load((article_id, self.title_keys(title)) for article_id, (_, title) in self.articles.items())
+        self.tags.load((tag_id, self.tag_keys(name)) for tag_id, name in self.tag_names.items())
+
+    def add_article(self, article_id, slug, title):
+        self.articles[article_id] = (slug, title)
+        self.titles.add(article_id, self.title_keys(title))
+
+    def remove_article(self, article_id):
+        self.titles.remove(article_id)
+        self.articles.pop(article_id, None)
+
+    def add_tag(self, tag_id, name):
+        self.tag_names[tag_id] = name
+        self.tags.add(tag_id, self.tag_keys(name))
+
+    def remove_tag(self, tag_id):
+        self.tags.remove(tag_id)
+        self.tag_names.pop(tag_id, None)
+
+    def suggest(self, query, limit):
+        prefix = query[:KEY_LENGTH]
+        accept = None
+        if len(query) > KEY_LENGTH:
+            def accept(article_id):
+                _, title = self.articles.get(article_id, ('', ''))
+                return ' ' + query in ' ' + normalize(title)
+
+        articles = [self.articles.get(article_id)
+                    for article_id in self.titles.search(prefix, limit, accept=accept)]
+        tag_names = [self.tag_names.get(tag_id) for tag_id in self.tags.search(prefix, limit)]
+        # skipping what a concurrent write removed since the search
+        return {
+            'articles': [{'slug': slug, 'title': title} for slug, title in filter(None, articles)],
+            'tags': list(filter(None, tag_names)),
+        }
+
+
+class SuggestIndex:
+    """
+    The arrays serving the suggestions, rebuilt in a background thread
+    while the previous arrays keep serving
+    """
+    max_age = 300
+
+    def __init__(self):
+        self.arrays = None
+        self.built_at = None
+        self.lock = threading.Lock()
+        # writes seen while a build runs, replayed on the new arrays
+        self.pending = None
+
+    def build(self):
+        """Load new arrays from the database and swap them in"""
+        with self.lock:
+            if self.pending is None:
+                self.pending = []
+        arrays = SuggestArrays()
+        try:
+            arrays.load()
+        except Exception:
+            with self.lock:
+                self.pending = None
+            raise
+        with self.lock:
+            for method, args in self.pending:
+                getattr(arrays, method)(*args)
+            self.arrays, self.built_at, self.pending = arrays, time.monotonic(), None
+
+    def build_in_background(self):
+        try:
+            self.build()
+        finally:
+            connection.close()
+
+    def start_build(self):
+        """Build new arrays in a thread unless a build is running"""
+        with self.lock:
+            if self.pending is not None:
+                return
+            self.pending = []
+        threading.Thread(target=self.build_in_background, daemon=True).start()
+
+    def invalidate(self):
+        """Rebuild the arrays on the next suggestion"""
+        self.built_at = None
+
+    def ensure_built(self):
+        if self.built_at is None or time.monotonic() - self.built_at > self.max_age:
+            self.start_build()
+
+    def write(self, method, *args):
+        """Apply a write to the serving arrays and to those being built"""
+        with self.lock:
+            if self.pending is not None:
+                self.pending.append((method, args))
+            arrays = self.arrays
+        if arrays is not None:
+            getattr(arrays, method)(*args)
+
+    def add_article(self, article):
+        self.write('add_article', article.pk, article.slug, article.title)
+
+    def remove_article(self, article_id):
+        self.write('remove_article', article_id)
+
+    def add_tag(self, tag):
+        self.write('add_tag', tag.pk, tag.name)
+
+    def remove_tag(self, tag_id):
+        self.write('remove_tag', tag_id)
+
+    def suggest_from_database(self, query, limit):
+        """Suggestions queried while the first arrays are built"""
+        articles = Articles.objects.filter(
+            Q(title__istartswith=query) | Q(title__icontains=' ' + query)
+        ).order_by('title').values('slug', 'title')[:limit]
+        tag_names = Tag.objects.filter(name__istartswith=query).order_by('name').values_list('name', flat=True)
+        return {'articles': list(articles), 'tags': list(tag_names[:limit])}
+
+    def suggest(self, query, limit=10):
+        """
+        Return the slug and title of the articles and the names
+        of the tags starting with `query`, or one of their words
+        """
+        query = normalize(query)
+        if not query:
+            return {'articles': [], 'tags': []}
+        self.ensure_built()
+        arrays = self.arrays
+        if arrays is None:
+            return self.suggest_from_database(query, limit)
+        return arrays.suggest(query, limit)
+
+
+suggestions = SuggestIndex()
@@ -0,0 +1,62 @@
+"""
+Benchmark of keyword search latency of the in-memory inverted index
+against the icontains scan it replaces, for growing numbers of articles.
+
+Not part of the default test run, run it with
+    python manage.py test authors.apps.search.tests.bench_search
+Set BENCH_SEARCH_SIZES e.g `1000,10000` to change the numbers of articles.
+"""
+import os
+import random
+import time
+
+from django.db.models import Q
+from django.test import TestCase
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+from authors.apps.search.backends import InvertedIndexSearchBackend
+
+SIZES = [int(size) for size in os.environ.get('BENCH_SEARCH_SIZES', '10000,100000').split(',')]
+QUERIES = ['garden', 'tomato', 'balcony', 'water']
+REPEAT = 5
+WORDS = ['word{}'.format(number) for number in range(5000)] + QUERIES
+
+
+def random_text(words):
+    return ' '.join(random.choice(WORDS) for _ in range(words))
+
+
+class SearchBenchmark(TestCase):
+
+    def time_queries(self, search):
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            for query in QUERIES:
+                # the first page, as served by the search endpoint
+                list(search(query)[:20])
+        return (time.perf_counter() - start) / (REPEAT * len(QUERIES)) * 1000
+
+    def test_inverted_index_against_icontains(self):
+        random.seed(0)
+        user = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        queryset = Articles.objects.all()
+        created = 0
+
+        print('\narticles -> ms per query (icontains / inverted index)')
+        for size in SIZES:
+            Articles.objects.bulk_create([
+                Articles(author=user, slug='bench-{}'.format(number), title=random_text(6),
+                         description=random_text(12), body=random_text(200))
+                for number in range(created, size)
+            ], batch_size=1000)
+            created = size
+
+            backend = InvertedIndexSearchBackend()
+            backend.build()
+            icontains = self.time_queries(lambda query: queryset.filter(
+                Q(title__icontains=query) | Q(description__icontains=query) | Q(body__icontains=query)
+            ).order_by('-created_at'))
+            inverted = self.time_queries(lambda query: backend.search(queryset, query))
+            print('{:>8} -> {:.2f} / {:.2f}'.format(size, icontains, inverted))
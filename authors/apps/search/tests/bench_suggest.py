@@ -0,0 +1,61 @@
+"""
+Benchmark of the latency of title suggestions from the prefix index
+against the title icontains scan of the article search it replaces.
+
+Not part of the default test run, run it with
+    python manage.py test authors.apps.search.tests.bench_suggest
+Set BENCH_SUGGEST_SIZES e.g `1000,10000` to change the numbers of articles.
+"""
+import os
+import random
+import time
+
+from django.test import TestCase
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+from authors.apps.search.suggest import SuggestIndex
+
+SIZES = [int(size) for size in os.environ.get('BENCH_SUGGEST_SIZES', '10000,100000').split(',')]
+PREFIXES = ['g', 'gar', 'garden', 'tomato b', 'word12']
+REPEAT = 20
+WORDS = ['word{}'.format(number) for number in range(5000)] + ['garden', 'tomato', 'balcony']
+
+
+def random_text(words):
+    return ' '.join(random.choice(WORDS) for _ in range(words))
+
+
+class SuggestBenchmark(TestCase):
+
+    def time_prefixes(self, suggest):
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            for prefix in PREFIXES:
+                suggest(prefix)
+        return (time.perf_counter() - start) / (REPEAT * len(PREFIXES)) * 1000
+
+    def test_prefix_index_against_icontains(self):
+        random.seed(0)
+        user = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        created = 0
+
+        print('\narticles -> ms per keystroke (icontains / prefix index), build ms')
+        for size in SIZES:
+            Articles.objects.bulk_create([
+                Articles(author=user, slug='bench-{}'.format(number), title=random_text(6),
+                         description='', body='')
+                for number in range(created, size)
+            ])
+            created = size
+
+            index = SuggestIndex()
+            start = time.perf_counter()
+            index.build()
+            build = (time.perf_counter() - start) * 1000
+
+            scan = self.time_prefixes(lambda prefix: list(
+                Articles.objects.filter(title__icontains=prefix).values('slug', 'title')[:10]))
+            prefix_index = self.time_prefixes(lambda prefix: index.suggest(prefix))
+            print('{:>8} -> {:8.2f} / {:6.3f}, {:.0f}'.format(size, scan, prefix_index, build))
@@ -0,0 +1,40 @@
+import json
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+
+ARTICLE_SEARCH_URL = reverse('articles:search')
+
+
+class SearchBaseTest(TestCase):
+    """Sets up a writer and a reader for the tests of the article search"""
+
+    def setUp(self):
+        # searches and their facets are cached
+        cache.clear()
+        self.client = APIClient()
+        self.writer = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        self.reader = User.objects.create(
+            username='reader', email='reader@mail.com', password='password')
+
+    def create_article(self, title, *tags, author=None):
+        article = Articles.objects.create(
+            title=title, body='<p>{} for everyone</p>'.format(title), description='tips',
+            author=author or self.writer)
+        article.tags.add(*tags)
+        return article
+
+    def search(self, query, **headers):
+        """The rendered body of the search for the query string `query`"""
+        response = self.client.get('{}?{}'.format(ARTICLE_SEARCH_URL, query), **headers)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def slugs(self, query):
+        return [article['slug'] for article in self.search(query)['articles']['results']]
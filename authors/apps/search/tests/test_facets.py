@@ -0,0 +1,46 @@
+import json
+
+from authors.apps.articles.models import Ratings
+from authors.apps.search.tests.search_base_test import (ARTICLE_SEARCH_URL,
+                                                        SearchBaseTest, )
+
+
+class SearchFacetsTest(SearchBaseTest):
+    """Tests for the facet counts of the article search"""
+
+    def setUp(self):
+        super().setUp()
+        self.python = self.create_article('python tips', 'python', 'web')
+        self.create_article('django tips', 'python', 'django')
+        self.create_article('rust tips', 'rust', author=self.reader)
+        Ratings.objects.create(author=self.reader, article=self.python, value=4, review='good')
+
+    def test_facets_count_every_match(self):
+        body = self.search('facets=true&limit=1')
+        facets = body['facets']
+        self.assertEqual(len(body['articles']['results']), 1)
+        self.assertEqual(facets['tags'][0], {'tag': 'python', 'count': 2})
+        self.assertEqual(len(facets['tags']), 4)
+        self.assertEqual(facets['authors'], [{'author': 'writer', 'count': 2},
+                                             {'author': 'reader', 'count': 1}])
+        ratings = {bucket['rating']: bucket['count'] for bucket in facets['ratings']}
+        self.assertEqual(ratings, {1: 0, 2: 0, 3: 0, 4: 1, 5: 0, None: 2})
+        self.assertEqual(facets['months'], [
+            {'month': self.python.created_at.strftime('%Y-%m'), 'count': 3}])
+
+    def test_facets_follow_the_filters(self):
+        facets = self.search('facets=1&tags=python')['facets']
+        self.assertEqual(facets['authors'], [{'author': 'writer', 'count': 2}])
+        self.assertNotIn('rust', [entry['tag'] for entry in facets['tags']])
+
+    def test_facets_are_grouped_queries_cached_per_normalized_query(self):
+        self.search('tags=python&author=writer')
+        # one grouped query per facet, the page is cached
+        with self.assertNumQueries(4):
+            self.search('facets=true&tags=python&author=writer')
+        with self.assertNumQueries(0):
+            response = self.client.get(ARTICLE_SEARCH_URL + '?author=writer&tags=python&facets=true&offset=1')
+        self.assertEqual(json.loads(response.content)['facets']['authors'][0]['count'], 2)
+
+    def test_facets_are_optional(self):
+        self.assertNotIn('facets', self.search(''))
@@ -0,0 +1,73 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+from authors.apps.search.backends import (ContainsSearchBackend,
+                                          PostgresSearchBackend, )
+
+ARTICLE_SEARCH_URL = reverse('articles:search')
+
+
+class FullTextSearchTest(TestCase):
+    """Tests for the ranked full-text search of articles"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        self.in_title = self.create_article(
+            title='Gardening with tomatoes', description='a short guide', body='<p>water often</p>')
+        self.in_body = self.create_article(
+            title='My summer', description='holiday notes',
+            body='<p>We grew <b>tomatoes</b> on the balcony</p>')
+        self.unrelated = self.create_article(
+            title='Cooking pasta', description='dinner', body='<p>boil the water</p>')
+
+    def create_article(self, **fields):
+        return Articles.objects.create(author=self.user, **fields)
+
+    def search(self, query):
+        response = self.client.get(ARTICLE_SEARCH_URL, {'search': query})
+        return json.loads(response.content)['articles']['results']
+
+    def test_results_are_ranked_by_weight(self):
+        results = self.search('tomato')
+        self.assertEqual([article['slug'] for article in results],
+                         [self.in_title.slug, self.in_body.slug])
+        self.assertGreater(results[0]['rank'], results[1]['rank'])
+
+    def test_snippet_highlights_matches_without_markup(self):
+        snippet = self.search('tomatoes')[1]['snippet']
+        self.assertIn('<mark>tomatoes</mark>', snippet)
+        self.assertNotIn('<b>', snippet)
+
+    def test_vector_follows_edits(self):
+        self.unrelated.body = '<p>boil the tomatoes</p>'
+        self.unrelated.save(update_fields=['body'])
+        self.assertIn(self.unrelated.slug, [article['slug'] for article in self.search('tomato')])
+
+    def test_unsearched_listing_has_no_rank(self):
+        response = self.client.get(ARTICLE_SEARCH_URL)
+        results = json.loads(response.content)['articles']['results']
+        self.assertEqual(len(results), 3)
+        self.assertNotIn('rank', results[0])
+
+    def test_backfill_command_builds_missing_vectors(self):
+        Articles.objects.update(search_vector=None)
+        out = StringIO()
+        call_command('backfill_search_vectors', '--missing', stdout=out)
+        self.assertIn('3 article(s)', out.getvalue())
+        self.assertEqual(len(self.search('tomato')), 2)
+
+    def test_contains_backend_matches_the_same_articles(self):
+        queryset = Articles.objects.all()
+        full_text = PostgresSearchBackend().search(queryset, 'balcony')
+        contains = ContainsSearchBackend().search(queryset, 'balcony')
+        self.assertEqual(list(full_text), list(contains))
+        self.assertEqual(contains[0].snippet, self.in_body.excerpt)
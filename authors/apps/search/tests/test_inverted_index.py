@@ -0,0 +1,90 @@
+import json
+from unittest.mock import patch
+
+from django.test import (TestCase,
+                         override_settings, )
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+from authors.apps.search import backends
+from authors.apps.search.backends import InvertedIndexSearchBackend
+from authors.apps.search.index import (InvertedIndex,
+                                       tokenize, )
+
+INVERTED_INDEX = 'authors.apps.search.backends.InvertedIndexSearchBackend'
+
+
+class InvertedIndexTest(TestCase):
+    """Tests for the postings lists and BM25 scoring of the inverted index"""
+
+    def setUp(self):
+        self.index = InvertedIndex({'title': 3, 'body': 1})
+
+    def test_tokenize_drops_markup_and_stop_words(self):
+        self.assertEqual(tokenize('<p>The <b>Quick</b> fox</p>'), ['quick', 'fox'])
+
+    def test_title_matches_outscore_body_matches(self):
+        self.index.add(1, {'title': 'tomatoes', 'body': 'a guide'})
+        self.index.add(2, {'title': 'summer', 'body': 'tomatoes on the balcony'})
+        self.index.add(3, {'title': 'pasta', 'body': 'boil water'})
+        self.assertEqual([doc_id for doc_id, _ in self.index.search('tomatoes')], [1, 2])
+
+    def test_documents_are_updated_and_removed(self):
+        self.index.add(1, {'title': 'tomatoes', 'body': ''})
+        self.index.add(1, {'title': 'potatoes', 'body': ''})
+        self.assertEqual(self.index.search('tomatoes'), [])
+        self.index.remove(1)
+        self.assertEqual(self.index.search('potatoes'), [])
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(dict(self.index.postings), {})
+
+
+@override_settings(SEARCH_BACKEND=INVERTED_INDEX)
+class InvertedIndexSearchBackendTest(TestCase):
+    """Tests for searching articles through the in-memory index"""
+
+    def setUp(self):
+        # a fresh index for each test
+        patcher = patch.dict(backends._backends, {INVERTED_INDEX: InvertedIndexSearchBackend()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = APIClient()
+        self.user = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        self.article = Articles.objects.create(
+            author=self.user, title='Gardening with tomatoes', description='a guide', body='water often')
+
+    def search(self, query, **params):
+        response = self.client.get(reverse('articles:search'), dict(params, search=query))
+        return [article['slug'] for article in json.loads(response.content)['articles']['results']]
+
+    def test_index_is_built_on_first_search(self):
+        self.assertEqual(self.search('tomatoes'), [self.article.slug])
+        self.assertTrue(backends.get_search_backend().built)
+
+    def test_index_follows_saves_and_deletes(self):
+        self.search('tomatoes')
+        other = Articles.objects.create(
+            author=self.user, title='Summer', description='notes', body='tomatoes on the balcony')
+        self.assertEqual(self.search('tomatoes'), [self.article.slug, other.slug])
+
+        self.article.title = 'Gardening with potatoes'
+        self.article.save()
+        other.delete()
+        self.assertEqual(self.search('tomatoes'), [])
+        self.assertEqual(self.search('potatoes'), [self.article.slug])
+
+    def test_only_the_filtered_articles_are_ranked(self):
+        rare = Articles.objects.create(
+            author=self.user, title='Summer', description='notes', body='tomatoes on the balcony')
+        rare.tags.add('rare')
+        with patch.object(InvertedIndexSearchBackend, 'max_results', 1):
+            self.assertEqual(self.search('tomatoes', tags='rare'), [rare.slug])
+
+    def test_broad_queries_are_searched_in_the_database(self):
+        other = Articles.objects.create(
+            author=self.user, title='Summer', description='notes', body='tomatoes on the balcony')
+        with patch.object(InvertedIndexSearchBackend, 'max_results', 1):
+            self.assertEqual(self.search('tomatoes'), [self.article.slug, other.slug])
@@ -0,0 +1,68 @@
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+
+PROFILE_SEARCH_URL = reverse('profiles:search')
+ARTICLE_SEARCH_URL = reverse('articles:search')
+
+
+class ProfileSearchTest(TestCase):
+    """Tests for the typo tolerant search of users"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.jonathan = self.create_user('jonathan', first_name='Jonathan', last_name='Mwangi')
+        self.joanna = self.create_user('joanna_k', first_name='Joanna', last_name='Kamau')
+        self.peter = self.create_user('peterpan', first_name='Peter', last_name='Otieno')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.peter.token}')
+
+    def create_user(self, username, **names):
+        user = User.objects.create(
+            username=username, email=f'{username}@mail.com', password='password')
+        profile = user.profile
+        for field, value in names.items():
+            setattr(profile, field, value)
+        profile.save()
+        return user
+
+    def search(self, **params):
+        response = self.client.get(PROFILE_SEARCH_URL, params)
+        return json.loads(response.content)['profiles']['results']
+
+    def test_misspelt_username_finds_the_user(self):
+        results = self.search(search='jonathn')
+        self.assertEqual(results[0]['username'], 'jonathan')
+        self.assertGreater(results[0]['similarity'], 0)
+
+    def test_names_are_searched(self):
+        results = self.search(search='otieno')
+        self.assertEqual([profile['username'] for profile in results], ['peterpan'])
+
+    def test_prefix_mode_autocompletes(self):
+        results = self.search(search='jo', mode='prefix')
+        self.assertEqual({profile['username'] for profile in results}, {'jonathan', 'joanna_k'})
+        self.assertEqual(self.search(search='kam', mode='prefix')[0]['username'], 'joanna_k')
+
+    def test_unrelated_query_has_no_results(self):
+        self.assertEqual(self.search(search='zzzz'), [])
+        self.assertEqual(self.search(), [])
+
+    def test_search_requires_authentication(self):
+        self.client.credentials()
+        response = self.client.get(PROFILE_SEARCH_URL, {'search': 'jonathan'})
+        self.assertEqual(response.status_code, 403)
+
+    def test_article_author_filter_tolerates_typos(self):
+        article = Articles.objects.create(
+            title='fuzzy authors', body='body', description='description', author=self.jonathan)
+        Articles.objects.create(
+            title='other author', body='body', description='description', author=self.joanna)
+        for author in ('jonathan', 'jonatan'):
+            response = self.client.get(ARTICLE_SEARCH_URL, {'author': author})
+            results = json.loads(response.content)['articles']['results']
+            self.assertEqual([result['slug'] for result in results], [article.slug])
@@ -0,0 +1,84 @@
+from django.db import connection
+from django.http import QueryDict
+from django.test import TestCase
+
+from authors.apps.articles.models import (Articles,
+                                          Favorite, )
+from authors.apps.search.backends import PostgresSearchBackend
+from authors.apps.search.tests.search_base_test import (ARTICLE_SEARCH_URL,
+                                                        SearchBaseTest, )
+from authors.apps.search.views import ArticleFilter
+
+
+class ArticleFilterTest(SearchBaseTest):
+    """Tests for the combined filters of the article search"""
+
+    def setUp(self):
+        super().setUp()
+        self.python = self.create_article('python tips', 'python', 'web')
+        self.django = self.create_article('django tips', 'python', 'django', 'web')
+        self.rust = self.create_article('rust tips', 'rust')
+        Favorite.objects.create(user_id=self.reader, article_id=self.python)
+        Favorite.objects.create(user_id=self.reader, article_id=self.django)
+
+    def matches(self, query):
+        return set(self.slugs(query))
+
+    def test_tags_match_any_or_all_without_duplicates(self):
+        response = self.client.get(f'{ARTICLE_SEARCH_URL}?tags=python,web')
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(self.matches('tags=python,web&tags_match=all'),
+                         {self.python.slug, self.django.slug})
+        self.assertEqual(self.matches('tags=python,django&tags_match=all'), {self.django.slug})
+
+    def test_filters_combine(self):
+        self.assertEqual(self.matches('favorited=reader&tags=django'), {self.django.slug})
+        self.assertEqual(self.matches('favorited=reader&search=python&author=writer'),
+                         {self.python.slug})
+        self.assertEqual(self.matches('favorited=reader&tags=rust'), set())
+
+    def test_rating_and_date_range(self):
+        Articles.objects.filter(pk=self.rust.pk).update(average_rating=4.5)
+        self.assertEqual(self.matches('min_rating=4'), {self.rust.slug})
+        day = self.python.created_at.date().isoformat()
+        self.assertEqual(self.matches(f'created_before={day}'), set())
+        self.assertEqual(len(self.matches(f'created_after={day}')), 3)
+
+    def test_invalid_filter_is_a_bad_request(self):
+        response = self.client.get(ARTICLE_SEARCH_URL, {'min_rating': 'high'})
+        self.assertEqual(response.status_code, 400)
+
+
+class ArticleFilterPlanTest(TestCase):
+    """
+    Every combination of the search filters is served by indexes:
+    with sequential scans disabled, the planner only falls back to one
+    when no index can serve the query
+    """
+    combinations = [
+        'author=writer',
+        'tags=python,web',
+        'tags=python,web&tags_match=all',
+        'favorited=reader',
+        'created_after=2019-01-01&created_before=2019-02-01',
+        'min_rating=4',
+        'search=python',
+        'author=writer&tags=python&favorited=reader',
+        'tags=python&tags_match=all&min_rating=3&created_after=2019-01-01',
+        'search=python&favorited=reader&tags=web',
+    ]
+
+    def plan(self, query):
+        data = QueryDict(query)
+        articles = Articles.objects.all()
+        if 'search' in data:
+            articles = PostgresSearchBackend().search(articles, data['search'])
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        return ArticleFilter(data, queryset=articles).qs.explain()
+
+    def test_every_combination_uses_indexes(self):
+        for query in self.combinations:
+            with self.subTest(query=query):
+                plan = self.plan(query)
+                self.assertNotIn('Seq Scan', plan)
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.articles.models import (Favorite,
+                                          LikeDislike, )
+from authors.apps.search import cache as search_cache
+from authors.apps.search.tests.search_base_test import SearchBaseTest
+
+
+class SearchResultCacheTest(SearchBaseTest):
+    """Tests for the cached ids of the article search and their invalidation"""
+
+    def setUp(self):
+        super().setUp()
+        self.python = self.create_article('python tips', 'python')
+        self.django = self.create_article('django tips', 'python', 'django')
+
+    def articles(self, query, **headers):
+        return self.search(query, **headers)['articles']
+
+    def test_repeated_search_is_served_from_the_cache(self):
+        first = self.articles('tags=python')
+        with self.assertNumQueries(0):
+            second = self.articles('tags=python')
+        self.assertEqual(first, second)
+        self.assertEqual(first['count'], 2)
+
+    def test_parameter_order_and_paging_share_the_cached_ids(self):
+        self.articles('tags=python&author=writer')
+        with self.assertNumQueries(0):
+            page = self.articles('author=writer&tags=python&limit=1&offset=1')
+        self.assertEqual(page['count'], 2)
+        self.assertEqual([article['slug'] for article in page['results']], [self.python.slug])
+
+    def test_cached_text_search_keeps_rank_and_snippet(self):
+        first = self.articles('search=django')['results']
+        second = self.articles('search=django')['results']
+        self.assertEqual(first, second)
+        self.assertIn('<mark>django</mark>', second[0]['snippet'])
+        self.assertGreater(second[0]['rank'], 0)
+
+    def test_writes_drop_the_cached_results(self):
+        self.assertEqual(self.slugs('tags=django'), [self.django.slug])
+        self.python.tags.add('django')
+        self.assertEqual(len(self.slugs('tags=django')), 2)
+
+        self.assertEqual(self.slugs('favorited=reader'), [])
+        Favorite.objects.create(user_id=self.reader, article_id=self.python)
+        self.assertEqual(self.slugs('favorited=reader'), [self.python.slug])
+
+        rust = self.create_article('rust tips', 'django')
+        self.assertEqual(len(self.slugs('tags=django')), 3)
+        rust.delete()
+        self.assertEqual(len(self.slugs('tags=django')), 2)
+
+    def test_a_bump_from_another_worker_drops_the_cached_results(self):
+        self.articles('tags=python')
+        # as a write handled by another worker would, through the shared cache
+        cache.incr(search_cache.GENERATION_KEY)
+        with CaptureQueriesContext(connection) as queries:
+            self.articles('tags=python')
+        self.assertTrue(queries.captured_queries)
+
+    def test_article_edits_show_in_cached_pages(self):
+        self.articles('tags=python')
+        self.python.title = 'python tricks'
+        self.python.save()
+        titles = [article['title'] for article in self.articles('tags=python')['results']]
+        self.assertIn('python tricks', titles)
+
+    def test_reader_fields_are_not_shared(self):
+        self.reader.is_verified = True
+        self.reader.save()
+        self.django.likes.create(user=self.reader, vote=LikeDislike.LIKE)
+        self.articles('tags=django')
+        reader = self.articles('tags=django', HTTP_AUTHORIZATION=f'Bearer {self.reader.token}')
+        anonymous = self.articles('tags=django')
+        self.assertTrue(reader['results'][0]['has_liked'])
+        self.assertFalse(anonymous['results'][0]['has_liked'])
+
+    def test_large_results_are_paged_from_the_database(self):
+        with patch.object(search_cache, 'MAX_CACHED_RESULTS', 1):
+            results = self.articles('tags=python&limit=1')
+            self.assertEqual(results['count'], 2)
+            self.assertEqual(len(results['results']), 1)
@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from taggit.models import Tag
+
+from authors.apps.articles.models import Articles
+from authors.apps.authentication.models import User
+from authors.apps.search.suggest import (KEY_LENGTH,
+                                         PrefixIndex,
+                                         SuggestArrays,
+                                         SuggestIndex,
+                                         suggestions, )
+
+SUGGEST_URL = reverse('search:suggest')
+
+
+class PrefixIndexTest(TestCase):
+    """Tests for the sorted arrays behind the suggestions"""
+
+    def setUp(self):
+        self.index = PrefixIndex()
+
+    def test_items_are_found_by_any_key_once(self):
+        self.index.add(1, ['tomato soup', 'soup'])
+        self.index.add(2, ['tomatillo'])
+        self.index.add(3, ['potato'])
+        self.assertEqual(self.index.search('tom', 10), [2, 1])
+        self.assertEqual(self.index.search('s', 10), [1])
+        self.assertEqual(self.index.search('tom', 1), [2])
+
+    def test_items_are_replaced_and_removed(self):
+        self.index.add(1, ['tomato'])
+        self.index.add(1, ['potato'])
+        self.assertEqual(self.index.search('tom', 10), [])
+        self.index.remove(1)
+        self.assertEqual(self.index.search('pot', 10), [])
+        self.assertEqual(self.index.entries, [])
+
+
+class SuggestViewTest(TestCase):
+    """Tests for the type-ahead of article titles and tags"""
+
+    def setUp(self):
+        suggestions.build()
+        self.client = APIClient()
+        self.user = User.objects.create(
+            username='writer', email='writer@mail.com', password='password')
+        self.article = Articles.objects.create(
+            title='Gardening with Tomatoes', description='guide', body='body',
+            author=self.user)
+        self.article.tags.add('garden', 'tomato')
+
+    def suggest(self, query, **params):
+        response = self.client.get(SUGGEST_URL, dict(search=query, **params))
+        self.assertEqual(response.status_code, 200)
+        return response.data['suggestions']
+
+    def test_titles_and_tags_are_suggested_by_prefix(self):
+        self.assertEqual(self.suggest('Gar'), {
+            'articles': [{'slug': self.article.slug, 'title': 'Gardening with Tomatoes'}],
+            'tags': ['garden'],
+        })
+
+    def test_titles_are_suggested_by_the_prefix_of_any_word(self):
+        self.assertEqual(len(self.suggest('tom')['articles']), 1)
+        self.assertEqual(len(self.suggest('with  tom')['articles']), 1)
+        self.assertEqual(self.suggest('ening'), {'articles': [], 'tags': []})
+
+    def test_suggestions_follow_writes_without_queries(self):
+        self.suggest('gar')
+        other = Articles.objects.create(
+            title='Garlic bread', description='recipe', body='body', author=self.user)
+        Tag.objects.create(name='garlic')
+        with self.assertNumQueries(0):
+            suggested = self.suggest('garl')
+        self.assertEqual(suggested['articles'], [{'slug': other.slug, 'title': 'Garlic bread'}])
+        self.assertEqual(suggested['tags'], ['garlic'])
+
+        other.delete()
+        self.assertEqual(self.suggest('garl')['articles'], [])
+
+    def test_long_queries_are_checked_against_the_title(self):
+        title = 'a rather long title about ' + 'x' * KEY_LENGTH
+        Articles.objects.create(title=title, description='d', body='body', author=self.user)
+        self.assertEqual(len(self.suggest(title)['articles']), 1)
+        self.assertEqual(self.suggest(title[:-1] + 'y')['articles'], [])
+
+    def test_limit_and_empty_query(self):
+        for number in range(3):
+            Articles.objects.create(
+                title=f'tomatoes {number}', description='d', body='body', author=self.user)
+        self.assertEqual(len(self.suggest('tom', limit=2)['articles']), 2)
+        self.assertEqual(self.suggest('  '), {'articles': [], 'tags': []})
+
+    def test_first_suggestions_are_queried_while_building(self):
+        index = SuggestIndex()
+        with patch.object(index, 'start_build') as start_build:
+            self.assertEqual(index.suggest('tom'), {
+                'articles': [{'slug': self.article.slug, 'title': 'Gardening with Tomatoes'}],
+                'tags': ['tomato'],
+            })
+        start_build.assert_called_once_with()
+
+    def test_stale_arrays_keep_serving_while_rebuilt(self):
+        suggestions.built_at -= suggestions.max_age + 1
+        with patch.object(suggestions, 'start_build') as start_build, self.assertNumQueries(0):
+            self.assertEqual(len(self.suggest('gar')['articles']), 1)
+        start_build.assert_called_once_with()
+
+    def test_writes_during_a_build_reach_the_new_arrays(self):
+        index = SuggestIndex()
+        load = SuggestArrays.load
+
+        def load_then_write(arrays):
+            load(arrays)
+            index.add_tag(Tag(pk=self.article.pk + 1000, name='garlic'))
+            index.remove_article(self.article.pk)
+
+        with patch.object(SuggestArrays, 'load', load_then_write):
+            index.build()
+        self.assertEqual(index.suggest('gar'), {'articles': [], 'tags': ['garden', 'garlic']})
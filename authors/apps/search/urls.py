@@ -0,0 +1,9 @@
+from django.urls import path
+
+from authors.apps.search.views import SuggestAPIView
+
+app_name = 'search'
+
+urlpatterns = [
+    path('search/suggest', SuggestAPIView.as_view(), name='suggest'),
+]
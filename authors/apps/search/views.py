@@ -1,62 +1,171 @@
+from django.core.cache import cache
+from django.db.models import (Exists,
+                              OuterRef, )
 from django_filters import rest_framework as filters
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics
-from rest_framework.filters import SearchFilter
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import (AllowAny,
+                                        IsAuthenticated, )
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from authors.apps.articles.models import (Articles,
                                           Favorite, )
-from authors.apps.articles.serializers import ArticleSerializer
-from authors.apps.search.renderer import SearchJSONRenderer
+from authors.apps.profiles.models import Profile
+from authors.apps.search.backends import get_search_backend
+from authors.apps.search.cache import (SEARCH_CACHE_TIMEOUT,
+                                       hydrate,
+                                       search_key,
+                                       search_results, )
+from authors.apps.search.facets import article_facets
+from authors.apps.search.profiles import (closest_username,
+                                          search_profiles, )
+from authors.apps.search.renderer import (ProfileSearchJSONRenderer,
+                                          SearchJSONRenderer, )
+from authors.apps.search.serializers import (ArticleSearchSerializer,
+                                             ProfileSearchSerializer, )
+from authors.apps.search.suggest import suggestions
 
 
 class ArticleFilter(filters.FilterSet):
-    author = filters.CharFilter(field_name='author__username', lookup_expr='exact')
+    """
+    Filters of the article search, they all combine into one query.
+    Tags are matched on the tag names array of the articles and
+    favorites with an EXISTS subquery, so no join or DISTINCT is needed.
+    """
+    # typo tolerant, the articles of the author with the closest username
+    author = filters.CharFilter(method='filter_author')
     title = filters.CharFilter(field_name='title', lookup_expr='icontains')
+    # comma separated names, `tags_match=all` for the articles with all of them
+    tags = filters.CharFilter(method='filter_tags')
+    favorited = filters.CharFilter(method='filter_favorited')
+    created_after = filters.DateTimeFilter(field_name='created_at', lookup_expr='gte')
+    created_before = filters.DateTimeFilter(field_name='created_at', lookup_expr='lt')
+    min_rating = filters.NumberFilter(field_name='average_rating', lookup_expr='gte')
 
     class Meta:
         model = Articles
         fields = ['author', 'title', 'created_at']
 
+    @staticmethod
+    def filter_exists(queryset, name, subquery):
+        """Keep the articles for which `subquery` has a row"""
+        return queryset.annotate(**{name: Exists(subquery)}).filter(**{name: True})
+
+    def filter_author(self, queryset, name, value):
+        return queryset.filter(author__in=closest_username(value))
+
+    def filter_tags(self, queryset, name, value):
+        names = Articles.normalize_tag_names(value.split(','))
+        if not names:
+            return queryset
+        # array containment and overlap, served by the GIN index of `tag_names`
+        if self.data.get('tags_match') == 'all':
+            return queryset.filter(tag_names__contains=names)
+        return queryset.filter(tag_names__overlap=names)
+
+    def filter_favorited(self, queryset, name, value):
+        favorites = Favorite.objects.filter(article_id=OuterRef('pk'), user_id__username=value)
+        return self.filter_exists(queryset, 'is_favorited', favorites)
+
 
 class SearchArticleListAPIView(generics.ListAPIView):
     permission_classes = (AllowAny,)
-    serializer_class = ArticleSerializer
-    queryset = Articles.objects.all()
+    serializer_class = ArticleSearchSerializer
+    queryset = Articles.objects.for_listing()
     renderer_classes = (SearchJSONRenderer,)
 
-    filter_backends = (DjangoFilterBackend, SearchFilter)
+    filter_backends = (DjangoFilterBackend,)
     filterset_class = ArticleFilter
-    search_fields = ('author__username', 'title', 'created_at',)
+    # free text matched against the title, description and body
+    search_param = 'search'
 
     # @swagger_auto_schema(query_serializer=ArticleSerializer,
     #                      responses={
     #                          200: ArticleSerializer()})
+    def filter_queryset(self, queryset):
+        articles = super().filter_queryset(queryset)
+        query = self.request.query_params.get(self.search_param, '').strip()
+        if query:
+            # ranked best first, with highlighted snippets, after the other
+            # filters so a backend with its own index only ranks their articles
+            articles = get_search_backend().search(articles, query)
+        return articles
+
+    def list(self, request, *args, **kwargs):
+        key = search_key('results', request.query_params)
+        results = cache.get(key)
+        if results is None:
+            results = search_results(self.filter_queryset(self.get_queryset()))
+            cache.set(key, results, SEARCH_CACHE_TIMEOUT)
+
+        if results['entries'] is None:
+            # too many matches to be cached, paged from the database
+            response = super().list(request, *args, **kwargs)
+        else:
+            page = self.paginate_queryset(results['entries'])
+            response = self.get_paginated_response(hydrate(page, request))
+
+        if request.query_params.get('facets') in ('1', 'true'):
+            # counts of tags, authors, ratings and months over all the matches
+            articles = self.filter_queryset(self.get_queryset())
+            response.data['facets'] = article_facets(articles, request.query_params)
+        return response
+
+
+class SearchProfileListAPIView(generics.ListAPIView):
+    """
+    Typo tolerant search of users by username, first name and last name.
+
+    `?search=` ranks the users by the similarity of their names to the
+    query, `&mode=prefix` autocompletes the names starting with it.
+    """
+    permission_classes = (IsAuthenticated,)
+    serializer_class = ProfileSearchSerializer
+    queryset = Profile.objects.select_related('user')
+    renderer_classes = (ProfileSearchJSONRenderer,)
+    search_param = 'search'
+
     def get_queryset(self):
-        # Getting specific properties from the request body
-        favorited = self.request.query_params.get('favorited', '')  # returns username
-        tags = self.request.query_params.get('tags', '')  # returns tags
-
-        if favorited:
-            # Filtering through favourite model by username provided
-            # returns a list of all article id's
-            # The values_list method returns a ValuesListQuerySet.
-            # This means it has the advantages of the queryset to return only article ids.
-            article_ids = Favorite.objects.filter(user_id__username=favorited).values_list('article_id', flat=True)
-            # Then Returns all articles that are linked to
-            articles = Articles.objects.filter(id__in=article_ids)
-
-            return articles
-
-        if tags:
-            # Create a list of unique tags by splitting the returned string from where comma appears.
-            tag_list = tags.split(",")
-            # To find all of a model with a specific tags you can filter
-            article_by_tag = Articles.objects.filter(tags__name__in=tag_list)
-            # If you’re filtering on multiple tags, it’s very common to get duplicate results,
-            # because of the way relational databases work.
-            # That's why i used `distinct` to prevent it.
-            return article_by_tag.distinct()
-
-        # This returns the current queryset
-        return self.queryset
+        query = self.request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return self.queryset.none()
+        prefix = self.request.query_params.get('mode') == 'prefix'
+        return search_profiles(self.queryset, query, prefix=prefix)
+
+
+class SuggestAPIView(APIView):
+    """
+    Type-ahead of article titles and tag names, served from memory
+    """
+    permission_classes = (AllowAny,)
+    search_param = 'search'
+    default_limit = 10
+    max_limit = 20
+
+    def get(self, request):
+        """
+        Suggest the articles and tags starting with a prefix
+
+        Params
+        -------
+        request: Object with request data and functions,
+            `search` the typed prefix, `limit` the number of suggestions
+
+        Returns
+        --------
+        Response object:
+        {
+            "suggestions": {
+                "articles": [{"slug": "...", "title": "..."}],
+                "tags": ["..."]
+            }
+        }
+        """
+        query = request.query_params.get(self.search_param, '')
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        limit = min(max(limit, 1), self.max_limit)
+        return Response({'suggestions': suggestions.suggest(query, limit=limit)})
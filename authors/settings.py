@@ -12,8 +12,10 @@ https://docs.djangoproject.com/en/1.11/ref/settings/
 
 import os
 import sys
+import warnings
 
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -38,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'corsheaders',
     'django_extensions',
@@ -53,10 +56,11 @@ INSTALLED_APPS = [
     'authors.apps.core',
     'authors.apps.profiles',
     'authors.apps.articles.apps.ArticlesConfig',
-    'authors.apps.comments',
+    'authors.apps.comments.apps.CommentsConfig',
     'authors.apps.bookmarks.apps.BookmarksConfig',
     'authors.apps.highlights',
     'authors.apps.analytics',
+    'authors.apps.search.apps.SearchConfig',
 ]
 
 MIDDLEWARE = [
@@ -108,6 +112,43 @@ DATABASES = {
 }
 
 SOCIAL_AUTH_POSTGRES_JSONFIELD = True
+
+# Cache
+# https://docs.djangoproject.com/en/2.2/topics/cache/
+# The article payloads and versions and the search generation must be
+# shared by every worker, an edit in one worker would otherwise leave
+# the others serving the old article. Tests run on per process memory.
+
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+
+CACHE_LOCATION = os.environ.get('CACHE_LOCATION', os.environ.get('REDIS_URL'))
+
+if not TESTING and not CACHE_LOCATION:
+    if not DEBUG:
+        raise ImproperlyConfigured('Set REDIS_URL, or CACHE_LOCATION, to a cache shared by the workers')
+    warnings.warn('REDIS_URL is not set, the cache is not shared between workers')
+
+if TESTING or not CACHE_LOCATION:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'authors',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': os.environ.get('CACHE_BACKEND', 'django_redis.cache.RedisCache'),
+            'LOCATION': CACHE_LOCATION,
+        }
+    }
+
+# Search
+# Dotted path of the article search backend, the full-text search
+# of the database when empty, see authors.apps.search.backends
+
+SEARCH_BACKEND = os.environ.get('SEARCH_BACKEND')
+
 # Password validation
 # https://docs.djangoproject.com/en/1.11/ref/settings/#auth-password-validators
 
@@ -264,5 +305,3 @@ SWAGGER_SETTINGS = {
         }
     }
 }
-
-TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
@@ -48,4 +48,5 @@ urlpatterns = [
     path('api/', include('authors.apps.bookmarks.urls', namespace='bookmarks')),
     path('api/', include('authors.apps.highlights.urls', namespace='highlights')),
     path('api/', include('authors.apps.analytics.urls', namespace='analytics')),
+    path('api/', include('authors.apps.search.urls', namespace='search')),
 ]
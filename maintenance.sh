@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+# Full-table reconcile jobs, run from a scheduler (e.g the Heroku
+# Scheduler running `./maintenance.sh` daily) or by hand, not on release
+echo "Running Maintenance Tasks"
+
+echo "Reconciling denormalized article data"
+python manage.py sync_vote_counts
+python manage.py sync_rating_aggregates
+python manage.py sync_favorite_counts
+python manage.py refresh_tag_stats
+
+echo "Compacting the comment history"
+python manage.py compact_comment_history
+
+echo "Done.."
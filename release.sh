@@ -3,6 +3,15 @@ echo "Running Release Tasks"
 
 echo "Running Database migrations and migrating the new changes"
 python manage.py makemigrations authentication profiles articles comments bookmarks analytics highlights
+python manage.py dedupe_votes
 python manage.py migrate --noinput
 
-echo "Done.."
\ No newline at end of file
+echo "Filling in the denormalized data of rows stored before it was kept"
+python manage.py backfill_article_stats --missing
+python manage.py backfill_search_vectors --missing
+python manage.py backfill_tag_names --missing
+python manage.py refresh_tag_stats --missing
+python manage.py backfill_comment_paths
+python manage.py backfill_reply_counts --missing
+
+echo "Done.."